@@ -0,0 +1,33 @@
+# backend/analytics/management/commands/update_daily_stats.py
+"""
+Met à jour ProjectDailyStats avec les lignes arrivées depuis le dernier lot
+À lancer périodiquement (cron, toutes les quelques minutes)
+
+    python manage.py update_daily_stats
+    python manage.py update_daily_stats --rebuild
+"""
+
+from django.core.management.base import BaseCommand
+
+from analytics.rollups import rebuild_daily_stats, update_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Remplit les statistiques quotidiennes des projets (incrémental)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help="Lignes de notes / commentaires lues par transaction"
+        )
+        parser.add_argument(
+            '--rebuild', action='store_true',
+            help="Recalcule tout l'historique (vide la table et les filigranes)"
+        )
+
+    def handle(self, *args, **options):
+        job = rebuild_daily_stats if options['rebuild'] else update_daily_stats
+        processed = job(options['batch_size'])
+
+        details = ', '.join(f'{source} : {count}' for source, count in processed.items())
+        self.stdout.write(self.style.SUCCESS(f"Lignes traitées ({details})"))
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0002_project_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Watermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50, unique=True)),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('last_updated_at', models.DateTimeField(blank=True, null=True)),
+                ('processed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'analytics_watermark',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Jour')),
+                ('notes_created', models.PositiveIntegerField(default=0, verbose_name='Notes créées')),
+                ('comments_posted', models.PositiveIntegerField(default=0, verbose_name='Commentaires postés')),
+                ('tasks_completed', models.PositiveIntegerField(default=0, verbose_name='Tâches terminées')),
+                ('hours_logged', models.DecimalField(decimal_places=2, default=0, max_digits=9, verbose_name='Heures réalisées')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='projects.project', verbose_name='Projet')),
+            ],
+            options={
+                'verbose_name': 'Statistiques quotidiennes',
+                'verbose_name_plural': 'Statistiques quotidiennes',
+                'db_table': 'project_daily_stats',
+                'ordering': ['day'],
+                'unique_together': {('project', 'day')},
+            },
+        ),
+    ]
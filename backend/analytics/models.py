@@ -0,0 +1,59 @@
+# backend/analytics/models.py
+
+from django.db import models
+from projects.models import Project
+
+
+class ProjectDailyStats(models.Model):
+    """
+    Activité d'un projet sur une journée, pour les tableaux de bord historiques
+    Remplie par lots (commande update_daily_stats, voir analytics/rollups.py)
+    """
+    
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+        verbose_name='Projet'
+    )
+    day = models.DateField(verbose_name='Jour')
+    
+    # Notes et commentaires créés ce jour-là (événements : une suppression
+    # ultérieure ne les retire pas)
+    notes_created = models.PositiveIntegerField(default=0, verbose_name='Notes créées')
+    comments_posted = models.PositiveIntegerField(default=0, verbose_name='Commentaires postés')
+    
+    # Tâches terminées ce jour-là et leurs heures réelles (copiées des
+    # agrégats quotidiens des tâches, donc toujours à jour)
+    tasks_completed = models.PositiveIntegerField(default=0, verbose_name='Tâches terminées')
+    hours_logged = models.DecimalField(
+        max_digits=9, decimal_places=2, default=0, verbose_name='Heures réalisées'
+    )
+    
+    class Meta:
+        db_table = 'project_daily_stats'
+        verbose_name = 'Statistiques quotidiennes'
+        verbose_name_plural = 'Statistiques quotidiennes'
+        unique_together = ['project', 'day']
+        ordering = ['day']
+    
+    def __str__(self):
+        return f"{self.project_id} - {self.day}"
+
+
+class Watermark(models.Model):
+    """
+    Position du dernier lot traité pour une source (notes, commentaires...)
+    Le lot suivant ne lit que les lignes au-delà de cette position
+    """
+    
+    source = models.CharField(max_length=50, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    last_updated_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'analytics_watermark'
+    
+    def __str__(self):
+        return self.source
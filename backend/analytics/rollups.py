@@ -0,0 +1,127 @@
+# backend/analytics/rollups.py
+"""
+Remplissage incrémental de ProjectDailyStats
+
+Chaque source a un filigrane (Watermark) : un lot ne lit que les lignes
+ajoutées depuis le lot précédent, jamais les tables complètes.
+- notes, comments : lignes d'id > last_id, comptées par (projet, jour
+  de création) et AJOUTÉES aux compteurs ; l'incrément et le nouveau
+  filigrane sont écrits dans la même transaction (chaque ligne comptée
+  une seule fois, même si le job est interrompu)
+- tasks : lignes d'agrégats quotidiens des tâches (tasks/rollups.py)
+  recalculées depuis last_updated_at ; leurs valeurs sont RECOPIÉES,
+  une tâche rouverte ou supprimée est donc bien décomptée
+
+Les lignes plus récentes que ANALYTICS_SETTLE_SECONDS sont laissées au
+lot suivant : une transaction encore ouverte peut committer un id plus
+petit que le filigrane, qui serait sinon sauté.
+
+Un seul job à la fois (cron) : python manage.py update_daily_stats
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from comments.models import Comment
+from notes.models import Note
+from tasks.models import TaskDailyRollup
+
+from .models import ProjectDailyStats, Watermark
+
+
+# Sources d'événements : (queryset, chemin du projet, compteur de ProjectDailyStats)
+EVENT_SOURCES = {
+    'notes': (Note.objects.all(), 'project_id', 'notes_created'),
+    'comments': (Comment.objects.all(), 'note__project_id', 'comments_posted'),
+}
+
+
+def settled_before():
+    """Limite des lignes traitables (les plus récentes attendent le lot suivant)"""
+    return timezone.now() - datetime.timedelta(seconds=settings.ANALYTICS_SETTLE_SECONDS)
+
+
+def get_watermark(source):
+    """Filigrane verrouillé jusqu'à la fin de la transaction"""
+    Watermark.objects.get_or_create(source=source)
+    return Watermark.objects.select_for_update().get(source=source)
+
+
+def add_to_stats(field, counts):
+    """Ajoute {(projet, jour): n} au compteur `field`"""
+    for (project_id, day), count in counts.items():
+        updated = ProjectDailyStats.objects.filter(project_id=project_id, day=day).update(
+            **{field: F(field) + count}
+        )
+        if not updated:
+            ProjectDailyStats.objects.create(project_id=project_id, day=day, **{field: count})
+
+
+def process_events(source, batch_size):
+    """Compte les nouvelles lignes d'une source, par lots de batch_size ids"""
+    queryset, project_path, field = EVENT_SOURCES[source]
+    rows = queryset.filter(created_at__lt=settled_before()).order_by('id')
+    processed = 0
+    
+    while True:
+        with transaction.atomic():
+            watermark = get_watermark(source)
+            ids = list(rows.filter(id__gt=watermark.last_id).values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return processed
+            
+            counts = rows.filter(id__gt=watermark.last_id, id__lte=ids[-1]).values(
+                stats_project=F(project_path), day=TruncDate('created_at')
+            ).annotate(count=Count('pk')).order_by()
+            add_to_stats(field, {(row['stats_project'], row['day']): row['count'] for row in counts})
+            
+            watermark.last_id = ids[-1]
+            watermark.save()
+        processed += len(ids)
+
+
+def process_task_rollups():
+    """Recopie les agrégats de tâches recalculés depuis le dernier lot"""
+    with transaction.atomic():
+        watermark = get_watermark('tasks')
+        rollups = TaskDailyRollup.objects.filter(updated_at__lt=settled_before()).order_by('updated_at')
+        if watermark.last_updated_at:
+            # >= : les lignes de même horodatage sont recopiées à nouveau (sans effet)
+            rollups = rollups.filter(updated_at__gte=watermark.last_updated_at)
+        
+        processed = 0
+        for rollup in rollups.iterator():
+            ProjectDailyStats.objects.update_or_create(
+                project_id=rollup.project_id, day=rollup.day,
+                defaults={
+                    'tasks_completed': rollup.done_count,
+                    'hours_logged': rollup.done_actual_hours,
+                },
+            )
+            watermark.last_updated_at = rollup.updated_at
+            processed += 1
+        watermark.save()
+    return processed
+
+
+def update_daily_stats(batch_size=5000):
+    """
+    Traite tout ce qui est arrivé depuis le dernier lot
+    Retourne le nombre de lignes lues par source
+    """
+    processed = {source: process_events(source, batch_size) for source in EVENT_SOURCES}
+    processed['tasks'] = process_task_rollups()
+    return processed
+
+
+def rebuild_daily_stats(batch_size=5000):
+    """Vide la table et les filigranes, puis recalcule tout l'historique"""
+    with transaction.atomic():
+        ProjectDailyStats.objects.all().delete()
+        Watermark.objects.all().delete()
+    return update_daily_stats(batch_size)
@@ -0,0 +1,13 @@
+# backend/analytics/serializers.py
+
+from rest_framework import serializers
+
+from .models import ProjectDailyStats
+
+
+class ProjectDailyStatsSerializer(serializers.ModelSerializer):
+    """Une journée d'activité d'un projet"""
+    
+    class Meta:
+        model = ProjectDailyStats
+        fields = ['day', 'notes_created', 'comments_posted', 'tasks_completed', 'hours_logged']
@@ -0,0 +1,148 @@
+# backend/analytics/tests/test_daily_stats.py
+"""
+Tests du remplissage incrémental de ProjectDailyStats (analytics/rollups.py)
+et de GET /api/projects/{id}/activity/
+"""
+
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from analytics.models import ProjectDailyStats, Watermark
+from analytics.rollups import update_daily_stats
+from comments.models import Comment
+from notes.models import Note
+from projects.models import ProjectMember
+from tasks.models import Task
+
+
+@pytest.fixture(autouse=True)
+def no_settle_delay(settings):
+    """Lignes traitables dès leur création"""
+    settings.ANALYTICS_SETTLE_SECONDS = 0
+
+
+def stats_of(project):
+    """(notes, commentaires, tâches terminées, heures) du jour"""
+    row = ProjectDailyStats.objects.get(project=project, day=timezone.localdate())
+    return (row.notes_created, row.comments_posted, row.tasks_completed, row.hours_logged)
+
+
+@pytest.mark.django_db
+def test_batch_counts_notes_comments_and_tasks(sample_project, lead_user):
+    """
+    Test : Un lot compte notes, commentaires et tâches terminées du jour
+    """
+    # ARRANGE
+    note = Note.objects.create(title='N', content='x', project=sample_project, author=lead_user)
+    Comment.objects.create(content='c', note=note, author=lead_user)
+    Comment.objects.create(content='c2', note=note, author=lead_user)
+    Task.objects.create(
+        title='T', project=sample_project, created_by=lead_user, status='terminee',
+        actual_hours='1.50', completed_date=timezone.localdate()
+    )
+
+    # ACT
+    processed = update_daily_stats(batch_size=1)
+
+    # ASSERT
+    assert processed == {'notes': 1, 'comments': 2, 'tasks': 1}
+    assert stats_of(sample_project) == (1, 2, 1, Decimal('1.50'))
+    assert Watermark.objects.get(source='comments').last_id == Comment.objects.order_by('id').last().id
+
+
+@pytest.mark.django_db
+def test_batch_only_reads_rows_after_watermark(sample_project, lead_user):
+    """
+    Test : Le lot suivant ne recompte pas les lignes déjà traitées
+    """
+    # ARRANGE
+    Note.objects.create(title='A', content='x', project=sample_project, author=lead_user)
+    update_daily_stats()
+
+    # ACT
+    Note.objects.create(title='B', content='x', project=sample_project, author=lead_user)
+    processed = update_daily_stats()
+    again = update_daily_stats()
+
+    # ASSERT
+    assert processed['notes'] == 1
+    assert again == {'notes': 0, 'comments': 0, 'tasks': 0}
+    assert stats_of(sample_project)[0] == 2
+
+
+@pytest.mark.django_db
+def test_reopened_task_is_uncounted(sample_project, lead_user):
+    """
+    Test : Une tâche rouverte après le lot est décomptée au lot suivant
+    """
+    # ARRANGE
+    task = Task.objects.create(
+        title='T', project=sample_project, created_by=lead_user, status='terminee',
+        completed_date=timezone.localdate()
+    )
+    update_daily_stats()
+
+    # ACT
+    task.status = 'ouverte'
+    task.save()
+    update_daily_stats()
+
+    # ASSERT
+    assert stats_of(sample_project)[2] == 0
+
+
+@pytest.mark.django_db
+def test_settle_delay_postpones_recent_rows(sample_project, lead_user, settings):
+    """
+    Test : Les lignes plus récentes que ANALYTICS_SETTLE_SECONDS attendent
+    """
+    # ARRANGE
+    settings.ANALYTICS_SETTLE_SECONDS = 3600
+    Note.objects.create(title='N', content='x', project=sample_project, author=lead_user)
+
+    # ACT
+    processed = update_daily_stats()
+
+    # ASSERT
+    assert processed['notes'] == 0
+    assert not ProjectDailyStats.objects.exists()
+
+
+@pytest.mark.django_db
+def test_rebuild_recomputes_history(sample_project, lead_user):
+    """
+    Test : --rebuild repart de zéro (écarts corrigés)
+    """
+    # ARRANGE
+    Note.objects.create(title='N', content='x', project=sample_project, author=lead_user)
+    update_daily_stats()
+    ProjectDailyStats.objects.update(notes_created=9)
+
+    # ACT
+    call_command('update_daily_stats', '--rebuild', stdout=StringIO())
+
+    # ASSERT
+    assert stats_of(sample_project)[0] == 1
+
+
+@pytest.mark.django_db
+def test_activity_endpoint(authenticated_junior_client, sample_project, junior_user):
+    """
+    Test : GET /api/projects/{id}/activity/ lit les lignes de la période
+    """
+    # ARRANGE
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    Note.objects.create(title='N', content='x', project=sample_project, author=junior_user)
+    update_daily_stats()
+
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{sample_project.id}/activity/?days=7')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.data['totals']['notes_created'] == 1
+    assert [row['notes_created'] for row in response.data['series']] == [1]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Benchmark de sérialisation des listes : serializer classique vs values_list,
+puis rendu JSON : JSONRenderer (DRF) vs FastJSONRenderer (orjson)
+
+Pour TaskSerializer et NoteListSerializer, sur N lignes créées pour l'occasion
+(dans une transaction annulée à la fin) :
+- temps de sérialisation (requête SQL comprise) et de rendu JSON, médiane de R essais
+- temps du seul rendu JSON des données sérialisées
+- vérifie que les deux chemins produisent exactement le même JSON
+
+Usage (depuis backend/, base de données configurée par le .env) :
+    python benchmarks/bench_serializers.py
+    python benchmarks/bench_serializers.py --rows 10000 --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sharetech.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import transaction  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from notes.models import Note  # noqa: E402
+from notes.serializers import NoteListSerializer  # noqa: E402
+from notes.views import annotate_comment_stats  # noqa: E402
+from projects.models import Project  # noqa: E402
+from sharetech.renderers import FastJSONRenderer  # noqa: E402
+from tasks.models import Task  # noqa: E402
+from tasks.serializers import TaskSerializer  # noqa: E402
+
+
+def create_rows(rows):
+    """Projet de test avec `rows` tâches et `rows` notes"""
+    user = User.objects.create_user(username='bench-serializers', password='x')
+    project = Project.objects.create(name='Bench serializers', created_by=user)
+    Task.objects.bulk_create([
+        Task(
+            title=f'Tâche {i}', description='Description ' * 20, project=project,
+            created_by=user, assigned_to=user if i % 2 else None,
+            estimated_hours='1.50', priority='moyenne',
+        )
+        for i in range(rows)
+    ])
+    notes = [
+        Note(title=f'Note {i}', content='Contenu ' * 200, project=project, author=user)
+        for i in range(rows)
+    ]
+    for note in notes:
+        note.fill_excerpt()
+    Note.objects.bulk_create(notes)
+    return project
+
+
+def timed(func, repeat):
+    """(médiane en ms, dernier résultat)"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000, result
+
+
+def bench(name, serializer_class, make_queryset, repeat):
+    renderer = JSONRenderer()
+    # Liste d'instances → sérialisation classique ; queryset → values_list
+    classic_ms, classic = timed(
+        lambda: renderer.render(serializer_class(list(make_queryset()), many=True).data), repeat
+    )
+    fast_ms, fast = timed(
+        lambda: renderer.render(serializer_class(make_queryset(), many=True).data), repeat
+    )
+    same = 'oui' if classic == fast else 'NON'
+    print(f"{name:<12}{classic_ms:>12.1f}{fast_ms:>12.1f}{classic_ms / fast_ms:>9.1f}x{same:>10}")
+
+
+def bench_render(name, serializer_class, make_queryset, repeat):
+    data = serializer_class(make_queryset(), many=True).data
+    drf_ms, drf = timed(lambda: JSONRenderer().render(data), repeat)
+    fast_ms, fast = timed(lambda: FastJSONRenderer().render(data), repeat)
+    same = 'oui' if drf == fast else 'NON'
+    print(f"{name:<12}{drf_ms:>12.1f}{fast_ms:>12.1f}{drf_ms / fast_ms:>9.1f}x{same:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000, help="Tâches et notes créées")
+    parser.add_argument('--repeat', type=int, default=3, help="Essais par mesure (médiane)")
+    args = parser.parse_args()
+
+    print(f"{args.rows} lignes, médiane de {args.repeat} essais\n")
+    print(f"{'liste':<12}{'classique ms':>12}{'rapide ms':>12}{'gain':>10}{'identique':>10}")
+    with transaction.atomic():
+        project = create_rows(args.rows)
+        lists = [
+            ('tâches', TaskSerializer, lambda: Task.objects.filter(project=project).select_related(
+                'project', 'created_by', 'assigned_to'
+            )),
+            ('notes', NoteListSerializer, lambda: annotate_comment_stats(
+                Note.objects.filter(project=project).select_related('author', 'project').defer('content')
+            )),
+        ]
+        for name, serializer_class, make_queryset in lists:
+            bench(name, serializer_class, make_queryset, args.repeat)
+
+        print(f"\n{'rendu JSON':<12}{'DRF ms':>12}{'orjson ms':>12}{'gain':>10}{'identique':>10}")
+        for name, serializer_class, make_queryset in lists:
+            bench_render(name, serializer_class, make_queryset, args.repeat)
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Benchmark de démarrage et de débit : runserver vs Gunicorn + Uvicorn
+
+Pour chaque serveur :
+- temps entre le lancement et la première réponse de /api/health/db/
+- débit (requêtes/s) et latences p50 / p95 avec N clients concurrents
+
+Usage (depuis backend/, base de données configurée par le .env) :
+    python benchmarks/bench_server.py
+    python benchmarks/bench_server.py --path /api/tags/ --clients 32 --requests 2000
+    python benchmarks/bench_server.py --only gunicorn --workers 4
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    'runserver': lambda port, workers: [
+        sys.executable, 'manage.py', 'runserver', f'127.0.0.1:{port}', '--noreload',
+    ],
+    'gunicorn': lambda port, workers: [
+        sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+        '--bind', f'127.0.0.1:{port}', '--workers', str(workers),
+        '--access-logfile', '/dev/null', 'sharetech.asgi:application',
+    ],
+}
+
+
+def fetch(url):
+    """GET url → (status, latence en secondes)"""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as exc:
+        status = exc.code
+    except OSError:
+        status = None
+    return status, time.perf_counter() - start
+
+
+def wait_until_ready(url, timeout=60):
+    """Temps (s) jusqu'à la première réponse du serveur"""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        status, _ = fetch(url)
+        if status is not None:
+            return time.perf_counter() - start
+        time.sleep(0.05)
+    raise RuntimeError(f"Serveur injoignable après {timeout}s : {url}")
+
+
+def run_load(url, clients, total):
+    """Envoie `total` requêtes avec `clients` threads"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        results = list(executor.map(lambda _: fetch(url), range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for _, latency in results)
+    errors = sum(1 for status, _ in results if status is None or status >= 500)
+    return {
+        'rps': total / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'errors': errors,
+    }
+
+
+def bench(name, args):
+    command = SERVERS[name](args.port, args.workers)
+    process = subprocess.Popen(
+        command, cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f'http://127.0.0.1:{args.port}'
+    try:
+        startup = wait_until_ready(base_url + '/api/health/db/')
+        # Échauffement : connexions DB, caches
+        run_load(base_url + args.path, args.clients, args.clients * 2)
+        result = run_load(base_url + args.path, args.clients, args.requests)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    result['startup_s'] = startup
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default='/api/health/db/', help="Endpoint testé")
+    parser.add_argument('--clients', type=int, default=16, help="Clients concurrents")
+    parser.add_argument('--requests', type=int, default=1000, help="Nombre de requêtes")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() * 2 + 1, help="Workers Gunicorn")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--only', choices=sorted(SERVERS), help="Un seul serveur")
+    args = parser.parse_args()
+
+    names = [args.only] if args.only else list(SERVERS)
+    print(f"{args.requests} requêtes GET {args.path}, {args.clients} clients\n")
+    print(f"{'serveur':<12}{'démarrage':>12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'erreurs':>10}")
+    for name in names:
+        r = bench(name, args)
+        print(
+            f"{name:<12}{r['startup_s']:>11.2f}s{r['rps']:>10.0f}"
+            f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['errors']:>10}"
+        )
+
+
+if __name__ == '__main__':
+    main()
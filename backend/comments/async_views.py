@@ -0,0 +1,31 @@
+# backend/comments/async_views.py
+"""
+Vues async des commentaires (voir sharetech/async_api.py)
+"""
+
+from django.http import Http404
+
+from notes.views import visible_notes
+from sharetech.async_api import async_api_view, run_queries
+
+from .models import Comment
+from .serializers import serialize_comment_tree
+
+
+@async_api_view(throttle_scope='notes', throttle_cost=3)
+async def comment_tree(request, user, pk):
+    """
+    Arbre complet des commentaires d'une note
+    GET /api/async/notes/{id}/comments/
+
+    Même réponse que GET /api/notes/{id}/comments/, mais tous les
+    commentaires sont chargés en UNE requête (en parallèle du contrôle
+    d'accès à la note) puis l'arbre est construit en mémoire
+    """
+    can_read, comments = await run_queries(
+        lambda: visible_notes(user).filter(pk=pk).exists(),
+        lambda: list(Comment.objects.filter(note_id=pk).select_related('author__profile')),
+    )
+    if not can_read:
+        raise Http404
+    return serialize_comment_tree(comments)
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:01
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_comment_stats(apps, schema_editor):
+    """
+    Profondeur des commentaires existants (niveau par niveau),
+    puis compteurs dénormalisés des notes
+    """
+    Comment = apps.get_model('comments', 'Comment')
+    Note = apps.get_model('notes', 'Note')
+
+    depth = 0
+    while Comment.objects.filter(parent_comment__depth=depth).exclude(depth=depth + 1).update(depth=depth + 1):
+        depth += 1
+
+    stats = Comment.objects.values('note_id').annotate(
+        count=Count('id'), last=Max('created_at'), depth=Max('depth')
+    ).order_by()
+    for row in stats:
+        Note.objects.filter(pk=row['note_id']).update(
+            comment_count=row['count'],
+            last_comment_at=row['last'],
+            reply_depth=row['depth'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0002_remove_comment_like_count_alter_comment_author'),
+        ('notes', '0002_note_comment_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='Profondeur'),
+        ),
+        migrations.RunPython(backfill_comment_stats, migrations.RunPython.noop),
+    ]
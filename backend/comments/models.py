@@ -1,11 +1,18 @@
 # backend/projects/models.py
 
 from django.db import models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from notes.models import Note
+from sharetech.cache import bump_cache_version
+from sharetech.concurrency import VersionedModelMixin
+from sharetech.counters import shift
 
 
-class Comment(models.Model):
+class Comment(VersionedModelMixin, models.Model):
     """Commentaire sur une note"""
     
     content = models.TextField(verbose_name='Contenu')
@@ -40,6 +47,13 @@ class Comment(models.Model):
         verbose_name='Modifié'
     )
     
+    # 0 = commentaire racine, 1 = réponse, 2 = réponse à une réponse...
+    depth = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Profondeur'
+    )
+    
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name='Créé le'
@@ -50,13 +64,66 @@ class Comment(models.Model):
         verbose_name='Modifié le'
     )
     
+    # Concurrence optimiste : incrémentée à chaque save() (voir sharetech/concurrency.py)
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name='Version'
+    )
+    
     class Meta:
         db_table = 'comment'
         verbose_name = 'Commentaire'
         verbose_name_plural = 'Commentaires'
         ordering = ['created_at']
     
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.parent_comment_id:
+            self.depth = self.parent_comment.depth + 1
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         author_name = self.author.username if self.author else '[Compte supprimé]'
         preview = self.content[:50]
-        return f"{author_name} - {preview}"
\ No newline at end of file
+        return f"{author_name} - {preview}"
+
+
+# Signaux : compteurs dénormalisés de la note (un UPDATE, sans la recharger)
+# Les statistiques ne sont pas le contenu : version et updated_at de la note
+# ne bougent pas (pas de 412 pour qui la modifie pendant qu'on commente).
+# Les ETags des notes suivent la version de cache des commentaires
+# (etag_dependencies de NoteViewSet, voir sharetech/conditional.py)
+@receiver(post_save, sender=Comment)
+def add_comment_to_note_stats(sender, instance, created, **kwargs):
+    """Nouveau commentaire : compteur +1, date et profondeur max"""
+    if not created:
+        return
+    Note.objects.filter(pk=instance.note_id).update(
+        comment_count=shift('comment_count', 1),
+        last_comment_at=Greatest(
+            Coalesce('last_comment_at', Value(instance.created_at)), Value(instance.created_at)
+        ),
+        reply_depth=Greatest('reply_depth', Value(instance.depth)),
+    )
+
+
+@receiver(post_delete, sender=Comment)
+def remove_comment_from_note_stats(sender, instance, **kwargs):
+    """
+    Commentaire supprimé : compteur -1, date et profondeur max
+    recalculées par sous-requête dans le même UPDATE
+    """
+    remaining = Comment.objects.filter(note=OuterRef('pk'))
+    Note.objects.filter(pk=instance.note_id).update(
+        comment_count=shift('comment_count', -1),
+        last_comment_at=Subquery(remaining.order_by('-created_at').values('created_at')[:1]),
+        reply_depth=Coalesce(Subquery(remaining.order_by('-depth').values('depth')[:1]), Value(0)),
+    )
+
+
+# Signal : invalidation du cache de réponses (voir sharetech/cache.py)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_cache(sender, **kwargs):
+    """Incrémente la version de cache des commentaires"""
+    bump_cache_version(sender)
@@ -17,18 +17,38 @@ class CommentSerializer(serializers.ModelSerializer):
             'id', 'content', 
             'author', 'author_username',
             'parent_comment', 'is_edited',
-            'created_at', 'updated_at',
+            'version', 'created_at', 'updated_at',
             'replies'
         ]
         read_only_fields = ['id', 'author', 'is_edited', 'created_at', 'updated_at']
     
     def get_replies(self, obj):
         """Récupérer récursivement toutes les réponses"""
+        # Arbre déjà chargé (voir serialize_comment_tree) : pas de requête
+        replies_by_parent = self.context.get('replies_by_parent')
+        if replies_by_parent is not None:
+            return CommentSerializer(
+                replies_by_parent.get(obj.pk, []), many=True, context=self.context
+            ).data
         if obj.replies.exists():
             return CommentSerializer(obj.replies.all(), many=True, context=self.context).data
         return []
 
 
+def serialize_comment_tree(comments):
+    """
+    Sérialise les commentaires d'une note (chargés en une requête, triés
+    par date) en arbre : commentaires racines avec leurs réponses imbriquées
+    """
+    replies_by_parent = {}
+    for comment in comments:
+        replies_by_parent.setdefault(comment.parent_comment_id, []).append(comment)
+    return CommentSerializer(
+        replies_by_parent.get(None, []), many=True,
+        context={'replies_by_parent': replies_by_parent}
+    ).data
+
+
 class CommentWriteSerializer(serializers.ModelSerializer):
     """
     Serializer pour créer/modifier un commentaire
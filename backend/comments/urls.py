@@ -1,5 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+
+from . import async_views
 from .views import CommentViewSet
 
 router = DefaultRouter()
@@ -7,4 +9,6 @@ router.register(r'comments', CommentViewSet, basename='comment')
 
 urlpatterns = [
     path('', include(router.urls)),
+    # Version async (ASGI) d'une lecture lourde
+    path('async/notes/<int:pk>/comments/', async_views.comment_tree, name='comment-tree-async'),
 ]
\ No newline at end of file
@@ -3,19 +3,26 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from sharetech.concurrency import OptimisticConcurrencyMixin
+
 from .models import Comment
 from .serializers import CommentSerializer, CommentWriteSerializer
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(OptimisticConcurrencyMixin, viewsets.ModelViewSet):
     """
     ViewSet pour gérer les commentaires individuels
     Route principale : /api/comments/{id}/
     Pour les commentaires d'une note : /api/notes/{note_id}/comments/
+    Modification : If-Match: "<version>" ou If-Unmodified-Since, sinon 412 (voir sharetech/concurrency.py)
     """
     permission_classes = [IsAuthenticated]
     queryset = Comment.objects.all()
     
+    # Throttling : les réponses sont sérialisées récursivement
+    throttle_scope = 'comments'
+    throttle_costs = {'replies': 3}
+    
     def get_serializer_class(self):
         """Choisir le serializer selon l'action"""
         if self.action in ['update', 'partial_update']:
@@ -6,8 +6,27 @@ Ces fixtures sont accessibles dans TOUS les tests du projet
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from tags.models import Tag
+from tags.registry import tag_registry
+
+
+# ===== CACHE (throttling, etc.) =====
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Vide le cache avant chaque test
+    Évite que les compteurs de throttling d'un test débordent sur le suivant
+    Le registre des tags suit les versions du cache : il est vidé aussi
+    (les versions ne sont incrémentées qu'au commit, jamais atteint en test)
+    """
+    cache.clear()
+    tag_registry.reset()
+    yield
+    cache.clear()
+    tag_registry.reset()
 
 
 # ===== FIXTURES USERS (utilisées dans toutes les apps) =====
@@ -0,0 +1,71 @@
+# backend/gunicorn.conf.py
+"""
+Configuration Gunicorn pour la production (ASGI via workers Uvicorn)
+
+Lancement :
+    gunicorn -c gunicorn.conf.py sharetech.asgi:application
+
+Redémarrage gracieux (nouveau code, sans couper les requêtes en cours) :
+    kill -HUP <pid du master>
+Les anciens workers terminent leurs requêtes (graceful_timeout) pendant que
+les nouveaux démarrent.
+"""
+
+import multiprocessing
+import os
+
+
+def env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+# ===== ÉCOUTE =====
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+# File d'attente des connexions TCP non encore acceptées
+backlog = env_int('GUNICORN_BACKLOG', 2048)
+
+
+# ===== WORKERS ET THREADS =====
+
+# 2 process par coeur + 1 : le GIL limite chaque process à un coeur, le surplus
+# couvre les workers bloqués en attente d'E/S (vues synchrones, base de données)
+workers = env_int('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1)
+worker_class = 'uvicorn.workers.UvicornWorker'
+
+# Publié pour les settings : plusieurs workers exigent un cache partagé
+# (ImproperlyConfigured au démarrage sinon, voir CACHE_BACKEND dans settings.py)
+os.environ['WEB_CONCURRENCY'] = str(workers)
+
+# Threads par worker (connexions DB persistantes, DB_CONN_MAX_AGE) :
+# - le code synchrone des requêtes (ViewSets DRF) tourne dans ASGI_SYNC_THREADS
+#   threads réutilisés d'une requête à l'autre (voir sharetech/handlers.py)
+# - les vues async (/api/async/...) partagent ASYNC_QUERY_THREADS threads SQL
+# Chaque thread garde sa connexion : le total doit rester <= DB_MAX_CONNECTIONS
+
+# Recyclage des workers : limite l'effet d'une fuite mémoire
+# (jitter pour éviter que tous les workers redémarrent en même temps)
+max_requests = env_int('GUNICORN_MAX_REQUESTS', 2000)
+max_requests_jitter = env_int('GUNICORN_MAX_REQUESTS_JITTER', 200)
+
+
+# ===== TIMEOUTS =====
+
+# Worker silencieux plus de `timeout` secondes → tué et remplacé
+timeout = env_int('GUNICORN_TIMEOUT', 30)
+# Temps laissé aux requêtes en cours lors d'un redémarrage / arrêt
+graceful_timeout = env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+# Keep-alive HTTP : doit dépasser le timeout d'inactivité du proxy en amont
+# pour que ce soit le proxy qui ferme (évite les 502 sur connexion réutilisée)
+keepalive = env_int('GUNICORN_KEEPALIVE', 75)
+
+
+# ===== DIVERS =====
+
+# Rechargement automatique du code (développement uniquement)
+reload = os.environ.get('GUNICORN_RELOAD', 'false').lower() == 'true'
+accesslog = os.environ.get('GUNICORN_ACCESSLOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOGLEVEL', 'info')
+# En-têtes X-Forwarded-* du proxy de confiance
+forwarded_allow_ips = os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1')
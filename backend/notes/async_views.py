@@ -0,0 +1,32 @@
+# backend/notes/async_views.py
+"""
+Vues async des notes (voir sharetech/async_api.py)
+"""
+
+from django.http import JsonResponse
+
+from sharetech.async_api import async_api_view, run_query
+
+from .serializers import NoteListSerializer
+from .views import annotate_comment_stats, visible_notes
+
+
+@async_api_view(throttle_scope='notes', throttle_cost=2)
+async def notes_by_project(request, user):
+    """
+    Notes d'un projet
+    GET /api/async/notes/?project={id}
+
+    Même réponse que GET /api/notes/by_project/?project={id}
+    """
+    project_id = request.GET.get('project')
+    if not project_id or not project_id.isdigit():
+        return JsonResponse({'error': 'Paramètre project requis'}, status=400)
+
+    notes = await run_query(
+        lambda: list(annotate_comment_stats(
+            visible_notes(user).filter(project_id=project_id)
+            .select_related('author', 'project').defer('content')
+        ))
+    )
+    return NoteListSerializer(notes, many=True).data
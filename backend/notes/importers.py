@@ -0,0 +1,220 @@
+# backend/notes/importers.py
+"""
+Import / export de notes en masse
+
+Formats d'import :
+- NDJSON : un objet JSON par ligne
+      {"title": "...", "content": "...", "status": "publie", "tags": ["python"]}
+- zip de fichiers Markdown (.md) : un fichier = une note ; titre, statut et
+  tags dans un en-tête optionnel, sinon titre = premier « # Titre » ou nom du fichier
+      ---
+      title: Déployer l'API
+      tags: django, docker
+      status: publie
+      ---
+
+Mémoire constante : les lignes / fichiers sont lus un à un et traités par
+lots de chunk_size (validation, tags résolus par nom dans le registre en
+mémoire, bulk_create des notes puis des NoteTag, une transaction par lot).
+Seules les 100 premières erreurs sont conservées.
+
+bulk_create n'envoie pas de signaux : compteur de notes du projet et
+versions de cache sont mis à jour à chaque lot.
+"""
+
+import json
+import os
+import zipfile
+from itertools import islice
+
+from django.db import transaction
+from rest_framework import serializers
+
+from projects.counters import update_counters
+from sharetech.cache import bump_cache_version
+from tags.registry import tag_registry
+
+from .models import Note, NoteTag
+
+
+MAX_REPORTED_ERRORS = 100
+
+
+class NoteImportSerializer(serializers.Serializer):
+    """Une note à importer (tags par nom)"""
+    title = serializers.CharField(max_length=200)
+    content = serializers.CharField()
+    status = serializers.ChoiceField(choices=Note.STATUS_CHOICES, default='brouillon')
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=50), required=False, default=list, max_length=10
+    )
+    
+    def validate_tags(self, value):
+        unknown = [name for name in value if tag_registry.get_by_name(name) is None]
+        if unknown:
+            raise serializers.ValidationError(f"Tags inconnus : {', '.join(unknown)}")
+        return [tag_registry.get_by_name(name) for name in dict.fromkeys(value)]
+
+
+# ===== LECTURE DES FORMATS =====
+
+def iter_ndjson(stream):
+    """(position, objet) pour chaque ligne non vide d'un flux binaire NDJSON"""
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield f'ligne {number}', json.loads(line)
+        except ValueError as exc:  # JSON ou UTF-8 invalide
+            yield f'ligne {number}', {'__error__': f"JSON invalide : {exc}"}
+
+
+def parse_markdown(name, text):
+    """Note d'un fichier Markdown (en-tête optionnel entre deux lignes ---)"""
+    record = {}
+    lines = text.splitlines()
+    
+    if lines and lines[0].strip() == '---' and '---' in (line.strip() for line in lines[1:]):
+        end = next(i for i, line in enumerate(lines[1:], start=1) if line.strip() == '---')
+        for line in lines[1:end]:
+            key, _, value = line.partition(':')
+            record[key.strip().lower()] = value.strip()
+        lines = lines[end + 1:]
+    
+    if 'tags' in record:
+        record['tags'] = [tag.strip() for tag in record['tags'].split(',') if tag.strip()]
+    if 'title' not in record:
+        heading = next((line for line in lines if line.strip()), '')
+        if heading.startswith('# '):
+            record['title'] = heading[2:].strip()
+        else:
+            record['title'] = os.path.splitext(os.path.basename(name))[0]
+    record['content'] = '\n'.join(lines).strip()
+    return record
+
+
+def iter_markdown_zip(file):
+    """(nom du fichier, note) pour chaque fichier .md d'une archive zip"""
+    with zipfile.ZipFile(file) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith('.md'):
+                continue
+            with archive.open(info) as member:
+                try:
+                    text = member.read().decode('utf-8')
+                except UnicodeDecodeError:
+                    yield info.filename, {'__error__': "Fichier non UTF-8"}
+                    continue
+            yield info.filename, parse_markdown(info.filename, text)
+
+
+def iter_records(file):
+    """Détecte le format (zip ou NDJSON) et itère sur les notes du fichier"""
+    if zipfile.is_zipfile(file):
+        file.seek(0)
+        return iter_markdown_zip(file)
+    file.seek(0)
+    return iter_ndjson(file)
+
+
+# ===== IMPORT =====
+
+class NoteImporter:
+    """
+    Importe des notes dans un projet, par lots
+    
+        importer = NoteImporter(project, author, chunk_size=500)
+        for progress in importer.run(iter_records(file)):
+            print(progress)   # après chaque lot
+    """
+    
+    def __init__(self, project, author, chunk_size=500):
+        self.project = project
+        self.author = author
+        self.chunk_size = chunk_size
+        self.processed = 0
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+    
+    def report(self):
+        return {
+            'processed': self.processed,
+            'created': self.created,
+            'failed': self.failed,
+            'errors': list(self.errors),
+        }
+    
+    def run(self, records):
+        """Générateur : traite les lots un à un et rend l'avancement après chacun"""
+        records = iter(records)
+        while chunk := list(islice(records, self.chunk_size)):
+            self.import_chunk(chunk)
+            yield self.report()
+    
+    def add_error(self, position, error):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'position': position, 'error': error})
+    
+    def import_chunk(self, chunk):
+        notes, tags = [], []
+        for position, record in chunk:
+            self.processed += 1
+            if not isinstance(record, dict):
+                self.add_error(position, "Objet JSON attendu")
+                continue
+            if '__error__' in record:
+                self.add_error(position, record['__error__'])
+                continue
+            
+            serializer = NoteImportSerializer(data=record)
+            if not serializer.is_valid():
+                self.add_error(position, serializer.errors)
+                continue
+            data = serializer.validated_data
+            note = Note(
+                title=data['title'], content=data['content'], status=data['status'],
+                project=self.project, author=self.author,
+            )
+            note.fill_excerpt()  # bulk_create n'appelle pas save()
+            notes.append(note)
+            tags.append(data['tags'])
+        
+        if not notes:
+            return
+        with transaction.atomic():
+            # Les clés primaires sont renseignées par bulk_create (RETURNING)
+            Note.objects.bulk_create(notes)
+            NoteTag.objects.bulk_create([
+                NoteTag(note=note, tag=tag)
+                for note, note_tags in zip(notes, tags)
+                for tag in note_tags
+            ])
+            update_counters(self.project.pk, note_count=len(notes))
+        
+        bump_cache_version(Note)
+        bump_cache_version(NoteTag)
+        self.created += len(notes)
+
+
+# ===== EXPORT =====
+
+def export_record(note):
+    """Représentation NDJSON d'une note (format d'import)"""
+    return {
+        'title': note.title,
+        'content': note.content,
+        'status': note.status,
+        'tags': sorted(
+            tag.name for tag in (tag_registry.get(nt.tag_id) for nt in note.note_tags.all()) if tag
+        ),
+    }
+
+
+def iter_export_lines(queryset, chunk_size=500):
+    """Lignes NDJSON (bytes) des notes du queryset, lues par lots"""
+    notes = queryset.order_by('pk').prefetch_related('note_tags')
+    for note in notes.iterator(chunk_size=chunk_size):
+        yield json.dumps(export_record(note), ensure_ascii=False).encode() + b'\n'
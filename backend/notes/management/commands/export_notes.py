@@ -0,0 +1,35 @@
+# backend/notes/management/commands/export_notes.py
+"""
+Exporte les notes d'un projet en NDJSON (format relu par import_notes)
+
+    python manage.py export_notes --project 3 > notes.ndjson
+    python manage.py export_notes --project 3 --output notes.ndjson
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand
+
+from notes.importers import iter_export_lines
+from notes.models import Note
+
+
+class Command(BaseCommand):
+    help = "Exporte les notes d'un projet au format NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, required=True, help="Id du projet")
+        parser.add_argument('--output', help="Fichier de sortie (sortie standard par défaut)")
+
+    def handle(self, *args, **options):
+        notes = Note.objects.filter(project_id=options['project'])
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        try:
+            count = 0
+            for line in iter_export_lines(notes):
+                output.write(line)
+                count += 1
+        finally:
+            if options['output']:
+                output.close()
+        self.stderr.write(self.style.SUCCESS(f"{count} note(s) exportée(s)"))
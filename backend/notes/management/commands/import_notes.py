@@ -0,0 +1,48 @@
+# backend/notes/management/commands/import_notes.py
+"""
+Importe des notes en masse dans un projet (NDJSON ou zip de Markdown)
+
+    python manage.py import_notes docs.zip --project 3 --author alice
+    python manage.py import_notes notes.ndjson --project 3 --author alice --chunk-size 1000
+"""
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from notes.importers import NoteImporter, iter_records
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Importe des notes depuis un fichier NDJSON ou un zip de fichiers Markdown"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Fichier .ndjson ou .zip")
+        parser.add_argument('--project', type=int, required=True, help="Id du projet")
+        parser.add_argument('--author', required=True, help="Nom d'utilisateur de l'auteur")
+        parser.add_argument(
+            '--chunk-size', type=int, default=settings.NOTE_IMPORT_CHUNK_SIZE,
+            help="Notes validées et insérées par transaction"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.get(pk=options['project'])
+            author = User.objects.get(username=options['author'])
+        except (Project.DoesNotExist, User.DoesNotExist) as exc:
+            raise CommandError(str(exc))
+
+        importer = NoteImporter(project, author, chunk_size=options['chunk_size'])
+        with open(options['path'], 'rb') as file:
+            for progress in importer.run(iter_records(file)):
+                self.stdout.write(
+                    f"{progress['processed']} lue(s), {progress['created']} créée(s), "
+                    f"{progress['failed']} en erreur"
+                )
+
+        for error in importer.errors:
+            self.stderr.write(f"{error['position']} : {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{importer.created} note(s) importée(s) dans « {project.name} »"
+        ))
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Nombre de commentaires'),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='last_comment_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Dernier commentaire'),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='reply_depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='Profondeur max des réponses'),
+        ),
+    ]
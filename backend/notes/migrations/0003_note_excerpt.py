@@ -0,0 +1,50 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:18
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+# Copie figée de notes.models.make_excerpt au moment de cette migration :
+# une évolution (ou la suppression) du helper ne doit pas changer ce qu'elle fait
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(content):
+    return Truncator(' '.join(content.split())).chars(EXCERPT_LENGTH)
+
+
+def backfill_excerpts(apps, schema_editor):
+    """Extrait et longueur des notes existantes, par lots de 500"""
+    Note = apps.get_model('notes', 'Note')
+
+    last_id = 0
+    while True:
+        notes = list(Note.objects.filter(pk__gt=last_id).order_by('pk').only('pk', 'content')[:500])
+        if not notes:
+            break
+        for note in notes:
+            note.excerpt = make_excerpt(note.content)
+            note.content_length = len(note.content)
+        Note.objects.bulk_update(notes, ['excerpt', 'content_length'])
+        last_id = notes[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0002_note_comment_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='content_length',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Longueur du contenu'),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=200, verbose_name='Extrait'),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0003_note_excerpt'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NoteRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField(verbose_name='Numéro')),
+                ('title', models.CharField(max_length=200, verbose_name='Titre')),
+                ('is_snapshot', models.BooleanField(default=False, verbose_name='Contenu complet')),
+                ('data', models.BinaryField(verbose_name='Contenu ou delta compressé')),
+                ('content_length', models.PositiveIntegerField(default=0, verbose_name='Longueur du contenu')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date de la révision')),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='note_revisions', to=settings.AUTH_USER_MODEL, verbose_name='Auteur')),
+                ('note', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='notes.note', verbose_name='Note')),
+            ],
+            options={
+                'verbose_name': 'Révision de note',
+                'verbose_name_plural': 'Révisions de notes',
+                'db_table': 'note_revision',
+                'ordering': ['-number'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='noterevision',
+            constraint=models.UniqueConstraint(fields=('note', 'number'), name='unique_note_revision_number'),
+        ),
+    ]
@@ -1,12 +1,27 @@
 # backend/notes/models.py
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.utils.text import Truncator
+from projects.counters import update_counters
 from projects.models import Project
 from tags.models import Tag
+from sharetech.cache import bump_cache_version
+from sharetech.concurrency import VersionedModelMixin
+from sharetech.counters import CounterFieldsMixin
 
 
-class Note(models.Model):
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(content):
+    """Début du contenu sur une ligne, coupé à EXCERPT_LENGTH caractères (… compris)"""
+    return Truncator(' '.join(content.split())).chars(EXCERPT_LENGTH)
+
+
+class Note(VersionedModelMixin, CounterFieldsMixin, models.Model):
     """
     Modèle Note pour ShareTech
     Gestion de la documentation et du partage de connaissances
@@ -27,6 +42,20 @@ class Note(models.Model):
         verbose_name='Contenu'
     )
     
+    # Aperçu pour les listes (qui ne chargent pas content), recalculé à chaque save()
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+        verbose_name='Extrait'
+    )
+    
+    content_length = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Longueur du contenu'
+    )
+    
     status = models.CharField(
         max_length=10,
         choices=STATUS_CHOICES,
@@ -64,6 +93,36 @@ class Note(models.Model):
         verbose_name='Date de publication'
     )
     
+    # Concurrence optimiste : incrémentée à chaque save() (voir sharetech/concurrency.py)
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name='Version'
+    )
+    
+    # Compteurs dénormalisés, tenus à jour par les signaux de Comment
+    # (voir comments/models.py) : lus sans agrégat sur les projets très actifs
+    counter_fields = ('comment_count', 'last_comment_at', 'reply_depth')
+    
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Nombre de commentaires'
+    )
+    
+    last_comment_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name='Dernier commentaire'
+    )
+    
+    reply_depth = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Profondeur max des réponses'
+    )
+    
     class Meta:
         db_table = 'note'
         verbose_name = 'Note'
@@ -78,6 +137,20 @@ class Note(models.Model):
     
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
+    
+    def save(self, *args, **kwargs):
+        # content différé (note chargée par une liste) : extrait inchangé
+        if 'content' not in self.get_deferred_fields():
+            self.fill_excerpt()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'content' in update_fields:
+                kwargs['update_fields'] = {*update_fields, 'excerpt', 'content_length'}
+        super().save(*args, **kwargs)
+    
+    def fill_excerpt(self):
+        """Extrait et longueur d'après content (à appeler avant un bulk_create)"""
+        self.excerpt = make_excerpt(self.content)
+        self.content_length = len(self.content)
 
 
 class NoteTag(models.Model):
@@ -121,4 +194,92 @@ class NoteTag(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.note.title} - {self.tag.name}"
\ No newline at end of file
+        return f"{self.note.title} - {self.tag.name}"
+
+
+class NoteRevision(models.Model):
+    """
+    Modèle NoteRevision pour ShareTech
+    Version d'une note : contenu complet (snapshot) ou delta depuis la
+    révision précédente, compressé (voir notes/revisions.py)
+    """
+    
+    note = models.ForeignKey(
+        Note,
+        on_delete=models.CASCADE,
+        related_name='revisions',
+        verbose_name='Note'
+    )
+    
+    number = models.PositiveIntegerField(
+        verbose_name='Numéro'
+    )
+    
+    author = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='note_revisions',
+        verbose_name='Auteur'
+    )
+    
+    title = models.CharField(
+        max_length=200,
+        verbose_name='Titre'
+    )
+    
+    is_snapshot = models.BooleanField(
+        default=False,
+        verbose_name='Contenu complet'
+    )
+    
+    data = models.BinaryField(
+        verbose_name='Contenu ou delta compressé'
+    )
+    
+    content_length = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Longueur du contenu'
+    )
+    
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Date de la révision'
+    )
+    
+    class Meta:
+        db_table = 'note_revision'
+        verbose_name = 'Révision de note'
+        verbose_name_plural = 'Révisions de notes'
+        ordering = ['-number']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['note', 'number'],
+                name='unique_note_revision_number'
+            )
+        ]
+    
+    def __str__(self):
+        return f"{self.title} (révision {self.number})"
+
+
+# Signaux : compteur de notes et dernière activité du projet (voir projects/counters.py)
+@receiver(post_save, sender=Note)
+def count_saved_note(sender, instance, created, **kwargs):
+    update_counters(instance.project_id, note_count=1 if created else 0)
+
+
+@receiver(post_delete, sender=Note)
+def count_deleted_note(sender, instance, **kwargs):
+    update_counters(instance.project_id, note_count=-1)
+
+
+# Signal : invalidation du cache de réponses (voir sharetech/cache.py)
+@receiver(post_save, sender=Note)
+@receiver(post_delete, sender=Note)
+@receiver(post_save, sender=NoteTag)
+@receiver(post_delete, sender=NoteTag)
+def invalidate_note_cache(sender, **kwargs):
+    """Incrémente la version de cache du modèle modifié"""
+    bump_cache_version(sender)
@@ -0,0 +1,120 @@
+# backend/notes/revisions.py
+"""
+Historique des notes (NoteRevision) stocké en deltas
+
+Chaque version enregistrée d'une note est une révision numérotée 1, 2, 3...
+Stocker le contenu complet à chaque fois multiplierait la taille des grosses
+notes par leur nombre de modifications : une révision ne garde que le delta
+(lignes ajoutées / supprimées) depuis la précédente, compressé par zlib.
+Toutes les NOTE_REVISION_SNAPSHOT_INTERVAL révisions (et quand le delta
+n'est pas plus petit), le contenu complet est stocké (snapshot).
+
+Reconstruire la révision n : le dernier snapshot <= n, puis les deltas
+suivants jusqu'à n, lus en une requête (au plus INTERVAL - 1 deltas).
+
+Format d'un delta (JSON compressé), appliqué aux lignes de la version précédente :
+    [["=", 3], ["-", 1], ["+", ["ligne ajoutée\\n"]], ...]
+    "=" garde n lignes, "-" en saute n, "+" insère des lignes
+"""
+
+import difflib
+import json
+import zlib
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Subquery
+
+from .models import Note, NoteRevision
+
+
+def compress(value):
+    return zlib.compress(json.dumps(value, ensure_ascii=False).encode(), 6)
+
+
+def decompress(data):
+    return json.loads(zlib.decompress(data))
+
+
+def make_delta(old, new):
+    """Opérations qui transforment le texte old en new (par lignes)"""
+    old_lines, new_lines = old.splitlines(keepends=True), new.splitlines(keepends=True)
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(['=', i2 - i1])
+            continue
+        if tag in ('delete', 'replace'):
+            ops.append(['-', i2 - i1])
+        if tag in ('insert', 'replace'):
+            ops.append(['+', new_lines[j1:j2]])
+    return ops
+
+
+def apply_delta(old, ops):
+    """Texte obtenu en appliquant les opérations de make_delta à old"""
+    old_lines = old.splitlines(keepends=True)
+    lines, position = [], 0
+    for op, value in ops:
+        if op == '=':
+            lines.extend(old_lines[position:position + value])
+            position += value
+        elif op == '-':
+            position += value
+        else:
+            lines.extend(value)
+    return ''.join(lines)
+
+
+def record_revision(note, author=None, previous=None):
+    """
+    Enregistre la version courante de note comme nouvelle révision
+
+    previous : (titre, contenu) avant la modification ; pour une note sans
+    historique (créée avant les révisions, importée), il devient la révision 1.
+    Sinon c'est le contenu de la dernière révision (save() refuse une version
+    périmée) : le delta est calculé depuis lui, sans reconstruire la révision
+    """
+    with transaction.atomic():
+        # Verrou sur la note : deux modifications simultanées ne prennent pas le même numéro
+        Note.objects.select_for_update().filter(pk=note.pk).exists()
+        last = note.revisions.order_by('-number').only('number', 'is_snapshot').first()
+
+        if last is None and previous is not None:
+            title, content = previous
+            last = NoteRevision.objects.create(
+                note=note, number=1, title=title, is_snapshot=True,
+                data=compress(content), content_length=len(content),
+            )
+
+        number = last.number + 1 if last else 1
+        is_snapshot = (number - 1) % settings.NOTE_REVISION_SNAPSHOT_INTERVAL == 0
+        data = compress(note.content)
+        if not is_snapshot:
+            base = previous[1] if previous is not None else revision_content(last)
+            delta = compress(make_delta(base, note.content))
+            if len(delta) < len(data):
+                data = delta
+            else:
+                is_snapshot = True
+
+        return NoteRevision.objects.create(
+            note=note, number=number, author=author, title=note.title,
+            is_snapshot=is_snapshot, data=data, content_length=len(note.content),
+        )
+
+
+def revision_content(revision):
+    """Contenu de la révision : dernier snapshot, puis les deltas jusqu'à elle"""
+    snapshot = NoteRevision.objects.filter(
+        note_id=revision.note_id, number__lte=revision.number, is_snapshot=True
+    ).order_by('-number').values('number')[:1]
+    chain = NoteRevision.objects.filter(
+        note_id=revision.note_id, number__lte=revision.number, number__gte=Subquery(snapshot)
+    ).order_by('number').values_list('is_snapshot', 'data')
+
+    content = ''
+    for is_snapshot, data in chain:
+        content = decompress(data) if is_snapshot else apply_delta(content, decompress(data))
+    return content
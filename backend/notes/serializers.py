@@ -1,15 +1,49 @@
 from rest_framework import serializers
-from .models import Note, NoteTag
-from tags.models import Tag
+from django.db import transaction
+from .models import Note, NoteRevision, NoteTag
+from .revisions import record_revision
+from sharetech.fastpath import FastListSerializer
+from sharetech.fieldsets import SparseFieldsetSerializerMixin
+from tags.serializers import TagPrimaryKeyRelatedField
 
 
-class NoteSerializer(serializers.ModelSerializer):
+class CommentStatMixin:
+    """
+    Statistique de commentaires d'une note : annotation live_<champ> du
+    queryset si présente (voir annotate_comment_stats), sinon la colonne
+    dénormalisée du modèle
+    """
+    def get_attribute(self, instance):
+        annotated = f'live_{self.source}'
+        if hasattr(instance, annotated):
+            return getattr(instance, annotated)
+        return super().get_attribute(instance)
+    
+    def get_values_path(self, queryset):
+        """Même choix pour la sérialisation par values_list (voir sharetech/fastpath.py)"""
+        annotated = f'live_{self.source}'
+        if annotated in queryset.query.annotations:
+            return annotated
+        return self.source
+
+
+class CommentStatIntegerField(CommentStatMixin, serializers.IntegerField):
+    pass
+
+
+class CommentStatDateTimeField(CommentStatMixin, serializers.DateTimeField):
+    pass
+
+
+class NoteSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer pour lecture (liste/détail)"""
     author_username = serializers.CharField(source='author.username', read_only=True)
     project_name = serializers.CharField(source='project.name', read_only=True)
-    tags = serializers.PrimaryKeyRelatedField(
+    comment_count = CommentStatIntegerField(read_only=True)
+    last_comment_at = CommentStatDateTimeField(read_only=True)
+    reply_depth = CommentStatIntegerField(read_only=True)
+    tags = TagPrimaryKeyRelatedField(
         many=True,
-        queryset=Tag.objects.all(),
         required=False
     )
     
@@ -17,9 +51,16 @@ class NoteSerializer(serializers.ModelSerializer):
         model = Note
         fields = [
             'id', 'title', 'content', 'status', 'project', 'project_name',
-            'author', 'author_username', 'tags', 'created_at', 'updated_at'
+            'author', 'author_username', 'tags',
+            'comment_count', 'last_comment_at', 'reply_depth',
+            'version', 'created_at', 'updated_at'
         ]
         read_only_fields = ['author', 'project', 'created_at', 'updated_at']
+        # ?expand= (voir sharetech/fieldsets.py)
+        expandable_fields = {
+            'project': ('projects.serializers.ProjectListSerializer', ['project__created_by']),
+            'author': ('accounts.serializers.UserSerializer', ['author__profile']),
+        }
     
     def validate_tags(self, value):
         if len(value) > 10:
@@ -27,11 +68,27 @@ class NoteSerializer(serializers.ModelSerializer):
         return value
 
 
+class NoteListSerializer(NoteSerializer):
+    """
+    Serializer des listes : extrait et longueur stockés au lieu de content
+    (le queryset ne charge pas la colonne content), sérialisées par
+    values_list (voir sharetech/fastpath.py)
+    """
+    
+    class Meta(NoteSerializer.Meta):
+        fields = [
+            'id', 'title', 'excerpt', 'content_length', 'status', 'project', 'project_name',
+            'author', 'author_username', 'tags',
+            'comment_count', 'last_comment_at', 'reply_depth',
+            'version', 'created_at', 'updated_at'
+        ]
+        list_serializer_class = FastListSerializer
+
+
 class NoteCreateSerializer(serializers.ModelSerializer):
     """Serializer pour création (project en écriture)"""
-    tags = serializers.PrimaryKeyRelatedField(
+    tags = TagPrimaryKeyRelatedField(
         many=True,
-        queryset=Tag.objects.all(),
         required=False
     )
     
@@ -40,20 +97,20 @@ class NoteCreateSerializer(serializers.ModelSerializer):
         fields = ['title', 'content', 'status', 'project', 'tags']
    
     def create(self, validated_data):
-        print("🔍 DEBUG - validated_data:", validated_data)  
         tags_data = validated_data.pop('tags', [])
-        validated_data['title'] = validated_data['title']
-        note = Note.objects.create(**validated_data)
-        for tag in tags_data:
-            NoteTag.objects.create(note=note, tag=tag)
+        # Note et révision 1 ensemble, ou rien
+        with transaction.atomic():
+            note = Note.objects.create(**validated_data)
+            for tag in tags_data:
+                NoteTag.objects.create(note=note, tag=tag)
+            record_revision(note, author=note.author)
         return note
 
 
 class NoteUpdateSerializer(serializers.ModelSerializer):
     """Serializer pour modification (project en read_only)"""
-    tags = serializers.PrimaryKeyRelatedField(
+    tags = TagPrimaryKeyRelatedField(
         many=True,
-        queryset=Tag.objects.all(),
         required=False
     )
     
@@ -64,11 +121,37 @@ class NoteUpdateSerializer(serializers.ModelSerializer):
     
     def update(self, instance, validated_data):
         tags_data = validated_data.pop('tags', None)
+        previous = (instance.title, instance.content)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
-        if tags_data is not None:
-            instance.note_tags.all().delete()
-            for tag in tags_data:
-                NoteTag.objects.create(note=instance, tag=tag)
-        return instance
\ No newline at end of file
+        # Modification et révision ensemble : pas de version absente de l'historique
+        with transaction.atomic():
+            instance.save()
+            if (instance.title, instance.content) != previous:
+                # Nouvelle révision (delta depuis la précédente, voir notes/revisions.py)
+                request = self.context.get('request')
+                record_revision(instance, author=request.user if request else None, previous=previous)
+            if tags_data is not None:
+                instance.note_tags.all().delete()
+                for tag in tags_data:
+                    NoteTag.objects.create(note=instance, tag=tag)
+        return instance
+
+
+class NoteRevisionSerializer(serializers.ModelSerializer):
+    """Révision dans l'historique d'une note (sans contenu)"""
+    author_username = serializers.CharField(source='author.username', read_only=True, allow_null=True)
+    
+    class Meta:
+        model = NoteRevision
+        fields = ['number', 'title', 'author', 'author_username', 'content_length', 'created_at']
+        read_only_fields = fields
+
+
+class NoteRevisionDetailSerializer(NoteRevisionSerializer):
+    """Révision avec son contenu reconstruit (attribut content, voir revision_content)"""
+    content = serializers.CharField(read_only=True)
+    
+    class Meta(NoteRevisionSerializer.Meta):
+        fields = NoteRevisionSerializer.Meta.fields + ['content']
+        read_only_fields = fields
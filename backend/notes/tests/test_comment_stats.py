@@ -0,0 +1,156 @@
+# backend/notes/tests/test_comment_stats.py
+"""
+Tests des statistiques de commentaires des notes
+(comment_count, last_comment_at, reply_depth)
+"""
+
+import pytest
+
+from comments.models import Comment
+from notes.models import Note
+from projects.models import ProjectMember
+
+
+@pytest.fixture
+def member_note(sample_note, junior_user):
+    """
+    sample_note dans un projet dont junior_user est membre
+    """
+    ProjectMember.objects.create(project=sample_note.project, user=junior_user)
+    return sample_note
+
+
+def create_thread(note, author):
+    """Racine → réponse → réponse à la réponse, plus une 2ème racine"""
+    root = Comment.objects.create(content='racine', note=note, author=author)
+    reply = Comment.objects.create(content='r1', note=note, author=author, parent_comment=root)
+    deep = Comment.objects.create(content='r2', note=note, author=author, parent_comment=reply)
+    other = Comment.objects.create(content='autre', note=note, author=author)
+    return root, reply, deep, other
+
+
+@pytest.mark.django_db
+def test_comment_depth_is_set_on_creation(sample_note, junior_user):
+    """
+    Test : depth = profondeur du commentaire dans l'arbre
+    """
+    # ACT
+    root, reply, deep, other = create_thread(sample_note, junior_user)
+
+    # ASSERT
+    assert [root.depth, reply.depth, deep.depth, other.depth] == [0, 1, 2, 0]
+
+
+@pytest.mark.django_db
+def test_counters_follow_comment_creation_and_deletion(sample_note, junior_user):
+    """
+    Test : Les signaux de Comment tiennent à jour les compteurs de la note
+    """
+    # ARRANGE
+    root, reply, deep, other = create_thread(sample_note, junior_user)
+    sample_note.refresh_from_db()
+    after_create = (sample_note.comment_count, sample_note.last_comment_at, sample_note.reply_depth)
+
+    # ACT
+    root.delete()  # Supprime aussi les réponses (CASCADE)
+    sample_note.refresh_from_db()
+
+    # ASSERT
+    assert after_create == (4, other.created_at, 2)
+    assert sample_note.comment_count == 1
+    assert sample_note.last_comment_at == other.created_at
+    assert sample_note.reply_depth == 0
+
+
+@pytest.mark.django_db
+def test_list_annotates_comment_stats_in_one_query(
+    authenticated_junior_client, member_note, junior_user, django_assert_num_queries
+):
+    """
+    Test : La liste calcule les statistiques dans la requête de la liste
+    (même avec des compteurs dénormalisés faux)
+    """
+    # ARRANGE
+    create_thread(member_note, junior_user)
+    Note.objects.filter(pk=member_note.pk).update(comment_count=99, reply_depth=99)
+
+    # ACT
+    with django_assert_num_queries(2):  # Validateurs ETag, notes (values_list, sans préchargement)
+        response = authenticated_junior_client.get('/api/notes/')
+
+    # ASSERT
+    note = response.data[0]
+    assert note['comment_count'] == 4
+    assert note['reply_depth'] == 2
+    assert note['last_comment_at'] is not None
+
+
+@pytest.mark.django_db
+def test_counters_mode_reads_denormalized_columns(
+    authenticated_junior_client, member_note, junior_user, settings
+):
+    """
+    Test : NOTE_COMMENT_STATS = 'counters' → mêmes valeurs, lues sur la note
+    """
+    # ARRANGE
+    create_thread(member_note, junior_user)
+    aggregate = authenticated_junior_client.get(f'/api/notes/{member_note.id}/').data
+    settings.NOTE_COMMENT_STATS = 'counters'
+
+    # ACT
+    counters = authenticated_junior_client.get(f'/api/notes/{member_note.id}/').data
+
+    # ASSERT
+    for field in ('comment_count', 'last_comment_at', 'reply_depth'):
+        assert counters[field] == aggregate[field]
+
+
+@pytest.mark.django_db
+def test_new_comment_changes_list_etag(
+    authenticated_junior_client, member_note, junior_user, django_capture_on_commit_callbacks
+):
+    """
+    Test : Un nouveau commentaire invalide l'ETag de la liste (pas de 304 périmé)
+    """
+    # ARRANGE
+    etag = authenticated_junior_client.get('/api/notes/')['ETag']
+
+    # ACT
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        Comment.objects.create(content='nouveau', note=member_note, author=junior_user)
+    response = authenticated_junior_client.get('/api/notes/', HTTP_IF_NONE_MATCH=etag)
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.data[0]['comment_count'] == 1
+
+
+@pytest.mark.django_db
+def test_comment_changes_keep_note_version_but_change_its_etag(
+    authenticated_junior_client, member_note, junior_user, django_capture_on_commit_callbacks
+):
+    """
+    Test : Commentaire ajouté / supprimé → version et updated_at de la note inchangés
+    (If-Match toujours valide), mais l'ETag du détail change (comment_count)
+    """
+    # ARRANGE
+    url = f'/api/notes/{member_note.id}/'
+    before = authenticated_junior_client.get(url)
+
+    # ACT
+    with django_capture_on_commit_callbacks(execute=True):
+        comment = Comment.objects.create(content='c', note=member_note, author=junior_user)
+    after_create = authenticated_junior_client.get(url, HTTP_IF_NONE_MATCH=before['ETag'])
+    with django_capture_on_commit_callbacks(execute=True):
+        comment.delete()
+    note = Note.objects.get(pk=member_note.pk)
+    patched = authenticated_junior_client.patch(
+        url, {'title': 'T'}, format='json', HTTP_IF_MATCH=before['ETag']
+    )
+
+    # ASSERT
+    assert after_create.status_code == 200
+    assert after_create['ETag'] != before['ETag']
+    assert after_create.data['comment_count'] == 1
+    assert (note.version, note.updated_at) == (member_note.version, member_note.updated_at)
+    assert patched.status_code == 200
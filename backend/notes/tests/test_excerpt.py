@@ -0,0 +1,101 @@
+# backend/notes/tests/test_excerpt.py
+"""
+Tests de la représentation allégée des listes de notes
+(excerpt et content_length stockés, content non chargé)
+"""
+
+import pytest
+
+from notes.models import EXCERPT_LENGTH, Note
+from projects.models import ProjectMember
+
+
+@pytest.fixture
+def member_note(sample_note, junior_user):
+    """
+    sample_note dans un projet dont junior_user est membre
+    """
+    ProjectMember.objects.create(project=sample_note.project, user=junior_user)
+    return sample_note
+
+
+@pytest.mark.django_db
+def test_excerpt_is_maintained_on_save(sample_note):
+    """
+    Test : Extrait (sur une ligne) et longueur suivent le contenu à chaque save()
+    """
+    # ACT
+    sample_note.content = 'Première ligne\n\nseconde   ligne ' + 'x' * 500
+    sample_note.save()
+    sample_note.refresh_from_db()
+
+    # ASSERT
+    assert sample_note.content_length == len(sample_note.content)
+    assert sample_note.excerpt.startswith('Première ligne seconde ligne x')
+    assert len(sample_note.excerpt) == EXCERPT_LENGTH
+    assert sample_note.excerpt.endswith('…')
+
+
+@pytest.mark.django_db
+def test_excerpt_follows_update_fields(sample_note):
+    """
+    Test : save(update_fields=['content']) écrit aussi extrait et longueur
+    """
+    # ACT
+    sample_note.content = 'Court'
+    sample_note.save(update_fields=['content'])
+    sample_note.refresh_from_db()
+
+    # ASSERT
+    assert (sample_note.excerpt, sample_note.content_length) == ('Court', 5)
+
+
+@pytest.mark.django_db
+def test_list_returns_excerpt_without_loading_content(
+    authenticated_junior_client, member_note, django_assert_max_num_queries
+):
+    """
+    Test : La liste renvoie excerpt et content_length, sans lire la colonne content
+    """
+    # ACT
+    with django_assert_max_num_queries(10) as queries:
+        response = authenticated_junior_client.get(f'/api/notes/?project={member_note.project_id}')
+
+    # ASSERT
+    assert response.status_code == 200
+    note = response.data[0]
+    assert 'content' not in note
+    assert note['excerpt'] == 'Contenu de test pour la note'
+    assert note['content_length'] == len(member_note.content)
+    select = next(q['sql'] for q in queries.captured_queries if 'FROM "note"' in q['sql'])
+    assert '"note"."content"' not in select
+
+
+@pytest.mark.django_db
+def test_detail_still_returns_content(authenticated_junior_client, member_note):
+    """
+    Test : Le détail renvoie toujours le contenu complet
+    """
+    # ACT
+    response = authenticated_junior_client.get(f'/api/notes/{member_note.id}/')
+
+    # ASSERT
+    assert response.data['content'] == 'Contenu de test pour la note'
+
+
+@pytest.mark.django_db
+def test_note_loaded_without_content_keeps_its_excerpt(member_note):
+    """
+    Test : Enregistrer une note chargée sans content ne touche pas à l'extrait
+    """
+    # ARRANGE
+    note = Note.objects.defer('content').get(pk=member_note.pk)
+
+    # ACT
+    note.title = 'Renommée'
+    note.save(update_fields=['title'])
+    member_note.refresh_from_db()
+
+    # ASSERT
+    assert member_note.title == 'Renommée'
+    assert member_note.excerpt == 'Contenu de test pour la note'
@@ -0,0 +1,186 @@
+# backend/notes/tests/test_import.py
+"""
+Tests de l'import / export de notes en masse (notes/importers.py)
+"""
+
+import io
+import json
+import zipfile
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import AsyncClient
+
+from notes.importers import NoteImporter, iter_records
+from notes.models import Note, NoteTag
+from projects.models import Project, ProjectMember
+
+
+def ndjson(*records):
+    return b''.join(json.dumps(record).encode() + b'\n' for record in records)
+
+
+def markdown_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, text in files.items():
+            archive.writestr(name, text)
+    return buffer.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_ndjson_in_chunks(sample_project, junior_user, python_tag, django_tag):
+    """
+    Test : Notes et tags créés par lots, une ligne d'avancement par lot
+    """
+    # ARRANGE
+    data = ndjson(
+        *({'title': f'N{i}', 'content': 'x', 'tags': ['python']} for i in range(5)),
+        {'title': 'Tags', 'content': 'x', 'status': 'publie', 'tags': ['python', 'django']},
+    )
+    importer = NoteImporter(sample_project, junior_user, chunk_size=4)
+
+    # ACT
+    progress = list(importer.run(iter_records(io.BytesIO(data))))
+
+    # ASSERT
+    assert [step['processed'] for step in progress] == [4, 6]
+    assert progress[-1]['created'] == 6
+    assert Note.objects.filter(project=sample_project).count() == 6
+    assert NoteTag.objects.count() == 7
+    assert Note.objects.get(title='Tags').status == 'publie'
+    assert Project.objects.get(pk=sample_project.pk).note_count == 6
+
+
+@pytest.mark.django_db
+def test_import_reports_invalid_lines(sample_project, junior_user, python_tag):
+    """
+    Test : JSON invalide, champ manquant et tag inconnu → erreurs, le reste est importé
+    """
+    # ARRANGE
+    data = ndjson({'title': 'OK', 'content': 'x'}, {'content': 'sans titre'}) \
+        + b'{pas du json\n' + ndjson({'title': 'T', 'content': 'x', 'tags': ['cobol']})
+    importer = NoteImporter(sample_project, junior_user)
+
+    # ACT
+    report = list(importer.run(iter_records(io.BytesIO(data))))[-1]
+
+    # ASSERT
+    assert (report['created'], report['failed']) == (1, 3)
+    assert [error['position'] for error in report['errors']] == ['ligne 2', 'ligne 3', 'ligne 4']
+    assert 'cobol' in str(report['errors'][2]['error'])
+
+
+@pytest.mark.django_db
+def test_import_markdown_zip(sample_project, junior_user, django_tag):
+    """
+    Test : Zip de Markdown : en-tête, titre « # », sinon nom du fichier
+    """
+    # ARRANGE
+    data = markdown_zip({
+        'docs/deploy.md': '---\ntitle: Déployer\ntags: django\nstatus: publie\n---\nÉtapes',
+        'docs/guide.md': '# Guide\n\nContenu',
+        'docs/notes-diverses.md': 'Sans titre',
+        'docs/image.png': 'ignoré',
+    })
+
+    # ACT
+    list(NoteImporter(sample_project, junior_user).run(iter_records(io.BytesIO(data))))
+
+    # ASSERT
+    notes = {note.title: note for note in Note.objects.all()}
+    assert set(notes) == {'Déployer', 'Guide', 'notes-diverses'}
+    assert notes['Déployer'].content == 'Étapes'
+    assert notes['Déployer'].note_tags.get().tag == django_tag
+
+
+@pytest.mark.django_db
+def test_import_endpoint_streams_progress(authenticated_junior_client, sample_project, junior_user):
+    """
+    Test : POST /api/notes/import/ répond en NDJSON (avancement puis bilan)
+    """
+    # ARRANGE
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    upload = SimpleUploadedFile('notes.ndjson', ndjson({'title': 'A', 'content': 'x'}))
+
+    # ACT
+    response = authenticated_junior_client.post(
+        f'/api/notes/import/?project={sample_project.id}', {'file': upload}, format='multipart'
+    )
+
+    # ASSERT
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+    assert lines[-1]['created'] == 1
+    assert Note.objects.get().author == junior_user
+
+
+@pytest.mark.django_db
+def test_import_progress_is_live_under_asgi(sample_project, junior_user, settings):
+    """
+    Test : Sous ASGI, la première ligne d'avancement arrive quand seul le premier lot est importé
+    """
+    # ARRANGE
+    settings.NOTE_IMPORT_CHUNK_SIZE = 2
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    client = AsyncClient()
+    client.force_login(junior_user)
+    upload = SimpleUploadedFile('notes.ndjson', ndjson(*({'title': f'N{i}', 'content': 'x'} for i in range(5))))
+
+    async def import_notes():
+        response = await client.post(f'/api/notes/import/?project={sample_project.id}', {'file': upload})
+        stream = response.streaming_content
+        first = json.loads(await anext(stream))
+        created_so_far = await sync_to_async(Note.objects.count)()
+        rest = [json.loads(line) async for line in stream]
+        return response, first, created_so_far, rest
+
+    # ACT
+    response, first, created_so_far, rest = async_to_sync(import_notes)()
+
+    # ASSERT
+    assert response.is_async
+    assert (first['processed'], created_so_far) == (2, 2)
+    assert [step['processed'] for step in rest] == [4, 5]
+    assert Note.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_import_endpoint_requires_visible_project(authenticated_junior_client, sample_project):
+    """
+    Test : Projet dont l'utilisateur n'est pas membre → 404
+    """
+    # ACT
+    response = authenticated_junior_client.post(
+        f'/api/notes/import/?project={sample_project.id}',
+        {'file': SimpleUploadedFile('notes.ndjson', b'')}, format='multipart'
+    )
+
+    # ASSERT
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_export_then_import_round_trip(sample_project, lead_user, junior_user, python_tag, tmp_path):
+    """
+    Test : export_notes produit un fichier relu à l'identique par import_notes
+    """
+    # ARRANGE
+    note = Note.objects.create(title='N', content='x\ny', project=sample_project, author=junior_user)
+    NoteTag.objects.create(note=note, tag=python_tag)
+    target = Project.objects.create(name='Cible', description='d', created_by=lead_user)
+    path = tmp_path / 'notes.ndjson'
+
+    # ACT
+    call_command('export_notes', '--project', str(sample_project.pk), '--output', str(path), stderr=io.StringIO())
+    call_command(
+        'import_notes', str(path), '--project', str(target.pk),
+        '--author', junior_user.username, stdout=io.StringIO()
+    )
+
+    # ASSERT
+    copy = Note.objects.get(project=target)
+    assert (copy.title, copy.content) == ('N', 'x\ny')
+    assert [nt.tag for nt in copy.note_tags.all()] == [python_tag]
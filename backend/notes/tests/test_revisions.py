@@ -0,0 +1,235 @@
+# backend/notes/tests/test_revisions.py
+"""
+Tests de l'historique des notes (NoteRevision, notes/revisions.py)
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from notes import revisions as revisions_module
+from notes import serializers as note_serializers
+from notes.models import Note, NoteRevision
+from notes.revisions import apply_delta, make_delta, record_revision, revision_content
+from projects.models import ProjectMember
+
+
+def document(version):
+    """Document de 200 lignes dont une ligne change à chaque version"""
+    lines = [f'Ligne {i} de la documentation du projet.\n' for i in range(200)]
+    lines[version % 200] = f'Ligne modifiée en version {version}.\n'
+    return ''.join(lines)
+
+
+@pytest.fixture
+def member_note(sample_note, junior_user):
+    """
+    sample_note (auteur junior_user) dans un projet dont junior_user est membre
+    """
+    ProjectMember.objects.create(project=sample_note.project, user=junior_user)
+    return sample_note
+
+
+@pytest.mark.parametrize('old, new', [
+    ('a\nb\nc\n', 'a\nB\nc\nd\n'),
+    ('', 'nouveau\ncontenu sans fin de ligne'),
+    ('x\ny', ''),
+    ('même\n', 'même\n'),
+])
+def test_delta_round_trip(old, new):
+    """
+    Test : apply_delta(old, make_delta(old, new)) == new
+    """
+    # ACT & ASSERT
+    assert apply_delta(old, make_delta(old, new)) == new
+
+
+@pytest.mark.django_db
+def test_every_version_is_reconstructed(member_note, junior_user, settings):
+    """
+    Test : Chaque révision redonne son contenu exact, snapshot toutes les N révisions
+    """
+    # ARRANGE
+    settings.NOTE_REVISION_SNAPSHOT_INTERVAL = 4
+    versions = [document(i) for i in range(10)]
+
+    # ACT
+    for content in versions:
+        member_note.content = content
+        member_note.save()
+        record_revision(member_note, author=junior_user)
+
+    # ASSERT
+    revisions = list(NoteRevision.objects.filter(note=member_note).order_by('number'))
+    assert [r.number for r in revisions if r.is_snapshot] == [1, 5, 9]
+    for revision, content in zip(revisions, versions):
+        assert revision_content(revision) == content
+        assert revision.content_length == len(content)
+
+
+@pytest.mark.django_db
+def test_deltas_are_much_smaller_than_full_versions(member_note, junior_user):
+    """
+    Test : Des petites modifications d'une grosse note coûtent peu de stockage
+    """
+    # ACT
+    for i in range(10):
+        member_note.content = document(i)
+        member_note.save()
+        record_revision(member_note, author=junior_user)
+
+    # ASSERT
+    deltas = NoteRevision.objects.filter(note=member_note, is_snapshot=False)
+    assert deltas.count() == 9
+    assert sum(len(r.data) for r in deltas) * 20 < 9 * len(document(0))
+
+
+@pytest.mark.django_db
+def test_reconstruction_is_a_single_query(member_note, junior_user):
+    """
+    Test : Snapshot et deltas lus en une requête
+    """
+    # ARRANGE
+    for i in range(5):
+        member_note.content = document(i)
+        member_note.save()
+        last = record_revision(member_note, author=junior_user)
+
+    # ACT
+    with CaptureQueriesContext(connection) as queries:
+        content = revision_content(last)
+
+    # ASSERT
+    assert content == document(4)
+    assert len(queries.captured_queries) == 1
+
+
+@pytest.mark.django_db
+def test_delta_is_computed_from_previous_content(member_note, junior_user, monkeypatch):
+    """
+    Test : Contenu précédent fourni → delta calculé depuis lui, sans rejouer les deltas
+    """
+    # ARRANGE
+    for i in range(5):
+        member_note.content = document(i)
+        member_note.save()
+        record_revision(member_note, author=junior_user)
+    monkeypatch.setattr(
+        revisions_module, 'revision_content', lambda revision: pytest.fail("révision reconstruite")
+    )
+
+    # ACT
+    previous = (member_note.title, member_note.content)
+    member_note.content = document(5)
+    member_note.save()
+    last = record_revision(member_note, author=junior_user, previous=previous)
+
+    # ASSERT
+    assert not last.is_snapshot
+    assert revision_content(last) == document(5)
+
+
+@pytest.mark.django_db
+def test_api_create_and_update_record_revisions(authenticated_junior_client, member_note, junior_user):
+    """
+    Test : Création puis modification par l'API → révisions 1 et 2
+    """
+    # ARRANGE
+    authenticated_junior_client.post('/api/notes/', {
+        'title': 'Guide', 'content': 'v1', 'project': member_note.project_id
+    }, format='json')
+    note_id = Note.objects.get(title='Guide').id
+
+    # ACT
+    authenticated_junior_client.patch(f'/api/notes/{note_id}/', {'content': 'v1\nv2'}, format='json')
+    authenticated_junior_client.patch(f'/api/notes/{note_id}/', {'status': 'publie'}, format='json')
+    listing = authenticated_junior_client.get(f'/api/notes/{note_id}/revisions/')
+    first = authenticated_junior_client.get(f'/api/notes/{note_id}/revisions/1/')
+
+    # ASSERT
+    assert listing.data['count'] == 2  # Le changement de statut n'est pas une révision
+    assert [r['number'] for r in listing.data['results']] == [2, 1]
+    assert listing.data['results'][0]['author_username'] == 'juniortest'
+    assert 'content' not in listing.data['results'][0]
+    assert first.data['content'] == 'v1'
+
+
+@pytest.mark.django_db
+def test_note_without_history_keeps_its_previous_version(authenticated_junior_client, member_note):
+    """
+    Test : Note antérieure aux révisions → l'ancienne version devient la révision 1
+    """
+    # ACT
+    authenticated_junior_client.patch(
+        f'/api/notes/{member_note.id}/', {'title': 'Nouveau titre', 'content': 'Nouveau'}, format='json'
+    )
+    response = authenticated_junior_client.get(f'/api/notes/{member_note.id}/revisions/1/')
+
+    # ASSERT
+    assert response.data['title'] == 'Test Note'
+    assert response.data['content'] == 'Contenu de test pour la note'
+    assert NoteRevision.objects.filter(note=member_note).count() == 2
+
+
+@pytest.mark.django_db
+def test_revision_list_is_paginated_without_reading_contents(
+    authenticated_junior_client, member_note, junior_user
+):
+    """
+    Test : ?page_size= pagine, la colonne data n'est pas lue
+    """
+    # ARRANGE
+    for i in range(5):
+        member_note.content = document(i)
+        record_revision(member_note, author=junior_user)
+
+    # ACT
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_junior_client.get(
+            f'/api/notes/{member_note.id}/revisions/?page_size=2&page=2'
+        )
+
+    # ASSERT
+    assert [r['number'] for r in response.data['results']] == [3, 2]
+    assert response.data['count'] == 5
+    assert not any('"data"' in q['sql'] for q in queries.captured_queries)
+
+
+@pytest.mark.django_db
+def test_revisions_of_hidden_note_are_404(authenticated_lead_client, member_note, junior_user):
+    """
+    Test : Historique d'une note invisible pour l'utilisateur → 404
+    """
+    # ARRANGE
+    record_revision(member_note, author=junior_user)
+
+    # ACT
+    listing = authenticated_lead_client.get(f'/api/notes/{member_note.id}/revisions/')
+    detail = authenticated_lead_client.get(f'/api/notes/{member_note.id}/revisions/1/')
+
+    # ASSERT
+    assert listing.status_code == 404
+    assert detail.status_code == 404
+
+
+@pytest.mark.django_db
+def test_failed_revision_rolls_back_the_update(member_note, monkeypatch):
+    """
+    Test : Échec de l'écriture de la révision → la modification de la note est annulée
+    """
+    # ARRANGE
+    def broken_record_revision(*args, **kwargs):
+        raise RuntimeError("historique indisponible")
+
+    monkeypatch.setattr(note_serializers, 'record_revision', broken_record_revision)
+    serializer = note_serializers.NoteUpdateSerializer(member_note, data={'content': 'Nouveau'}, partial=True)
+    serializer.is_valid(raise_exception=True)
+
+    # ACT
+    with pytest.raises(RuntimeError):
+        serializer.save()
+
+    # ASSERT
+    stored = Note.objects.get(pk=member_note.pk)
+    assert (stored.content, stored.version) == ('Contenu de test pour la note', 1)
+    assert not NoteRevision.objects.filter(note=member_note).exists()
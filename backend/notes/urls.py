@@ -1,5 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+
+from . import async_views
 from .views import NoteViewSet
 
 router = DefaultRouter()
@@ -7,4 +9,6 @@ router.register(r'notes', NoteViewSet, basename='note')
 
 urlpatterns = [
     path('', include(router.urls)),
+    # Version async (ASGI) d'une lecture lourde
+    path('async/notes/', async_views.notes_by_project, name='notes-by-project-async'),
 ]
\ No newline at end of file
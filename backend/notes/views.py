@@ -1,13 +1,66 @@
+import json
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Coalesce
 
+from .importers import NoteImporter, iter_records
 from .models import Note
-from .serializers import NoteSerializer, NoteCreateSerializer, NoteUpdateSerializer  
+from .revisions import revision_content
+from .serializers import (
+    NoteSerializer, NoteListSerializer, NoteCreateSerializer, NoteUpdateSerializer,
+    NoteRevisionSerializer, NoteRevisionDetailSerializer
+)
+from sharetech.cache import CachedResponseMixin
+from sharetech.concurrency import OptimisticConcurrencyMixin
+from sharetech.conditional import ConditionalGetMixin
+from sharetech.fieldsets import SparseFieldsetMixin
+
+from sharetech.streaming import streaming_response
+
+def visible_notes(user):
+    """Notes visibles par l'utilisateur : membre du projet ou auteur"""
+    return Note.objects.filter(
+        Q(project__members__user=user) | Q(author=user)
+    ).distinct()
+
+
+def annotate_comment_stats(queryset):
+    """
+    Ajoute live_comment_count, live_last_comment_at et live_reply_depth
+    (un seul agrégat, jointure sur comment) lus par NoteSerializer.
+    NOTE_COMMENT_STATS = 'counters' : rien à ajouter, NoteSerializer lit
+    les compteurs dénormalisés de Note (projets très actifs)
+    """
+    if settings.NOTE_COMMENT_STATS != 'aggregate':
+        return queryset
+    return queryset.annotate(
+        # distinct : la jointure sur les membres du projet peut dupliquer les lignes
+        live_comment_count=Count('comments', distinct=True),
+        live_last_comment_at=Max('comments__created_at'),
+        live_reply_depth=Coalesce(Max('comments__depth'), 0),
+    )
+
+
+class NoteRevisionPagination(PageNumberPagination):
+    """Pagination de l'historique d'une note (?page=2&page_size=50)"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
 
-class NoteViewSet(viewsets.ModelViewSet):
+class NoteViewSet(
+    OptimisticConcurrencyMixin, SparseFieldsetMixin, CachedResponseMixin, ConditionalGetMixin,
+    viewsets.ModelViewSet
+):
     """
     ViewSet pour gérer les notes
     
@@ -16,25 +69,72 @@ class NoteViewSet(viewsets.ModelViewSet):
     - Création : Tous les utilisateurs authentifiés
     - Modification : Auteur ou Senior+
     - Suppression : Auteur ou Admin
+    
+    Liste et détail supportent If-None-Match / If-Modified-Since (304)
+    La liste (?project=) est mise en cache par utilisateur (voir sharetech/cache.py)
+    Les listes renvoient excerpt et content_length au lieu de content (non chargé),
+    le contenu complet est servi par le détail
+    Lectures : ?fields=id,title (sans content) et ?expand=author (voir sharetech/fieldsets.py)
+    Chaque création / modification ajoute une révision (historique : revisions, revision)
+    Modification : If-Match: "<version>" ou If-Unmodified-Since, sinon 412 (voir sharetech/concurrency.py)
     """
     permission_classes = [IsAuthenticated]
     serializer_class = NoteSerializer
     
+    # Throttling : la recherche full-text et les arbres de commentaires coûtent plus cher
+    throttle_scope = 'notes'
+    throttle_costs = {
+        'list': 2, 'by_project': 2, 'comments': 3, 'search': 5, 'import_notes': 20, 'revision': 2
+    }
+    
+    # Cache de réponses : la liste affiche aussi le nom du projet, les statistiques
+    # de commentaires et dépend des membres
+    cache_actions = ('list',)
+    cache_dependencies = (
+        'notes.note', 'notes.notetag', 'comments.comment',
+        'projects.project', 'projects.projectmember'
+    )
+    
+    # ETag du détail : nom du projet et statistiques de commentaires (hors version de la note)
+    etag_dependencies = ('projects.project', 'comments.comment')
+    
+    # Actions qui sérialisent des notes avec NoteSerializer
+    read_actions = ['list', 'retrieve', 'my_notes', 'by_project', 'search']
+    fieldset_actions = read_actions
+    # Listes : NoteListSerializer, sans la colonne content
+    list_actions = ['list', 'my_notes', 'by_project', 'search']
+    
     def get_serializer_class(self):
         if self.action == 'create':
             return NoteCreateSerializer  # ← CREATE : project en écriture
         elif self.action in ['update', 'partial_update']:
             return NoteUpdateSerializer  # ← UPDATE : project non modifiable
+        elif self.action in self.list_actions:
+            return NoteListSerializer  # ← Listes : extrait au lieu du contenu
         return NoteSerializer  # ← Par défaut
     
     def get_queryset(self):
         """
         Retourne les notes accessibles par l'utilisateur
         """
-        user = self.request.user
-        return Note.objects.filter(
-            Q(project__members__user=user) | Q(author=user)
-        ).distinct().select_related('author', 'project').prefetch_related('note_tags__tag')
+        queryset = visible_notes(self.request.user).select_related(
+            'author', 'project'
+        ).prefetch_related('note_tags__tag')
+        
+        # Filtrage par projet (GET /api/notes/?project=1) pour la liste
+        project_id = self.request.query_params.get('project')
+        if project_id and self.action == 'list':
+            queryset = queryset.filter(project_id=project_id)
+        
+        if self.action in self.list_actions:
+            queryset = queryset.defer('content')
+        
+        if self.action in self.read_actions and self.wants_field(
+            'comment_count', 'last_comment_at', 'reply_depth'
+        ):
+            queryset = annotate_comment_stats(queryset)
+        
+        return queryset
     
     def perform_create(self, serializer):
         """Définit automatiquement l'auteur lors de la création"""
@@ -90,6 +190,33 @@ class NoteViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(notes, many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser])
+    def import_notes(self, request):
+        """
+        Import en masse (voir notes/importers.py)
+        
+        POST /api/notes/import/?project=1   (multipart, champ file)
+        file : NDJSON (un objet par ligne) ou zip de fichiers Markdown
+        
+        Réponse NDJSON en streaming : une ligne d'avancement par lot,
+        {"processed", "created", "failed", "errors"}, la dernière est le bilan
+        (sous ASGI, chaque ligne part dès la fin de son lot : sharetech/streaming.py)
+        """
+        from projects.views import visible_projects
+        
+        project_id = request.query_params.get('project')
+        upload = request.FILES.get('file')
+        if not project_id or upload is None:
+            raise ValidationError({'detail': 'Paramètre project et fichier (champ file) requis'})
+        project = get_object_or_404(visible_projects(request.user), pk=project_id)
+        
+        importer = NoteImporter(project, request.user, chunk_size=settings.NOTE_IMPORT_CHUNK_SIZE)
+        lines = (
+            json.dumps(progress, ensure_ascii=False) + '\n'
+            for progress in importer.run(iter_records(upload))
+        )
+        return streaming_response(request, lines, 'application/x-ndjson')
+    
     @action(detail=False, methods=['get'])
     def search(self, request):
         """Recherche full-text dans les notes"""
@@ -107,6 +234,35 @@ class NoteViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
     
 
+    @action(detail=True, methods=['get'])
+    def revisions(self, request, pk=None):
+        """
+        Historique de la note, paginé, du plus récent au plus ancien
+        GET /api/notes/{id}/revisions/?page=2
+        
+        Métadonnées seulement : les contenus compressés ne sont pas lus
+        """
+        note = get_object_or_404(visible_notes(request.user).only('pk'), pk=pk)
+        revisions = note.revisions.select_related('author').defer('data')
+        
+        paginator = NoteRevisionPagination()
+        page = paginator.paginate_queryset(revisions, request, view=self)
+        serializer = NoteRevisionSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+    
+    @action(detail=True, methods=['get'], url_path=r'revisions/(?P<number>\d+)')
+    def revision(self, request, pk=None, number=None):
+        """
+        Une révision avec son contenu (voir notes/revisions.py)
+        GET /api/notes/{id}/revisions/{numéro}/
+        """
+        note = get_object_or_404(visible_notes(request.user).only('pk'), pk=pk)
+        revision = get_object_or_404(
+            note.revisions.select_related('author').defer('data'), number=number
+        )
+        revision.content = revision_content(revision)
+        return Response(NoteRevisionDetailSerializer(revision).data)
+    
     @action(detail=True, methods=['get', 'post'])
     def comments(self, request, pk=None):
         """
@@ -0,0 +1,31 @@
+# backend/projects/async_views.py
+"""
+Vues async des projets (voir sharetech/async_api.py)
+"""
+
+from sharetech.async_api import async_api_view, run_queries
+
+from .models import ProjectMember
+from .serializers import ProjectDetailSerializer, ProjectMemberSerializer
+from .views import visible_projects
+
+
+@async_api_view(throttle_scope='projects', throttle_cost=2)
+async def project_detail(request, user, pk):
+    """
+    Détail d'un projet avec ses membres
+    GET /api/async/projects/{id}/
+
+    Même réponse que GET /api/projects/{id}/ ; le projet et les membres
+    sont chargés en parallèle
+    """
+    project, members = await run_queries(
+        lambda: visible_projects(user).select_related('created_by').get(pk=pk),
+        lambda: list(
+            ProjectMember.objects.filter(project_id=pk).select_related('user__profile')
+        ),
+    )
+
+    serializer = ProjectDetailSerializer(project)
+    del serializer.fields['members']  # Déjà chargés
+    return {**serializer.data, 'members': ProjectMemberSerializer(members, many=True).data}
@@ -0,0 +1,92 @@
+# backend/projects/counters.py
+"""
+Compteurs dénormalisés de Project
+
+member_count, note_count, open_task_count et done_task_count sont tenus
+à jour par les signaux de ProjectMember, Note et Task, en un UPDATE
+atomique (SET n = n + 1) qui touche aussi last_activity_at.
+Les écritures qui contournent les signaux (queryset.update, bulk_update)
+doivent appeler update_counters elles-mêmes ; reconcile_counters
+(commande manage.py reconcile_counters) répare les écarts.
+"""
+
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from sharetech.counters import shift
+
+from .models import Project
+
+
+DONE_TASK_STATUSES = ('terminee',)
+
+
+def task_counter_field(status):
+    """Compteur du projet dans lequel une tâche de ce statut est comptée"""
+    return 'done_task_count' if status in DONE_TASK_STATUSES else 'open_task_count'
+
+
+def update_counters(project_id, **deltas):
+    """
+    Applique des deltas aux compteurs d'un projet en un seul UPDATE
+    et met à jour last_activity_at
+
+        update_counters(project.id, open_task_count=-1, done_task_count=1)
+    """
+    values = {field: shift(field, delta) for field, delta in deltas.items() if delta}
+    Project.objects.filter(pk=project_id).update(last_activity_at=timezone.now(), **values)
+
+
+def _count(queryset):
+    """Sous-requête COUNT(*) des lignes du projet courant (OuterRef)"""
+    return Coalesce(Subquery(
+        queryset.filter(project=OuterRef('pk')).order_by().values('project')
+        .annotate(total=Count('pk')).values('total')
+    ), 0)
+
+
+def actual_counters():
+    """Expressions des vraies valeurs des compteurs (pour annotate)"""
+    from notes.models import Note
+    from tasks.models import Task
+
+    from .models import ProjectMember
+
+    return {
+        'member_count': _count(ProjectMember.objects.all()),
+        'note_count': _count(Note.objects.all()),
+        'open_task_count': _count(Task.objects.exclude(status__in=DONE_TASK_STATUSES)),
+        'done_task_count': _count(Task.objects.filter(status__in=DONE_TASK_STATUSES)),
+    }
+
+
+def reconcile_counters(project_ids=None, dry_run=False):
+    """
+    Recompte les compteurs et corrige ceux qui ont dérivé
+    Retourne {project_id: {champ: (valeur stockée, valeur réelle)}}
+    """
+    expressions = actual_counters()
+    projects = Project.objects.annotate(
+        **{f'actual_{field}': expression for field, expression in expressions.items()}
+    ).values('pk', *expressions, *(f'actual_{field}' for field in expressions))
+    if project_ids:
+        projects = projects.filter(pk__in=project_ids)
+
+    drift = {}
+    for row in projects.iterator():
+        diffs = {
+            field: (row[field], row[f'actual_{field}'])
+            for field in expressions
+            if row[field] != row[f'actual_{field}']
+        }
+        if diffs:
+            drift[row['pk']] = diffs
+
+    if not dry_run:
+        # Recomptage dans l'UPDATE lui-même : pas de fenêtre entre lecture et écriture
+        for project_id, diffs in drift.items():
+            Project.objects.filter(pk=project_id).update(
+                **{field: expressions[field] for field in diffs}
+            )
+    return drift
@@ -0,0 +1,143 @@
+# backend/projects/exports.py
+"""
+Export d'un projet en streaming (GET /api/projects/{id}/export/)
+
+Mémoire constante quel que soit le volume : les lignes sont lues par lots
+de EXPORT_CHUNK_SIZE et écrites dans la réponse au fur et à mesure.
+
+Lecture par pagination sur la clé primaire (WHERE id > dernier ORDER BY id
+LIMIT n) plutôt que queryset.iterator(chunk_size=...) : avec MySQL/MariaDB
+le driver charge tout le résultat d'un iterator() en mémoire (pas de curseur
+côté serveur), chaque lot est ici une requête courte et indépendante.
+Les tags d'un lot sont lus en une requête et nommés par le registre.
+
+Un lot = un morceau de la réponse : sous ASGI, chaque lot est lu via
+sync_to_async et envoyé avant la lecture du suivant (voir sharetech/streaming.py).
+"""
+
+import csv
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from tags.registry import tag_registry
+
+
+def note_resource(project):
+    from notes.models import Note, NoteTag
+    return {
+        'queryset': Note.objects.filter(project=project),
+        'fields': {
+            'id': 'id', 'title': 'title', 'status': 'status', 'author': 'author__username',
+            'created_at': 'created_at', 'updated_at': 'updated_at', 'content': 'content',
+        },
+        'tags': (NoteTag, 'note_id'),
+    }
+
+
+def task_resource(project):
+    from tasks.models import Task, TaskTag
+    return {
+        'queryset': Task.objects.filter(project=project),
+        'fields': {
+            'id': 'id', 'title': 'title', 'status': 'status', 'priority': 'priority',
+            'assigned_to': 'assigned_to__username', 'created_by': 'created_by__username',
+            'estimated_hours': 'estimated_hours', 'actual_hours': 'actual_hours',
+            'due_date': 'due_date', 'completed_date': 'completed_date',
+            'created_at': 'created_at', 'description': 'description',
+        },
+        'tags': (TaskTag, 'task_id'),
+    }
+
+
+def comment_resource(project):
+    from comments.models import Comment
+    return {
+        'queryset': Comment.objects.filter(note__project=project),
+        'fields': {
+            'id': 'id', 'note': 'note_id', 'parent_comment': 'parent_comment_id', 'depth': 'depth',
+            'author': 'author__username', 'created_at': 'created_at', 'content': 'content',
+        },
+        'tags': None,
+    }
+
+
+# Ressources exportables, dans l'ordre de l'export NDJSON complet
+EXPORT_RESOURCES = {
+    'notes': note_resource,
+    'tasks': task_resource,
+    'comments': comment_resource,
+}
+
+
+def iter_chunks(resource, chunk_size):
+    """Lots de lignes (listes de dicts) d'une ressource (le champ 'id' vient en premier)"""
+    names, paths = zip(*resource['fields'].items())
+    rows = resource['queryset'].order_by('pk').values_list(*paths)
+    last_pk = 0
+    while True:
+        chunk = list(rows.filter(pk__gt=last_pk)[:chunk_size])
+        if not chunk:
+            return
+        last_pk = chunk[-1][0]
+        tags = chunk_tags(resource['tags'], [values[0] for values in chunk])
+        rows_chunk = [dict(zip(names, values)) for values in chunk]
+        if tags is not None:
+            for row in rows_chunk:
+                row['tags'] = tags.get(row['id'], [])
+        yield rows_chunk
+
+
+def chunk_tags(spec, ids):
+    """{id: [noms de tags]} des lignes du lot (une requête), None si sans tags"""
+    if spec is None:
+        return None
+    model, owner_field = spec
+    tags = {}
+    for owner_id, tag_id in model.objects.filter(**{f'{owner_field}__in': ids}).values_list(owner_field, 'tag_id'):
+        tag = tag_registry.get(tag_id)
+        if tag:
+            tags.setdefault(owner_id, []).append(tag.name)
+    return {owner_id: sorted(names) for owner_id, names in tags.items()}
+
+
+class Echo:
+    """Pseudo-fichier pour csv.writer : write() retourne la ligne au lieu de l'écrire"""
+    def write(self, value):
+        return value
+
+
+def csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ','.join(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def stream_ndjson(project, resources, chunk_size=None):
+    """Une ligne JSON par objet, {"type": "note", ...}, ressource par ressource ; un morceau par lot"""
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    for name in resources:
+        resource = EXPORT_RESOURCES[name](project)
+        kind = name[:-1]  # notes → note
+        for rows in iter_chunks(resource, chunk_size):
+            yield ''.join(
+                json.dumps({'type': kind, **row}, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+                for row in rows
+            )
+
+
+def stream_csv(project, resource_name, chunk_size=None):
+    """Lignes CSV d'une seule ressource (en-tête compris) ; un morceau par lot"""
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    resource = EXPORT_RESOURCES[resource_name](project)
+    header = list(resource['fields']) + (['tags'] if resource['tags'] else [])
+    writer = csv.writer(Echo())
+    
+    yield writer.writerow(header)
+    for rows in iter_chunks(resource, chunk_size):
+        yield ''.join(writer.writerow([csv_value(row[column]) for column in header]) for row in rows)
@@ -0,0 +1,41 @@
+# backend/projects/management/commands/reconcile_counters.py
+"""
+Recompte les compteurs dénormalisés des projets et corrige les écarts
+
+    python manage.py reconcile_counters
+    python manage.py reconcile_counters --project 3 --project 7 --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+from projects.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = "Recompte member_count, note_count, open_task_count et done_task_count"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project', type=int, action='append', dest='projects',
+            help="Id du projet à vérifier (répétable, tous par défaut)"
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Affiche les écarts sans les corriger"
+        )
+
+    def handle(self, *args, **options):
+        drift = reconcile_counters(options['projects'], dry_run=options['dry_run'])
+
+        for project_id, diffs in sorted(drift.items()):
+            details = ', '.join(
+                f'{field} {stored} → {actual}' for field, (stored, actual) in diffs.items()
+            )
+            self.stdout.write(f'Projet {project_id} : {details}')
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Aucun écart"))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING(f"{len(drift)} projet(s) à corriger (dry-run)"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"{len(drift)} projet(s) corrigé(s)"))
@@ -0,0 +1,64 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:04
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    """Compteurs des projets existants (même calcul que reconcile_counters)"""
+    Project = apps.get_model('projects', 'Project')
+
+    done = Q(tasks__status='terminee')
+    stats = Project.objects.annotate(
+        n_members=Count('members', distinct=True),
+        n_notes=Count('notes', distinct=True),
+        n_open_tasks=Count('tasks', filter=~done, distinct=True),
+        n_done_tasks=Count('tasks', filter=done, distinct=True),
+    ).values('pk', 'n_members', 'n_notes', 'n_open_tasks', 'n_done_tasks', 'updated_at')
+    for row in stats:
+        Project.objects.filter(pk=row['pk']).update(
+            member_count=row['n_members'],
+            note_count=row['n_notes'],
+            open_task_count=row['n_open_tasks'],
+            done_task_count=row['n_done_tasks'],
+            last_activity_at=row['updated_at'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        ('notes', '0001_initial'),
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='done_task_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Tâches terminées'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='last_activity_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Dernière activité'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Membres'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='note_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Notes'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='open_task_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Tâches ouvertes'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -3,9 +3,15 @@
 
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
 
+from sharetech.cache import bump_cache_version
+from sharetech.counters import CounterFieldsMixin
 
-class Project(models.Model):
+
+class Project(CounterFieldsMixin, models.Model):
     """
     Modèle Project pour ShareTech
     Gère les projets collaboratifs
@@ -51,6 +57,23 @@ class Project(models.Model):
         verbose_name='Dernière modification'
     )
     
+    # Compteurs dénormalisés, tenus à jour par les signaux des membres,
+    # notes et tâches (voir projects/counters.py)
+    counter_fields = ('member_count', 'note_count', 'open_task_count', 'done_task_count')
+    
+    member_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Membres')
+    note_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Notes')
+    open_task_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Tâches ouvertes')
+    done_task_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Tâches terminées')
+    
+    # Dernière activité : modification du projet, de ses membres, notes ou tâches
+    # Sert de Last-Modified / ETag au projet (le détail affiche membres et compteurs)
+    last_activity_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+        verbose_name='Dernière activité'
+    )
+    
     class Meta:
         # Nom de la table en base de données
         db_table = 'project'
@@ -75,6 +98,10 @@ class Project(models.Model):
         status = "Actif" if self.is_active else "Terminé"
         return f"{self.name} ({status})"
     
+    def save(self, *args, **kwargs):
+        self.last_activity_at = timezone.now()
+        super().save(*args, **kwargs)
+    
     # Méthode pour terminer un projet
     def terminate(self):
         """Marque le projet comme terminé"""
@@ -140,4 +167,29 @@ class ProjectMember(models.Model):
     # Représentation textuelle dans l'admin et les logs
     # Affiche "username - Nom du projet (Rôle)"
     def __str__(self):
-        return f"{self.user.username} - {self.project.name} ({self.user.profile.get_role_display()})"
\ No newline at end of file
+        return f"{self.user.username} - {self.project.name} ({self.user.profile.get_role_display()})"
+
+
+# Signaux : compteur de membres et dernière activité du projet
+# (le détail d'un projet inclut ses membres : son ETag doit changer)
+@receiver(post_save, sender=ProjectMember)
+def count_added_member(sender, instance, created, **kwargs):
+    from .counters import update_counters
+    if created:
+        update_counters(instance.project_id, member_count=1)
+
+
+@receiver(post_delete, sender=ProjectMember)
+def count_removed_member(sender, instance, **kwargs):
+    from .counters import update_counters
+    update_counters(instance.project_id, member_count=-1)
+
+
+# Signal : invalidation du cache de réponses (voir sharetech/cache.py)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_project_cache(sender, **kwargs):
+    """Incrémente la version de cache du modèle modifié"""
+    bump_cache_version(sender)
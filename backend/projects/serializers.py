@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import Project, ProjectMember
+from notes.serializers import NoteSerializer
+from sharetech.fieldsets import SparseFieldsetSerializerMixin
 
 
 class ProjectMemberSerializer(serializers.ModelSerializer):
@@ -22,28 +24,29 @@ class ProjectMemberSerializer(serializers.ModelSerializer):
         return f"{obj.user.first_name} {obj.user.last_name}".strip() or obj.user.username
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer pour la liste des projets (vue simplifiée)
     """
     created_by_username = serializers.CharField(source='created_by.username', read_only=True)
-    member_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Project
+        # Compteurs dénormalisés (projects/counters.py) : aucun COUNT par projet
         fields = [
             'id', 'name', 'description', 'is_active',
             'created_by', 'created_by_username', 'member_count',
-            'created_at', 'updated_at'
+            'note_count', 'open_task_count', 'done_task_count',
+            'created_at', 'updated_at', 'last_activity_at'
         ]
         read_only_fields = ['created_by', 'created_at', 'updated_at']
-    
-    def get_member_count(self, obj):
-        """Compte le nombre de membres du projet"""
-        return obj.members.count()
+        # ?expand= (voir sharetech/fieldsets.py)
+        expandable_fields = {
+            'created_by': ('accounts.serializers.UserSerializer', ['created_by__profile']),
+        }
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer pour le détail d'un projet (vue complète)
     Inclut la liste des membres
@@ -57,9 +60,16 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'description', 'is_active',
             'created_by', 'created_by_username', 'created_by_full_name',
-            'members', 'created_at', 'updated_at'
+            'members', 'member_count', 'note_count', 'open_task_count', 'done_task_count',
+            'created_at', 'updated_at', 'last_activity_at'
         ]
         read_only_fields = ['created_by', 'created_at', 'updated_at']
+        # ?fields= / ?expand= (voir sharetech/fieldsets.py)
+        expandable_fields = ProjectListSerializer.Meta.expandable_fields
+        field_requirements = {
+            'created_by_full_name': ['created_by__username', 'created_by__first_name', 'created_by__last_name'],
+            'members': ['members__user__profile'],
+        }
     
     def get_created_by_full_name(self, obj):
         """Retourne le nom complet du créateur"""
@@ -94,4 +104,15 @@ class AddMemberSerializer(serializers.Serializer):
             User.objects.get(id=value)
         except User.DoesNotExist:
             raise serializers.ValidationError("Cet utilisateur n'existe pas")
-        return value
\ No newline at end of file
+        return value
+
+
+class OverviewNoteSerializer(NoteSerializer):
+    """
+    Note dans l'overview d'un projet, avec son nombre de commentaires
+    (annotation comment_count de la requête)
+    """
+    comment_count = serializers.IntegerField(read_only=True)
+    
+    class Meta(NoteSerializer.Meta):
+        fields = NoteSerializer.Meta.fields + ['comment_count']
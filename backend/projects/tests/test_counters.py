@@ -0,0 +1,171 @@
+# backend/projects/tests/test_counters.py
+"""
+Tests des compteurs dénormalisés de Project (projects/counters.py)
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from notes.models import Note
+from projects.counters import reconcile_counters
+from projects.models import Project, ProjectMember
+from tasks.models import Task
+
+
+def counters(project):
+    """(membres, notes, tâches ouvertes, tâches terminées) lus en base"""
+    project.refresh_from_db()
+    return (project.member_count, project.note_count, project.open_task_count, project.done_task_count)
+
+
+@pytest.mark.django_db
+def test_members_and_notes_are_counted(project_with_members, junior_user):
+    """
+    Test : Ajout / retrait de membres et de notes → compteurs à jour
+    """
+    # ARRANGE
+    project = project_with_members
+
+    # ACT
+    note = Note.objects.create(title='N', content='x', project=project, author=junior_user)
+    Note.objects.create(title='N2', content='x', project=project, author=junior_user)
+    note.delete()
+    ProjectMember.objects.get(project=project, user=junior_user).delete()
+
+    # ASSERT
+    assert counters(project) == (1, 1, 0, 0)
+
+
+@pytest.mark.django_db
+def test_task_status_change_moves_counter(sample_project, lead_user):
+    """
+    Test : Une tâche passe de « ouverte » à « terminée » puis est supprimée
+    """
+    # ARRANGE
+    task = Task.objects.create(title='T', project=sample_project, created_by=lead_user)
+    Task.objects.create(title='T2', project=sample_project, created_by=lead_user)
+    assert counters(sample_project) == (0, 0, 2, 0)
+
+    # ACT & ASSERT
+    task.status = 'terminee'
+    task.save()
+    assert counters(sample_project) == (0, 0, 1, 1)
+
+    Task.objects.get(pk=task.pk).delete()
+    assert counters(sample_project) == (0, 0, 1, 0)
+
+
+@pytest.mark.django_db
+def test_task_moved_to_other_project(sample_project, active_project, lead_user):
+    """
+    Test : Tâche déplacée d'un projet à l'autre → décrément / incrément
+    """
+    # ARRANGE
+    task = Task.objects.create(title='T', project=sample_project, created_by=lead_user, status='terminee')
+
+    # ACT
+    task.project = active_project
+    task.save()
+
+    # ASSERT
+    assert counters(sample_project) == (0, 0, 0, 0)
+    assert counters(active_project) == (0, 0, 0, 1)
+
+
+@pytest.mark.django_db
+def test_project_save_does_not_overwrite_counters(sample_project, lead_user):
+    """
+    Test : save() d'une instance chargée avant une création de tâche
+    ne remet pas le compteur à sa valeur périmée
+    """
+    # ARRANGE
+    stale = Project.objects.get(pk=sample_project.pk)
+    Task.objects.create(title='T', project=sample_project, created_by=lead_user)
+
+    # ACT
+    stale.name = 'Renommé'
+    stale.save()
+
+    # ASSERT
+    assert counters(sample_project) == (0, 0, 1, 0)
+    assert sample_project.name == 'Renommé'
+
+
+@pytest.mark.django_db
+def test_reconcile_repairs_drift(project_with_members, lead_user):
+    """
+    Test : Écritures hors signaux (queryset.update) → reconcile_counters corrige
+    """
+    # ARRANGE
+    project = project_with_members
+    Task.objects.create(title='T', project=project, created_by=lead_user)
+    Task.objects.filter(project=project).update(status='terminee')
+    Project.objects.filter(pk=project.pk).update(member_count=7)
+
+    # ACT
+    dry_run = reconcile_counters(dry_run=True)
+    drift = reconcile_counters()
+
+    # ASSERT
+    assert dry_run == drift == {project.pk: {
+        'member_count': (7, 2), 'open_task_count': (1, 0), 'done_task_count': (0, 1),
+    }}
+    assert counters(project) == (2, 0, 0, 1)
+    assert reconcile_counters() == {}
+
+
+@pytest.mark.django_db
+def test_reconcile_counters_command(sample_project):
+    """
+    Test : La commande affiche les écarts et n'écrit rien en --dry-run
+    """
+    # ARRANGE
+    Project.objects.filter(pk=sample_project.pk).update(note_count=3)
+    out = StringIO()
+
+    # ACT
+    call_command('reconcile_counters', '--project', str(sample_project.pk), '--dry-run', stdout=out)
+
+    # ASSERT
+    assert f'Projet {sample_project.pk} : note_count 3 → 0' in out.getvalue()
+    assert counters(sample_project)[1] == 3
+
+
+@pytest.mark.django_db
+def test_project_list_uses_stored_counters(authenticated_junior_client, project_with_members, junior_user):
+    """
+    Test : La liste affiche les compteurs sans requête par projet
+    """
+    # ARRANGE
+    Note.objects.create(title='N', content='x', project=project_with_members, author=junior_user)
+
+    # ACT
+    response = authenticated_junior_client.get('/api/projects/')
+
+    # ASSERT
+    project = response.data['results'][0] if 'results' in response.data else response.data[0]
+    assert project['member_count'] == 2
+    assert project['note_count'] == 1
+
+
+@pytest.mark.django_db
+def test_project_etag_changes_when_task_is_created(
+    authenticated_junior_client, project_with_members, lead_user, django_capture_on_commit_callbacks
+):
+    """
+    Test : Une nouvelle tâche change l'ETag du détail du projet (compteurs)
+    """
+    # ARRANGE
+    url = f'/api/projects/{project_with_members.id}/'
+    etag = authenticated_junior_client.get(url)['ETag']
+
+    # ACT
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        Task.objects.create(title='T', project=project_with_members, created_by=lead_user)
+    response = authenticated_junior_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.data['open_task_count'] == 1
@@ -0,0 +1,146 @@
+# backend/projects/tests/test_export.py
+"""
+Tests de GET /api/projects/{id}/export/ (projects/exports.py)
+"""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from comments.models import Comment
+from notes.models import Note, NoteTag
+from tags.registry import tag_registry
+from tasks.models import Task
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+
+@pytest.fixture
+def project_content(project_with_members, junior_user, lead_user, python_tag):
+    """Projet avec 3 notes (une taguée et commentée) et une tâche"""
+    notes = [
+        Note.objects.create(title=f'N{i}', content='x', project=project_with_members, author=junior_user)
+        for i in range(3)
+    ]
+    NoteTag.objects.create(note=notes[0], tag=python_tag)
+    root = Comment.objects.create(content='c', note=notes[0], author=lead_user)
+    Comment.objects.create(content='r', note=notes[0], author=junior_user, parent_comment=root)
+    Task.objects.create(
+        title='T', project=project_with_members, created_by=lead_user, estimated_hours='1.50'
+    )
+    return project_with_members
+
+
+@pytest.mark.django_db
+def test_ndjson_export_streams_all_resources(authenticated_junior_client, project_content):
+    """
+    Test : NDJSON avec notes, tâches puis commentaires, typés
+    """
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{project_content.id}/export/')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/x-ndjson'
+    rows = read_ndjson(response)
+    assert [row['type'] for row in rows] == ['note'] * 3 + ['task'] + ['comment'] * 2
+    assert rows[0]['tags'] == ['python']
+    assert rows[0]['author'] == 'juniortest'
+    assert rows[3]['estimated_hours'] == '1.50'
+    assert rows[5]['parent_comment'] == rows[4]['id']
+
+
+@pytest.mark.django_db
+def test_csv_export_of_one_resource(authenticated_junior_client, project_content):
+    """
+    Test : CSV d'une ressource, en-tête puis une ligne par tâche
+    """
+    # ACT
+    response = authenticated_junior_client.get(
+        f'/api/projects/{project_content.id}/export/?export_format=csv&resource=tasks'
+    )
+
+    # ASSERT
+    assert 'project-' in response['Content-Disposition']
+    rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+    assert len(rows) == 1
+    assert rows[0]['title'] == 'T'
+    assert rows[0]['assigned_to'] == ''
+
+
+@pytest.mark.django_db
+def test_export_reads_rows_in_chunks(
+    authenticated_junior_client, project_content, settings, django_assert_num_queries
+):
+    """
+    Test : Une requête par lot de EXPORT_CHUNK_SIZE notes (+ une pour leurs tags)
+    """
+    # ARRANGE
+    settings.EXPORT_CHUNK_SIZE = 2
+    tag_registry.all_data()  # Charge le registre des tags
+    response = authenticated_junior_client.get(f'/api/projects/{project_content.id}/export/?resource=notes')
+
+    # ACT & ASSERT
+    with django_assert_num_queries(5):  # 2 lots (+ tags) et le lot vide final
+        rows = read_ndjson(response)
+    assert [row['title'] for row in rows] == ['N0', 'N1', 'N2']
+
+
+@pytest.mark.django_db
+def test_export_streams_chunk_by_chunk_under_asgi(junior_user, project_content, settings):
+    """
+    Test : Sous ASGI, réponse async envoyée lot par lot (même compressée), pas consommée d'un bloc
+    """
+    # ARRANGE
+    settings.EXPORT_CHUNK_SIZE = 2
+    client = AsyncClient()
+    client.force_login(junior_user)
+    url = f'/api/projects/{project_content.id}/export/?resource=notes'
+
+    async def fetch(**headers):
+        response = await client.get(url, **headers)
+        return response, [chunk async for chunk in response.streaming_content]
+
+    # ACT
+    plain, chunks = async_to_sync(fetch)()
+    compressed, gzip_chunks = async_to_sync(fetch)(headers={'Accept-Encoding': 'gzip'})
+
+    # ASSERT
+    assert plain.is_async and compressed.is_async
+    assert len(chunks) == 2  # Un morceau par lot de 2 notes
+    assert [json.loads(line)['title'] for line in b''.join(chunks).splitlines()] == ['N0', 'N1', 'N2']
+    assert compressed['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(b''.join(gzip_chunks)) == b''.join(chunks)
+
+
+@pytest.mark.django_db
+def test_export_rejects_invalid_parameters(authenticated_junior_client, project_content):
+    """
+    Test : Format ou ressource inconnus, CSV de plusieurs ressources → 400
+    """
+    # ARRANGE
+    url = f'/api/projects/{project_content.id}/export/'
+
+    # ACT & ASSERT
+    assert authenticated_junior_client.get(url + '?export_format=xml').status_code == 400
+    assert authenticated_junior_client.get(url + '?resource=secrets').status_code == 400
+    assert authenticated_junior_client.get(url + '?export_format=csv').status_code == 400
+
+
+@pytest.mark.django_db
+def test_export_of_hidden_project_is_404(authenticated_junior_client, sample_project):
+    """
+    Test : Projet dont l'utilisateur n'est pas membre → 404
+    """
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{sample_project.id}/export/')
+
+    # ASSERT
+    assert response.status_code == 404
@@ -0,0 +1,153 @@
+# backend/projects/tests/test_overview.py
+"""
+Tests de GET /api/projects/{id}/overview/
+"""
+
+import datetime
+
+import pytest
+
+from comments.models import Comment
+from notes.models import Note, NoteTag
+from tasks.models import Task, TaskTag
+
+
+def create_notes(project, author, count):
+    """Crée count notes avec chacune un commentaire"""
+    for i in range(count):
+        note = Note.objects.create(title=f'Note {i}', content='x', project=project, author=author)
+        Comment.objects.create(content='c', note=note, author=author)
+
+
+def create_tasks(project, author, count):
+    """Crée count tâches assignées à author"""
+    for i in range(count):
+        Task.objects.create(title=f'Tâche {i}', project=project, created_by=author, assigned_to=author)
+
+
+@pytest.mark.django_db
+def test_overview_returns_all_sections(
+    authenticated_junior_client, project_with_members, junior_user, lead_user, python_tag, django_tag
+):
+    """
+    Test : L'overview contient projet, membres, notes (avec commentaires),
+    résumé des tâches et tags
+    """
+    # ARRANGE
+    project = project_with_members
+    note = Note.objects.create(title='N', content='x', project=project, author=junior_user)
+    Comment.objects.create(content='c1', note=note, author=junior_user)
+    Comment.objects.create(content='c2', note=note, author=lead_user)
+    NoteTag.objects.create(note=note, tag=python_tag)
+    task = Task.objects.create(
+        title='En retard', project=project, created_by=lead_user, priority='haute',
+        due_date=datetime.date(2000, 1, 1)
+    )
+    Task.objects.create(title='Finie', project=project, created_by=lead_user, status='terminee')
+    TaskTag.objects.create(task=task, tag=django_tag)
+
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{project.id}/overview/')
+
+    # ASSERT
+    assert response.status_code == 200
+    data = response.data
+    assert data['project']['name'] == 'Test Project'
+    assert 'members' not in data['project']
+    assert {m['username'] for m in data['members']} == {'juniortest', 'seniortest'}
+    assert data['notes']['count'] == 1
+    assert data['notes']['results'][0]['comment_count'] == 2
+    assert data['tasks']['total'] == 2
+    assert data['tasks']['overdue'] == 1
+    assert data['tasks']['by_status'] == {'ouverte': 1, 'assignee': 0, 'terminee': 1}
+    assert data['tasks']['by_priority']['haute'] == 1
+    assert [t['title'] for t in data['task_list']] == ['Finie', 'En retard']
+    assert data['task_list'][1]['project_name'] == 'Test Project'
+    assert [t['name'] for t in data['tags']] == ['django', 'python']
+
+
+@pytest.mark.django_db
+def test_overview_query_count_does_not_grow_with_notes(
+    authenticated_junior_client, project_with_members, junior_user, django_assert_max_num_queries
+):
+    """
+    Test : Même nombre de requêtes SQL avec 2 ou 10 notes (et tâches)
+    """
+    # ARRANGE
+    url = f'/api/projects/{project_with_members.id}/overview/'
+    create_notes(project_with_members, junior_user, 2)
+    create_tasks(project_with_members, junior_user, 2)
+    authenticated_junior_client.get(url)  # Charge le registre des tags
+
+    # ACT & ASSERT
+    with django_assert_max_num_queries(7) as small:
+        authenticated_junior_client.get(url)
+    create_notes(project_with_members, junior_user, 8)
+    create_tasks(project_with_members, junior_user, 8)
+    with django_assert_max_num_queries(7) as large:
+        response = authenticated_junior_client.get(url)
+    assert len(small.captured_queries) == len(large.captured_queries)
+    assert response.data['notes']['count'] == 10
+    assert len(response.data['task_list']) == 10
+
+
+@pytest.mark.django_db
+def test_overview_field_selection_skips_sections(
+    authenticated_junior_client, project_with_members, django_assert_num_queries
+):
+    """
+    Test : ?fields=project,tasks ne renvoie (et ne calcule) que ces sections
+    """
+    # ACT
+    with django_assert_num_queries(2):  # Projet + résumé des tâches
+        response = authenticated_junior_client.get(
+            f'/api/projects/{project_with_members.id}/overview/?fields=project,tasks'
+        )
+
+    # ASSERT
+    assert set(response.data) == {'project', 'tasks'}
+
+
+@pytest.mark.django_db
+def test_overview_paginates_notes(authenticated_junior_client, project_with_members, junior_user):
+    """
+    Test : Les notes sont paginées (?page, ?page_size)
+    """
+    # ARRANGE
+    create_notes(project_with_members, junior_user, 3)
+
+    # ACT
+    response = authenticated_junior_client.get(
+        f'/api/projects/{project_with_members.id}/overview/?fields=notes&page=2&page_size=2'
+    )
+
+    # ASSERT
+    assert response.data['notes']['count'] == 3
+    assert len(response.data['notes']['results']) == 1
+    assert response.data['notes']['next'] is None
+
+
+@pytest.mark.django_db
+def test_overview_rejects_unknown_fields(authenticated_junior_client, project_with_members):
+    """
+    Test : Section inconnue → 400
+    """
+    # ACT
+    response = authenticated_junior_client.get(
+        f'/api/projects/{project_with_members.id}/overview/?fields=project,secrets'
+    )
+
+    # ASSERT
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_overview_of_hidden_project_is_404(authenticated_junior_client, sample_project):
+    """
+    Test : Projet dont l'utilisateur n'est pas membre → 404
+    """
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{sample_project.id}/overview/')
+
+    # ASSERT
+    assert response.status_code == 404
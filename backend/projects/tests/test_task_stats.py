@@ -0,0 +1,195 @@
+# backend/projects/tests/test_task_stats.py
+"""
+Tests de GET /api/projects/{id}/task_stats/ et des agrégats quotidiens
+des tâches (tasks/rollups.py)
+"""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tasks.models import Task, TaskDailyRollup
+from tasks.rollups import rebuild_rollups
+
+
+def rollup_rows(project):
+    """Lignes d'agrégats du projet : {jour: (créées, terminées)}"""
+    return {
+        row.day: (row.created_count, row.done_count)
+        for row in TaskDailyRollup.objects.filter(project=project)
+    }
+
+
+@pytest.mark.django_db
+def test_task_stats_counts_and_hours(authenticated_junior_client, project_with_members, lead_user):
+    """
+    Test : Compteurs par statut / priorité, retards et heures
+    """
+    # ARRANGE
+    project = project_with_members
+    Task.objects.create(
+        title='En retard', project=project, created_by=lead_user, priority='haute',
+        estimated_hours='4.00', due_date=datetime.date(2000, 1, 1)
+    )
+    Task.objects.create(
+        title='Finie', project=project, created_by=lead_user, status='terminee',
+        estimated_hours='2.50', actual_hours='3.00', completed_date=timezone.localdate()
+    )
+
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{project.id}/task_stats/')
+
+    # ASSERT
+    assert response.status_code == 200
+    data = response.data
+    assert data['total'] == 2
+    assert data['overdue'] == 1
+    assert data['by_status'] == {'ouverte': 1, 'assignee': 0, 'terminee': 1}
+    assert data['by_priority']['haute'] == 1
+    assert data['hours'] == {
+        'estimated': Decimal('6.50'), 'actual': Decimal('3.00'),
+        'done_estimated': Decimal('2.50'), 'done_actual': Decimal('3.00'),
+        'remaining_estimated': Decimal('4.00'),
+    }
+
+
+@pytest.mark.django_db
+def test_burndown_series(authenticated_junior_client, project_with_members, lead_user):
+    """
+    Test : Le reste à faire cumule les jours antérieurs à la période
+    """
+    # ARRANGE
+    project = project_with_members
+    today = timezone.localdate()
+    old = Task.objects.create(title='Ancienne', project=project, created_by=lead_user, estimated_hours='5.00')
+    old.created_at = timezone.now() - datetime.timedelta(days=40)
+    old.save()
+    Task.objects.create(title='A', project=project, created_by=lead_user, estimated_hours='1.00')
+    Task.objects.create(
+        title='B', project=project, created_by=lead_user, status='terminee',
+        estimated_hours='2.00', completed_date=today
+    )
+
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{project.id}/task_stats/?days=7')
+
+    # ASSERT
+    series = response.data['burndown']
+    assert len(series) == 7
+    assert series[0]['date'] == today - datetime.timedelta(days=6)
+    assert series[0]['remaining'] == 1
+    assert series[-1] == {
+        'date': today, 'created': 2, 'done': 1,
+        'remaining': 2, 'remaining_estimated_hours': Decimal('6.00'),
+    }
+
+
+@pytest.mark.django_db
+def test_rollups_follow_task_changes(sample_project, lead_user):
+    """
+    Test : Création, complétion et suppression recalculent les jours touchés
+    (les lignes vidées sont remises à zéro, pas supprimées)
+    """
+    # ARRANGE
+    today = timezone.localdate()
+    yesterday = today - datetime.timedelta(days=1)
+    task = Task.objects.create(title='T', project=sample_project, created_by=lead_user)
+
+    # ACT & ASSERT
+    task.status = 'terminee'
+    task.completed_date = yesterday
+    task.save()
+    assert rollup_rows(sample_project) == {today: (1, 0), yesterday: (0, 1)}
+
+    task.completed_date = today
+    task.save()
+    assert rollup_rows(sample_project) == {today: (1, 1), yesterday: (0, 0)}
+
+    Task.objects.get(pk=task.pk).delete()
+    assert rollup_rows(sample_project) == {today: (0, 0), yesterday: (0, 0)}
+
+
+@pytest.mark.django_db
+def test_task_save_applies_rollup_delta_without_scanning_tasks(sample_project, lead_user):
+    """
+    Test : Une écriture de tâche applique l'écart de sa contribution
+    (UPDATE des lignes touchées), sans GROUP BY sur les tâches du projet
+    """
+    # ARRANGE
+    today = timezone.localdate()
+    for _ in range(3):
+        Task.objects.create(title='T', project=sample_project, created_by=lead_user, estimated_hours='1.00')
+    task = Task.objects.filter(project=sample_project).first()
+
+    # ACT
+    with CaptureQueriesContext(connection) as queries:
+        task.status = 'terminee'
+        task.completed_date = today
+        task.actual_hours = '2.50'
+        task.save()
+        task.estimated_hours = '3.00'
+        task.save()
+
+    # ASSERT
+    assert not any('GROUP BY' in query['sql'] for query in queries.captured_queries)
+    rollup = TaskDailyRollup.objects.get(project=sample_project, day=today)
+    assert (rollup.created_count, rollup.done_count) == (3, 1)
+    assert rollup.created_estimated_hours == Decimal('5.00')
+    assert (rollup.done_estimated_hours, rollup.done_actual_hours) == (Decimal('3.00'), Decimal('2.50'))
+
+
+@pytest.mark.django_db
+def test_rebuild_rollups_repairs_bypassed_writes(sample_project, lead_user):
+    """
+    Test : queryset.update contourne les signaux → rebuild_rollups corrige
+    """
+    # ARRANGE
+    today = timezone.localdate()
+    Task.objects.create(title='T', project=sample_project, created_by=lead_user)
+    Task.objects.filter(project=sample_project).update(status='terminee', completed_date=today)
+    assert rollup_rows(sample_project) == {today: (1, 0)}
+
+    # ACT
+    rebuild_rollups([sample_project.pk])
+
+    # ASSERT
+    assert rollup_rows(sample_project) == {today: (1, 1)}
+
+
+@pytest.mark.django_db
+def test_task_stats_is_cached_until_a_task_changes(
+    authenticated_junior_client, project_with_members, lead_user, django_assert_num_queries,
+    django_capture_on_commit_callbacks
+):
+    """
+    Test : Second appel servi par le cache, invalidé par une nouvelle tâche
+    """
+    # ARRANGE
+    url = f'/api/projects/{project_with_members.id}/task_stats/'
+    authenticated_junior_client.get(url)
+
+    # ACT
+    with django_assert_num_queries(0):
+        authenticated_junior_client.get(url)
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        Task.objects.create(title='T', project=project_with_members, created_by=lead_user)
+    response = authenticated_junior_client.get(url)
+
+    # ASSERT
+    assert response.data['total'] == 1
+
+
+@pytest.mark.django_db
+def test_task_stats_rejects_invalid_days(authenticated_junior_client, project_with_members):
+    """
+    Test : ?days hors bornes → 400
+    """
+    # ACT
+    response = authenticated_junior_client.get(f'/api/projects/{project_with_members.id}/task_stats/?days=0')
+
+    # ASSERT
+    assert response.status_code == 400
@@ -1,5 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+
+from . import async_views
 from .views import ProjectViewSet
 
 # Router DRF pour générer automatiquement les URLs CRUD
@@ -8,4 +10,6 @@ router.register(r'projects', ProjectViewSet, basename='project')
 
 urlpatterns = [
     path('', include(router.urls)),
+    # Version async (ASGI) d'une lecture lourde
+    path('async/projects/<int:pk>/', async_views.project_detail, name='project-detail-async'),
 ]
\ No newline at end of file
@@ -1,10 +1,16 @@
+import datetime
+from decimal import Decimal
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth.models import User
 from django.db import IntegrityError
-from django.db.models import Q 
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
 
 from .models import Project, ProjectMember
 from .serializers import (
@@ -12,31 +18,79 @@ from .serializers import (
     ProjectDetailSerializer,
     ProjectCreateSerializer,
     ProjectMemberSerializer,
-    AddMemberSerializer
+    AddMemberSerializer,
 )
 from accounts.permissions import IsLeadOrAdmin
+from sharetech.cache import CachedResponseMixin
+from sharetech.conditional import ConditionalGetMixin
+from sharetech.fieldsets import SparseFieldsetMixin
+from sharetech.streaming import streaming_response
+
+
+def visible_projects(user):
+    """Projets visibles par l'utilisateur : membre ou créateur (tous pour le superuser)"""
+    if user.is_superuser:
+        return Project.objects.all()
+    
+    return Project.objects.filter(
+        Q(members__user=user) | Q(created_by=user)
+    ).distinct()
+
 
+class OverviewNotePagination(PageNumberPagination):
+    """Pagination des notes de l'overview (?page=2&page_size=50)"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
 
-class ProjectViewSet(viewsets.ModelViewSet):
+
+class ProjectViewSet(SparseFieldsetMixin, CachedResponseMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet pour gérer les projets
     - Liste/Détail
     - Création
     - Modification
     - Suppression
+    
+    Liste et détail supportent If-None-Match / If-Modified-Since (304),
+    validés par last_activity_at (membres, notes et tâches comprises)
+    Le détail est mis en cache par utilisateur (voir sharetech/cache.py)
+    Liste et détail : ?fields= et ?expand=created_by (voir sharetech/fieldsets.py)
     """
     permission_classes = [IsAuthenticated]
     
+    # Throttling : le détail charge les membres, il coûte plus cher
+    throttle_scope = 'projects'
+    throttle_costs = {'retrieve': 2, 'members': 2, 'overview': 4, 'task_stats': 3, 'activity': 2, 'export': 10}
+    
+    # Cache de réponses : le détail affiche les membres et les compteurs de notes / tâches
+    cache_actions = ('retrieve', 'task_stats')
+    cache_dependencies = (
+        'projects.project', 'projects.projectmember', 'notes.note', 'tasks.task'
+    )
+    
+    # Compteurs mis à jour par UPDATE (sans toucher updated_at)
+    conditional_last_modified_field = 'last_activity_at'
+    
+    # Sections de GET /api/projects/{id}/overview/ (sélection par ?fields=)
+    overview_sections = ('project', 'members', 'notes', 'tasks', 'task_list', 'tags')
+    
+    # Période de task_stats (burndown) et activity (?days=)
+    period_days = 30
+    max_period_days = 366
+    
     def get_queryset(self):
-        user = self.request.user
-        
-        # Superuser voit tout
-        if user.is_superuser:
-            return Project.objects.all()
-        
-        return Project.objects.filter(
-            Q(members__user=user) | Q(created_by=user)
-        ).distinct()
+        queryset = visible_projects(self.request.user)
+        if self.action in ['list', 'retrieve', 'overview']:
+            queryset = queryset.select_related('created_by')
+        return queryset
+    
+    def get_response_cache_key(self, request):
+        key = super().get_response_cache_key(request)
+        if self.action == 'task_stats':
+            # La série du burndown s'arrête à aujourd'hui
+            key += '_' + timezone.localdate().isoformat()
+        return key
     
     def get_serializer_class(self):
         """
@@ -165,4 +219,253 @@ class ProjectViewSet(viewsets.ModelViewSet):
         project = self.get_object()
         members = project.members.all()
         serializer = ProjectMemberSerializer(members, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+    
+    @action(detail=True, methods=['get'])
+    def overview(self, request, pk=None):
+        """
+        Tout ce qu'affiche la page d'un projet, en une seule requête HTTP
+        
+        GET /api/projects/{id}/overview/
+        GET /api/projects/{id}/overview/?fields=project,notes&page=2&page_size=50
+        
+        - project : détail du projet (sans les membres)
+        - members : membres du projet
+        - notes   : notes paginées, avec leur nombre de commentaires
+        - tasks   : nombre de tâches par statut / priorité, tâches en retard
+        - task_list : tâches du projet (comme GET /api/tasks/?project=)
+        - tags    : tags utilisés par les notes et les tâches du projet
+        
+        Nombre de requêtes SQL fixe (une par section, deux pour les notes),
+        quel que soit le nombre de notes, de commentaires ou de tâches
+        """
+        sections = self.get_overview_sections(request)
+        project = self.get_object()
+        data = {}
+        
+        if 'project' in sections:
+            serializer = ProjectDetailSerializer(project)
+            del serializer.fields['members']  # Section dédiée
+            data['project'] = serializer.data
+        
+        if 'members' in sections:
+            members = project.members.select_related('user__profile')
+            data['members'] = ProjectMemberSerializer(members, many=True).data
+        
+        if 'notes' in sections:
+            data['notes'] = self.get_overview_notes(request, project)
+        
+        if 'tasks' in sections:
+            data['tasks'] = self.get_task_summary(project)
+        
+        if 'task_list' in sections:
+            data['task_list'] = self.get_overview_task_list(project)
+        
+        if 'tags' in sections:
+            data['tags'] = self.get_project_tags(project)
+        
+        return Response(data)
+    
+    @action(detail=True, methods=['get'])
+    def task_stats(self, request, pk=None):
+        """
+        Statistiques des tâches d'un projet
+        
+        GET /api/projects/{id}/task_stats/
+        GET /api/projects/{id}/task_stats/?days=90
+        
+        - total, overdue, by_status, by_priority : une requête GROUP BY
+        - hours : heures estimées / réelles (toutes, terminées, reste à faire)
+        - burndown : reste à faire jour par jour sur les `days` derniers jours,
+          lu dans les agrégats quotidiens (voir tasks/rollups.py)
+        
+        Réponse mise en cache jusqu'à la prochaine écriture d'une tâche
+        """
+        return self.cached_response(request, self.build_task_stats, pk=pk)
+    
+    def build_task_stats(self, request, pk=None):
+        from tasks.rollups import burndown
+        
+        days = self.get_period_days(request)
+        project = self.get_object()
+        
+        stats = self.get_task_summary(project, with_hours=True)
+        end = timezone.localdate()
+        start = end - datetime.timedelta(days=days - 1)
+        stats['burndown'] = burndown(project.pk, start, end)
+        return Response(stats)
+    
+    @action(detail=True, methods=['get'])
+    def activity(self, request, pk=None):
+        """
+        Activité quotidienne du projet sur les `days` derniers jours
+        
+        GET /api/projects/{id}/activity/?days=90
+        
+        Lue dans ProjectDailyStats (une ligne par jour actif, remplie par
+        la commande update_daily_stats) : notes créées, commentaires postés,
+        tâches terminées et heures réalisées. Les jours sans activité sont absents.
+        """
+        from analytics.models import ProjectDailyStats
+        from analytics.serializers import ProjectDailyStatsSerializer
+        
+        days = self.get_period_days(request)
+        project = self.get_object()
+        end = timezone.localdate()
+        start = end - datetime.timedelta(days=days - 1)
+        
+        stats = list(ProjectDailyStats.objects.filter(project=project, day__range=(start, end)))
+        totals = {
+            field: sum(getattr(row, field) for row in stats)
+            for field in ('notes_created', 'comments_posted', 'tasks_completed', 'hours_logged')
+        }
+        return Response({
+            'start': start,
+            'end': end,
+            'totals': totals,
+            'series': ProjectDailyStatsSerializer(stats, many=True).data,
+        })
+    
+    @action(detail=True, methods=['get'])
+    def export(self, request, pk=None):
+        """
+        Export du projet en streaming (voir projects/exports.py)
+        
+        GET /api/projects/{id}/export/                          NDJSON : notes, tâches, commentaires
+        GET /api/projects/{id}/export/?resource=notes,tasks     NDJSON : ressources choisies
+        GET /api/projects/{id}/export/?export_format=csv&resource=tasks   CSV : une seule ressource
+        
+        (?export_format et non ?format, réservé par DRF au choix du renderer)
+        """
+        from .exports import EXPORT_RESOURCES, stream_csv, stream_ndjson
+        
+        export_format = request.query_params.get('export_format', 'ndjson')
+        if export_format not in ('ndjson', 'csv'):
+            raise ValidationError({'export_format': "Valeurs possibles : ndjson, csv"})
+        
+        resources = [
+            name.strip() for name in request.query_params.get('resource', '').split(',') if name.strip()
+        ] or list(EXPORT_RESOURCES)
+        unknown = set(resources) - set(EXPORT_RESOURCES)
+        if unknown:
+            raise ValidationError({
+                'resource': f"Ressources inconnues : {', '.join(sorted(unknown))}. "
+                            f"Valeurs possibles : {', '.join(EXPORT_RESOURCES)}"
+            })
+        if export_format == 'csv' and len(resources) != 1:
+            raise ValidationError({'resource': "Une seule ressource par export CSV"})
+        
+        project = self.get_object()
+        if export_format == 'csv':
+            response = streaming_response(request, stream_csv(project, resources[0]), 'text/csv')
+            filename = f'project-{project.pk}-{resources[0]}.csv'
+        else:
+            response = streaming_response(request, stream_ndjson(project, resources), 'application/x-ndjson')
+            filename = f'project-{project.pk}.ndjson'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+    
+    def get_period_days(self, request):
+        """Nombre de jours de la période (?days=, borné à max_period_days)"""
+        days = request.query_params.get('days')
+        if days is None:
+            return self.period_days
+        try:
+            days = int(days)
+        except ValueError:
+            days = 0
+        if not 1 <= days <= self.max_period_days:
+            raise ValidationError({
+                'days': f"Entier entre 1 et {self.max_period_days} attendu"
+            })
+        return days
+    
+    def get_overview_sections(self, request):
+        """Sections demandées par ?fields= (toutes par défaut)"""
+        fields = request.query_params.get('fields')
+        if not fields:
+            return set(self.overview_sections)
+        
+        sections = {field.strip() for field in fields.split(',') if field.strip()}
+        unknown = sections - set(self.overview_sections)
+        if unknown:
+            raise ValidationError({
+                'fields': f"Sections inconnues : {', '.join(sorted(unknown))}. "
+                          f"Valeurs possibles : {', '.join(self.overview_sections)}"
+            })
+        return sections
+    
+    def get_overview_notes(self, request, project):
+        """Page de notes + statistiques de commentaires (COUNT puis page annotée)"""
+        from notes.models import Note
+        from notes.serializers import NoteListSerializer
+        from notes.views import annotate_comment_stats
+        
+        notes = annotate_comment_stats(
+            Note.objects.filter(project=project).select_related('author', 'project').defer('content')
+        ).order_by('-created_at', '-id')
+        
+        paginator = OverviewNotePagination()
+        page = paginator.paginate_queryset(notes, request, view=self)
+        serializer = NoteListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data).data
+    
+    def get_overview_task_list(self, project):
+        """Tâches du projet, une requête (values_list, voir sharetech/fastpath.py)"""
+        from tasks.models import Task
+        from tasks.serializers import TaskSerializer
+        
+        return TaskSerializer(Task.objects.filter(project=project), many=True).data
+    
+    def get_task_summary(self, project, with_hours=False):
+        """Compteurs (et heures) des tâches du projet en une requête GROUP BY"""
+        from projects.counters import DONE_TASK_STATUSES
+        from tasks.models import Task
+        
+        aggregates = {
+            'total': Count('id'),
+            'overdue': Count('id', filter=Q(due_date__lt=timezone.now().date()) & ~Q(status='terminee')),
+        }
+        if with_hours:
+            aggregates['estimated'] = Sum('estimated_hours')
+            aggregates['actual'] = Sum('actual_hours')
+        rows = Task.objects.filter(project=project).values('status', 'priority').annotate(
+            **aggregates
+        ).order_by()
+        
+        summary = {
+            'total': 0,
+            'overdue': 0,
+            'by_status': {value: 0 for value, _ in Task.STATUS_CHOICES},
+            'by_priority': {value: 0 for value, _ in Task.PRIORITY_CHOICES},
+        }
+        hours = dict.fromkeys(('estimated', 'actual', 'done_estimated', 'done_actual'), Decimal('0.00'))
+        for row in rows:
+            summary['total'] += row['total']
+            summary['overdue'] += row['overdue']
+            summary['by_status'][row['status']] += row['total']
+            summary['by_priority'][row['priority']] += row['total']
+            if with_hours:
+                done = row['status'] in DONE_TASK_STATUSES
+                for field in ('estimated', 'actual'):
+                    value = row[field] or 0
+                    hours[field] += value
+                    if done:
+                        hours[f'done_{field}'] += value
+        
+        if with_hours:
+            hours['remaining_estimated'] = hours['estimated'] - hours['done_estimated']
+            summary['hours'] = hours
+        return summary
+    
+    def get_project_tags(self, project):
+        """Tags des notes et tâches du projet (ids en une requête UNION, données du registre)"""
+        from notes.models import NoteTag
+        from tags.registry import tag_registry
+        from tasks.models import TaskTag
+        
+        tag_ids = NoteTag.objects.filter(note__project=project).values_list('tag_id', flat=True).union(
+            TaskTag.objects.filter(task__project=project).values_list('tag_id', flat=True)
+        )
+        tags = [tag_registry.get_data(tag_id) for tag_id in tag_ids]
+        return sorted((tag for tag in tags if tag), key=lambda tag: tag['name'])
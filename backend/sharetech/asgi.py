@@ -9,8 +9,14 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sharetech.settings')
 
-application = get_asgi_application()
+# Comme get_asgi_application(), avec des threads synchrones réutilisés
+# (connexions DB persistantes, voir sharetech/handlers.py)
+django.setup(set_prefix=False)
+
+from sharetech.handlers import PooledASGIHandler  # noqa: E402
+
+application = PooledASGIHandler()
@@ -0,0 +1,161 @@
+# backend/sharetech/async_api.py
+"""
+Vues API asynchrones (lectures lourdes servies sous ASGI)
+
+Sous ASGI, une vue async ne bloque pas son worker pendant les requêtes SQL :
+un seul worker sert de nombreuses requêtes lentes en parallèle.
+
+- async_api_view : authentification (session), throttling par coût,
+  404 / 405 et rendu JSON (renderers.dumps), comme les ViewSets DRF
+- run_queries : exécute des requêtes indépendantes EN MÊME TEMPS
+
+Pourquoi pas l'ORM async de Django (aget, alist...) ? En Django 5.0 il passe
+par sync_to_async(thread_sensitive=True) : toutes les requêtes d'une vue
+s'exécutent l'une après l'autre dans le même thread. run_queries utilise
+un pool de ASYNC_QUERY_THREADS threads ; chacun a son propre contexte et
+donc sa propre connexion DB (une connexion ne se partage pas entre threads).
+Ces threads vivent aussi longtemps que le process et gardent leur connexion
+(DB_CONN_MAX_AGE), comme les threads des requêtes (voir sharetech/handlers.py).
+"""
+
+import asyncio
+import contextvars
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import close_old_connections
+from django.http import Http404, HttpResponse, JsonResponse
+from rest_framework import exceptions
+from rest_framework.settings import api_settings
+
+from .db.routers import get_read_alias, use_read_alias
+from .renderers import dumps
+
+
+# ===== REQUÊTES SQL CONCURRENTES =====
+
+_executor = None
+_executor_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.ASYNC_QUERY_THREADS,
+                thread_name_prefix='async-query',
+            )
+        return _executor
+
+
+def _run_in_thread_context(func, read_alias):
+    # Contexte propre au thread (et non copié de la requête) : les connexions
+    # Django y sont rangées, le thread réutilise la sienne d'un appel à l'autre
+    if not hasattr(_thread_state, 'context'):
+        _thread_state.context = contextvars.Context()
+    return _thread_state.context.run(_run_query, func, read_alias)
+
+
+def _run_query(func, read_alias):
+    close_old_connections()
+    try:
+        # Même base de lecture que la requête (réplica choisi par le middleware)
+        with use_read_alias(read_alias):
+            return func()
+    finally:
+        close_old_connections()
+
+
+async def run_query(func):
+    """Exécute func() (code ORM synchrone) dans le pool de threads SQL"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), _run_in_thread_context, func, get_read_alias()
+    )
+
+
+async def run_queries(*funcs):
+    """
+    Exécute plusieurs fonctions ORM indépendantes en parallèle
+    Retourne leurs résultats dans l'ordre
+    """
+    return await asyncio.gather(*(run_query(func) for func in funcs))
+
+
+# ===== DÉCORATEUR DE VUE =====
+
+def error_response(exc):
+    """Réponse JSON d'une exception DRF (même format que le handler DRF)"""
+    response = JsonResponse({'detail': exc.detail}, status=exc.status_code)
+    if getattr(exc, 'wait', None):
+        response['Retry-After'] = '%d' % exc.wait
+    return response
+
+
+def check_throttles(request, view):
+    """
+    Applique DEFAULT_THROTTLE_CLASSES comme une vue DRF
+    Retourne None, ou le délai (secondes) avant la prochaine requête autorisée
+    """
+    waits = []
+    for throttle_class in api_settings.DEFAULT_THROTTLE_CLASSES:
+        throttle = throttle_class()
+        if not throttle.allow_request(request, view):
+            waits.append(throttle.wait())
+    return max(waits) if waits else None
+
+
+def async_api_view(throttle_scope=None, throttle_cost=1):
+    """
+    Décorateur des vues async en lecture seule (GET / HEAD)
+
+    La vue reçoit (request, user, *args) et retourne des données sérialisables
+    ou une HttpResponse. Http404 / DoesNotExist → 404.
+
+        @async_api_view(throttle_scope='notes', throttle_cost=3)
+        async def comment_tree(request, user, pk): ...
+    """
+    def decorator(view_func):
+        # Les throttles lisent throttle_scope / throttle_costs / action sur la vue
+        throttle_view = SimpleNamespace(
+            throttle_scope=throttle_scope,
+            throttle_costs={view_func.__name__: throttle_cost},
+            action=view_func.__name__,
+        )
+
+        @wraps(view_func)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return error_response(exceptions.MethodNotAllowed(request.method))
+
+            user = await request.auser()
+            if not user.is_authenticated:
+                # 403 comme DRF avec SessionAuthentication (pas d'en-tête WWW-Authenticate)
+                exc = exceptions.NotAuthenticated()
+                exc.status_code = 403
+                return error_response(exc)
+            request.user = user
+
+            wait = await sync_to_async(check_throttles)(request, throttle_view)
+            if wait is not None:
+                return error_response(exceptions.Throttled(math.ceil(wait)))
+
+            try:
+                data = await view_func(request, user, *args, **kwargs)
+            except (Http404, ObjectDoesNotExist):
+                return error_response(exceptions.NotFound())
+
+            if isinstance(data, HttpResponse):
+                return data
+            return HttpResponse(dumps(data), content_type='application/json')
+
+        return wrapper
+    return decorator
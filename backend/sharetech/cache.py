@@ -0,0 +1,199 @@
+# backend/sharetech/cache.py
+"""
+Cache de réponses pour les endpoints de lecture les plus sollicités
+
+Invalidation par "version keys" :
+- chaque modèle a un numéro de version dans le cache (cache_version_<label>)
+- les signaux post_save / post_delete incrémentent ce numéro, au commit de
+  la transaction d'écriture : avant, une lecture concurrente rangerait des
+  données pas encore commitées sous la nouvelle version
+- la clé d'une réponse en cache contient les versions de ses dépendances,
+  donc toute écriture rend les anciennes entrées inaccessibles (elles expirent seules)
+"""
+
+import hashlib
+import threading
+import time
+from collections import Counter
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+
+VERSION_KEY = 'cache_version_%s'
+HEALTH_KEY = 'cache_health_probe'
+
+# Compteurs du process (hits / misses du cache de réponses)
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def record_cache_event(name):
+    """Incrémente un compteur local (hit, miss, store...)"""
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def cache_stats():
+    """
+    Statistiques du cache : configuration, compteurs du process
+    et, si le backend les expose, les compteurs du serveur
+    """
+    config = settings.CACHES['default']
+    with _stats_lock:
+        local = dict(_stats)
+    lookups = local.get('hit', 0) + local.get('miss', 0)
+
+    stats = {
+        'backend': config['BACKEND'],
+        'key_prefix': config.get('KEY_PREFIX', ''),
+        'version': config.get('VERSION', 1),
+        'response_cache': {
+            'hits': local.get('hit', 0),
+            'misses': local.get('miss', 0),
+            'stores': local.get('store', 0),
+            'hit_ratio': round(local.get('hit', 0) / lookups, 3) if lookups else None,
+        },
+    }
+
+    # Compteurs côté serveur (Redis : INFO stats)
+    backend = getattr(cache, '_cache', None)
+    if hasattr(backend, 'get_client'):
+        info = backend.get_client(None, write=False).info()
+        stats['server'] = {
+            'keyspace_hits': info.get('keyspace_hits'),
+            'keyspace_misses': info.get('keyspace_misses'),
+            'used_memory': info.get('used_memory'),
+            'evicted_keys': info.get('evicted_keys'),
+        }
+    elif isinstance(backend, dict):
+        # LocMemCache : nombre d'entrées du process
+        stats['server'] = {'entries': len(backend)}
+    return stats
+
+
+def cache_health():
+    """
+    Écrit puis relit une clé témoin
+    Retourne (ok, latence en ms, message d'erreur)
+    """
+    token = str(time.time_ns())
+    start = time.perf_counter()
+    try:
+        cache.set(HEALTH_KEY, token, 10)
+        ok = cache.get(HEALTH_KEY) == token
+        error = None if ok else 'valeur relue différente'
+    except Exception as exc:  # Backend injoignable
+        ok, error = False, str(exc)
+    latency = round((time.perf_counter() - start) * 1000, 2)
+    return ok, latency, error
+
+
+def bump_cache_version(model):
+    """
+    Incrémente la version d'un modèle (appelé par les signaux)
+    Différé au commit de la transaction en cours (immédiat hors transaction)
+    """
+    transaction.on_commit(partial(_incr_version, model._meta.label_lower))
+
+
+def _incr_version(label):
+    key = VERSION_KEY % label
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Clé absente (jamais créée ou évincée) : on repart d'une valeur
+        # horodatée, forcément supérieure aux versions déjà utilisées
+        cache.set(key, time.time_ns(), None)
+
+
+def get_cache_versions(labels):
+    """
+    Retourne les versions courantes des modèles (un seul aller-retour cache)
+    """
+    keys = [VERSION_KEY % label for label in labels]
+    found = cache.get_many(keys)
+    return [found.get(key, 0) for key in keys]
+
+
+class CachedResponseMixin:
+    """
+    Mixin à placer AVANT ConditionalGetMixin / viewsets.*ViewSet
+
+    Une entrée de cache est propre à :
+    - l'action et les paramètres de l'URL
+    - la portée d'accès de l'utilisateur (voir get_cache_scope)
+    - les versions des modèles listés dans cache_dependencies
+    Un hit ne touche pas l'ORM.
+    """
+    cache_actions = ()
+    cache_dependencies = ()
+    cache_per_user = True
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+    def get_cache_scope(self):
+        """
+        Portée d'accès : le superuser voit tout, les autres selon leurs projets
+        """
+        if not self.cache_per_user:
+            return 'all'
+        if self.request.user.is_superuser:
+            return 'superuser'
+        return f'user{self.request.user.pk}'
+
+    def get_response_cache_key(self, request):
+        params = sorted(request.query_params.lists())
+        versions = get_cache_versions(self.cache_dependencies)
+        raw = '|'.join([request.path, repr(params), repr(versions)])
+        return 'response_%s_%s_%s_%s' % (
+            self.basename,
+            self.action,
+            self.get_cache_scope(),
+            hashlib.md5(raw.encode()).hexdigest(),
+        )
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        if self.action not in self.cache_actions:
+            return handler(request, *args, **kwargs)
+
+        key = self.get_response_cache_key(request)
+        entry = cache.get(key)
+
+        if entry is not None:
+            record_cache_event('hit')
+            headers = entry['headers']
+            not_modified = get_conditional_response(
+                request,
+                etag=headers.get('ETag'),
+                last_modified=parse_http_date_safe(headers.get('Last-Modified')),
+            )
+            if not_modified is not None:
+                not_modified['ETag'] = headers['ETag']
+                return not_modified
+            return Response(entry['data'], headers=headers)
+
+        record_cache_event('miss')
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200 and isinstance(response, Response):
+            record_cache_event('store')
+            headers = {
+                name: response[name]
+                for name in ('ETag', 'Last-Modified')
+                if response.has_header(name)
+            }
+            cache.set(
+                key,
+                {'data': response.data, 'headers': headers},
+                settings.RESPONSE_CACHE_TIMEOUT
+            )
+        return response
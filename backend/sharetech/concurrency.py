@@ -0,0 +1,155 @@
+# backend/sharetech/concurrency.py
+"""
+Concurrence optimiste (notes, tâches, commentaires)
+
+Deux modifications simultanées d'une même ligne ne s'écrasent plus :
+chaque ligne a un numéro de version, incrémenté à chaque save(), et
+l'écriture est un seul UPDATE conditionnel :
+
+    UPDATE note SET ..., version = 4 WHERE id = 12 AND version = 3
+
+0 ligne modifiée = quelqu'un a écrit entre la lecture et l'écriture :
+VersionConflict, rien n'est écrit. Pas de verrou (SELECT ... FOR UPDATE).
+
+Côté API (OptimisticConcurrencyMixin), le détail d'un objet et la réponse
+à sa modification portent l'ETag "<version>.<empreinte>" (voir representation_etag) ;
+PUT / PATCH acceptent les préconditions :
+- If-Match: "3.<empreinte>"     ETag reçu, ou "3" (champ version lu par le client)
+- If-Unmodified-Since: <date>   updated_at lu par le client
+Précondition fausse ou conflit à l'écriture → 412 Precondition Failed.
+"""
+
+import datetime
+import hashlib
+
+from django.utils.http import parse_etags, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .cache import get_cache_versions
+
+
+class VersionConflict(Exception):
+    """La ligne a été modifiée depuis sa lecture"""
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "La ressource a été modifiée entre-temps. Rechargez-la avant de la modifier."
+    default_code = 'precondition_failed'
+
+
+class VersionedModelMixin:
+    """
+    Mixin de modèle avec un champ version :
+
+        version = models.PositiveIntegerField(default=1, editable=False)
+
+    save() d'une ligne existante n'écrit que si la version en base est
+    toujours celle lue, sinon VersionConflict
+    """
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version'}
+
+        expected = self.version
+        self.version = expected + 1
+        self._expected_version = expected
+        try:
+            super().save(*args, **kwargs)
+        except VersionConflict:
+            self.version = expected
+            raise
+        finally:
+            del self._expected_version
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # Appelé par Model.save() pour l'UPDATE : on y ajoute la condition sur la version
+        expected = getattr(self, '_expected_version', None)
+        if expected is None:
+            return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+
+        updated = super()._do_update(
+            base_qs.filter(version=expected), using, pk_val, values, update_fields, forced_update
+        )
+        if not updated:
+            raise VersionConflict(f"{self._meta.label} {pk_val} : version {expected} périmée")
+        return updated
+
+
+def version_etag(version, variant=''):
+    """ETag fort d'un objet versionné, ex. "3" ou "3.<variant>" """
+    return quote_etag(f'{version}.{variant}' if variant else str(version))
+
+
+def etag_version(etag):
+    """Version portée par un ETag fort ("3" ou "3.<variant>"), ex. '3'"""
+    return etag.strip('"').split('.', 1)[0]
+
+
+def representation_etag(view, version):
+    """
+    ETag du détail servi par view : la version (lue par If-Match) suivie d'une
+    empreinte des paramètres de l'URL (?fields=, ?expand=) et des versions de
+    cache des données liées affichées (view.etag_dependencies, ex. nom du projet)
+    """
+    params = sorted(view.request.query_params.lists())
+    versions = get_cache_versions(getattr(view, 'etag_dependencies', ()))
+    raw = '|'.join([repr(params), repr(versions)])
+    return version_etag(version, hashlib.md5(raw.encode()).hexdigest()[:12])
+
+
+def check_preconditions(request, obj):
+    """PreconditionFailed si If-Match / If-Unmodified-Since ne correspondent pas à obj"""
+    if_match = request.headers.get('If-Match')
+    if if_match and if_match.strip() != '*':
+        # Comparaison forte : un ETag faible (W/"3") ne correspond jamais
+        versions = {etag_version(etag) for etag in parse_etags(if_match) if not etag.startswith('W/')}
+        if str(obj.version) not in versions:
+            raise PreconditionFailed()
+
+    if_unmodified_since = parse_http_date_safe(request.headers.get('If-Unmodified-Since', ''))
+    if if_unmodified_since is not None:
+        # Date HTTP à la seconde : modifiée après la seconde indiquée → précondition fausse
+        since = datetime.datetime.fromtimestamp(if_unmodified_since + 1, tz=datetime.timezone.utc)
+        if obj.updated_at >= since:
+            raise PreconditionFailed()
+
+
+class OptimisticConcurrencyMixin:
+    """
+    Mixin de ViewSet (modèle avec VersionedModelMixin)
+
+    PUT / PATCH : préconditions vérifiées sur l'objet lu (get_object), puis
+    l'UPDATE conditionnel du save() garantit que personne n'a écrit entre-temps.
+    retrieve / update / partial_update : ETag "<version>.<empreinte>" de l'objet
+    (après écriture), à renvoyer tel quel dans If-Match.
+    etag_dependencies : versions de cache des données liées sérialisées avec l'objet
+    """
+    versioned_actions = ('retrieve', 'update', 'partial_update')
+    etag_dependencies = ()
+
+    def get_object(self):
+        obj = super().get_object()
+        if self.request.method in ('PUT', 'PATCH'):
+            check_preconditions(self.request, obj)
+        # update() sérialise et sauvegarde le dernier objet lu : sa version est à jour après save()
+        self.versioned_object = obj
+        return obj
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        obj = getattr(self, 'versioned_object', None)
+        if obj is not None and response.status_code == 200 and self.action in self.versioned_actions:
+            response['ETag'] = representation_etag(self, obj.version)
+        return response
+
+    def handle_exception(self, exc):
+        if isinstance(exc, VersionConflict):
+            exc = PreconditionFailed()
+        return super().handle_exception(exc)
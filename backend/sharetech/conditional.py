@@ -0,0 +1,101 @@
+# backend/sharetech/conditional.py
+"""
+GET conditionnels (ETag / Last-Modified) pour les ViewSets ShareTech
+
+Les validateurs sont calculés avec UNE requête d'agrégat
+(MAX(updated_at) + COUNT) sur le queryset déjà filtré par utilisateur :
+si le client a déjà la bonne version, on répond 304 sans lancer les serializers.
+
+Détail d'un modèle versionné (champ version, voir sharetech/concurrency.py) :
+l'ETag est "<version>.<empreinte>", le même que celui attendu par If-Match.
+
+Les ETags changent aussi avec les versions de cache des données liées
+sérialisées avec les lignes (etag_dependencies, ex. nom du projet d'une note).
+"""
+
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .cache import get_cache_versions
+from .concurrency import representation_etag
+
+
+class ConditionalGetMixin:
+    """
+    Mixin à placer AVANT viewsets.ModelViewSet
+
+    Le queryset de la vue doit encoder les droits d'accès
+    (aucune permission objet n'est vérifiée avant le 304).
+    """
+    conditional_last_modified_field = 'updated_at'
+    etag_dependencies = ()
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.conditional_response(request, queryset, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: kwargs[lookup_url_kwarg]}
+            )
+        except (ValueError, ValidationError):
+            # Identifiant mal formé (/api/notes/abc/) : 404 comme get_object()
+            raise Http404
+        return self.conditional_response(request, queryset, super().retrieve, *args, **kwargs)
+
+    def get_validators(self, queryset):
+        """
+        Retourne (etag, last_modified) pour le queryset
+        Une seule requête : SELECT MAX(updated_at), COUNT(id)
+        """
+        versioned = self.action == 'retrieve' and any(
+            field.name == 'version' for field in queryset.model._meta.concrete_fields
+        )
+        aggregates = {'version': Max('version')} if versioned else {}
+        values = queryset.order_by().aggregate(
+            last_modified=Max(self.conditional_last_modified_field),
+            count=Count('pk'),
+            **aggregates,
+        )
+        last_modified = values['last_modified']
+        if versioned and values['version'] is not None:
+            return representation_etag(self, values['version']), last_modified, values['count']
+
+        # L'utilisateur et l'URL font partie de l'ETag : deux utilisateurs
+        # n'ont pas forcément accès aux mêmes lignes
+        raw = '|'.join([
+            str(self.request.user.pk),
+            self.request.get_full_path(),
+            last_modified.isoformat() if last_modified else '',
+            str(values['count']),
+            repr(get_cache_versions(self.etag_dependencies)),
+        ])
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        return etag, last_modified, values['count']
+
+    def conditional_response(self, request, queryset, handler, *args, **kwargs):
+        etag, last_modified, count = self.get_validators(queryset)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        # Pas de 304 sur un détail introuvable : on laisse le 404 normal
+        if count or self.action == 'list':
+            not_modified = get_conditional_response(
+                request, etag=etag, last_modified=timestamp
+            )
+            if not_modified is not None:
+                not_modified['ETag'] = etag
+                return not_modified
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+        return response
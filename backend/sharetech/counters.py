@@ -0,0 +1,40 @@
+# backend/sharetech/counters.py
+"""
+Compteurs dénormalisés (Project.note_count, Note.comment_count...)
+
+Les compteurs ne sont modifiés que par des UPDATE atomiques en base
+(UPDATE ... SET n = n + 1) depuis les signaux. Un save() classique
+réécrirait toutes les colonnes avec les valeurs chargées en mémoire,
+éventuellement périmées : CounterFieldsMixin les exclut des save().
+"""
+
+from django.db.models import Case, F, Value, When
+
+
+class CounterFieldsMixin:
+    """
+    Mixin de modèle : save() n'écrit jamais les champs de counter_fields
+    (sauf à la création, ou si update_fields les cite explicitement)
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
+
+
+def shift(field, delta):
+    """
+    Expression SQL field + delta, jamais négative
+    (colonnes non signées en MySQL : 0 - 1 lèverait une erreur)
+    """
+    if delta >= 0:
+        return F(field) + delta
+    return Case(
+        When(**{f'{field}__gte': -delta}, then=F(field) + delta),
+        default=Value(0),
+    )
@@ -0,0 +1,2 @@
+# backend/sharetech/db/__init__.py
+# Couche base de données ShareTech : limite de connexions, métriques, routage
@@ -0,0 +1,2 @@
+# backend/sharetech/db/backends/__init__.py
+# Backends Django instrumentés (voir sharetech/db/limits.py)
@@ -0,0 +1,13 @@
+# backend/sharetech/db/backends/mysql/base.py
+"""
+Backend MySQL / MariaDB avec limite de connexions et métriques
+ENGINE = 'sharetech.db.backends.mysql'
+"""
+
+from django.db.backends.mysql import base
+
+from sharetech.db.limits import LimitedConnectionMixin
+
+
+class DatabaseWrapper(LimitedConnectionMixin, base.DatabaseWrapper):
+    pass
@@ -0,0 +1,13 @@
+# backend/sharetech/db/backends/sqlite3/base.py
+"""
+Backend SQLite avec limite de connexions et métriques (doublure locale de MariaDB)
+ENGINE = 'sharetech.db.backends.sqlite3'
+"""
+
+from django.db.backends.sqlite3 import base
+
+from sharetech.db.limits import LimitedConnectionMixin
+
+
+class DatabaseWrapper(LimitedConnectionMixin, base.DatabaseWrapper):
+    pass
@@ -0,0 +1,200 @@
+# backend/sharetech/db/limits.py
+"""
+Limite du nombre de connexions ouvertes et métriques de connexion
+
+Ce n'est pas un pool : Django garde une connexion par thread et ne la prête
+jamais à un autre thread. La réutilisation vient de CONN_MAX_AGE sur des
+threads qui durent (threads gunicorn, threads prêtés par PooledASGIHandler,
+threads SQL de async_api) : chacun garde sa connexion d'une requête à l'autre.
+Ce module borne le nombre total de connexions ouvertes par process
+(MAX_CONNECTIONS, tous threads confondus) et compte connexions et déconnexions.
+
+- Limite atteinte : on attend au plus CONNECTION_TIMEOUT secondes, puis
+  ConnectionLimitTimeout, que ConcurrencyLimitMiddleware transforme en 503.
+- Limite atteinte ou threads en attente : la connexion persistante d'une
+  requête terminée est fermée (request_finished), sa place rendue tout de
+  suite à un thread qui attend (au prix d'une reconnexion plus tard).
+- Filet de sécurité : connexion abandonnée sans close() (thread de runserver
+  terminé), sa place est rendue quand Python libère le DatabaseWrapper
+  (weakref.finalize, au passage normal du GC). Jamais de gc.collect() forcé :
+  une pause du GC par requête en attente, au pire moment.
+"""
+
+import threading
+import time
+import weakref
+from collections import Counter
+
+from django.core.signals import request_finished
+from django.db import OperationalError, connections
+
+
+class ConnectionLimitTimeout(OperationalError):
+    """Aucune place libre sous la limite de connexions dans le délai imparti"""
+
+
+class ConnectionLimiter:
+    """
+    Nombre max de connexions ouvertes d'un alias de base de données
+    (compteur partagé entre threads, les connexions restent propres à chacun)
+    """
+
+    def __init__(self, alias, size, timeout):
+        self.alias = alias
+        self.size = size
+        self.timeout = timeout
+        # size = 0 : pas de limite, seulement les métriques
+        self.semaphore = threading.BoundedSemaphore(size) if size else None
+        self.lock = threading.Lock()
+        self.metrics = Counter()
+        self.in_use = 0
+        self.waiting = 0
+
+    def acquire(self):
+        if self.semaphore is not None and not self.semaphore.acquire(blocking=False):
+            # Limite atteinte : on attend qu'une connexion se ferme et rende sa place
+            with self.lock:
+                self.waiting += 1
+                self.metrics['waits'] += 1
+            try:
+                acquired = self.semaphore.acquire(timeout=self.timeout)
+            finally:
+                with self.lock:
+                    self.waiting -= 1
+            if not acquired:
+                self.record('timeouts')
+                raise ConnectionLimitTimeout(
+                    f"Limite de connexions '{self.alias}' atteinte ({self.size} connexions)"
+                )
+        with self.lock:
+            self.in_use += 1
+            self.metrics['peak_in_use'] = max(self.metrics['peak_in_use'], self.in_use)
+
+    def release(self):
+        with self.lock:
+            self.in_use -= 1
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+    def saturated(self):
+        """Plus de place libre (ou des threads en attente)"""
+        with self.lock:
+            return self.waiting > 0 or (self.size > 0 and self.in_use >= self.size)
+
+    def record(self, name):
+        with self.lock:
+            self.metrics[name] += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'size': self.size,
+                'in_use': self.in_use,
+                'waiting': self.waiting,
+                'connects': self.metrics['connects'],
+                'disconnects': self.metrics['disconnects'],
+                'health_check_failures': self.metrics['health_check_failures'],
+                'waits': self.metrics['waits'],
+                'timeouts': self.metrics['timeouts'],
+                'abandoned': self.metrics['abandoned'],
+                'peak_in_use': self.metrics['peak_in_use'],
+            }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(alias, settings_dict):
+    """Retourne (et crée au besoin) le limiteur d'un alias"""
+    with _limiters_lock:
+        if alias not in _limiters:
+            _limiters[alias] = ConnectionLimiter(
+                alias,
+                settings_dict.get('MAX_CONNECTIONS', 0),
+                settings_dict.get('CONNECTION_TIMEOUT', 5),
+            )
+        return _limiters[alias]
+
+
+def database_health(alias):
+    """
+    SELECT 1 sur un alias
+    Retourne (ok, latence en ms, message d'erreur)
+    """
+    start = time.perf_counter()
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+        ok, error = True, None
+    except Exception as exc:  # Base injoignable, limite de connexions atteinte...
+        ok, error = False, str(exc)
+    latency = round((time.perf_counter() - start) * 1000, 2)
+    return ok, latency, error
+
+
+def connection_stats():
+    """Métriques de tous les limiteurs créés dans ce process"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.alias: limiter.stats() for limiter in limiters}
+
+
+def _release_abandoned(limiter):
+    limiter.record('abandoned')
+    limiter.release()
+
+
+class LimitedConnectionMixin:
+    """
+    Mixin pour DatabaseWrapper : chaque connexion physique ouverte
+    consomme une place sous la limite, rendue à la fermeture
+    """
+
+    @property
+    def limiter(self):
+        return get_limiter(self.alias, self.settings_dict)
+
+    def get_new_connection(self, conn_params):
+        limiter = self.limiter
+        limiter.acquire()
+        try:
+            connection = super().get_new_connection(conn_params)
+        except Exception:
+            limiter.release()
+            raise
+        limiter.record('connects')
+        # Appelé une seule fois : par _close(), ou par le GC si le wrapper est abandonné
+        self._connection_slot = weakref.finalize(self, _release_abandoned, limiter)
+        return connection
+
+    def _close(self):
+        try:
+            return super()._close()
+        finally:
+            self.limiter.record('disconnects')
+            self._connection_slot.detach()
+            self.limiter.release()
+
+    def is_usable(self):
+        usable = super().is_usable()
+        if not usable:
+            self.limiter.record('health_check_failures')
+        return usable
+
+
+def release_idle_connections(**kwargs):
+    """
+    Fin de requête : limite atteinte ou threads en attente → on rend la
+    connexion de ce thread plutôt que de la garder pour sa prochaine requête,
+    pendant qu'un autre thread attend une place
+    """
+    for conn in connections.all(initialized_only=True):
+        if not isinstance(conn, LimitedConnectionMixin):
+            continue
+        if conn.connection is not None and not conn.in_atomic_block and conn.limiter.saturated():
+            conn.close()
+
+
+request_finished.connect(release_idle_connections)
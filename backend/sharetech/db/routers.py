@@ -0,0 +1,143 @@
+# backend/sharetech/db/routers.py
+"""
+Routage des lectures vers les réplicas
+
+- ReplicaRoutingMiddleware choisit un réplica sain au début d'une requête
+  GET / HEAD / OPTIONS sur l'API. Toutes les lectures de la requête y vont.
+- Après un POST / PUT / PATCH / DELETE, la session est épinglée sur la base
+  principale pendant REPLICA_PIN_SECONDS (read-your-writes).
+- Un réplica en retard de plus de REPLICA_MAX_LAG secondes est marqué
+  hors service (dans le cache partagé) pendant REPLICA_UNHEALTHY_SECONDS.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+UNHEALTHY_KEY = 'replica_unhealthy_%s'
+
+# Alias de lecture de la requête en cours (None = base principale)
+_read_alias = ContextVar('read_alias', default=None)
+
+# Dernière vérification du retard, par alias (process local)
+_last_checked = {}
+_last_checked_lock = threading.Lock()
+
+
+def get_replicas():
+    """Alias des réplicas configurés (settings.DATABASE_REPLICAS)"""
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def get_read_alias():
+    """Alias de lecture de la requête en cours (None = base principale)"""
+    return _read_alias.get()
+
+
+@contextmanager
+def use_read_alias(alias):
+    """Envoie les lectures du bloc vers alias (None = base principale)"""
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def mark_unhealthy(alias, seconds=None):
+    """Retire un réplica de la rotation (pour tous les process)"""
+    cache.set(UNHEALTHY_KEY % alias, True, seconds or settings.REPLICA_UNHEALTHY_SECONDS)
+
+
+def mark_healthy(alias):
+    cache.delete(UNHEALTHY_KEY % alias)
+
+
+def get_replica_lag(alias):
+    """
+    Retard du réplica en secondes (None si inconnu / réplication arrêtée)
+    Seul MySQL / MariaDB expose ce retard ; les autres backends renvoient 0
+    """
+    connection = connections[alias]
+    if connection.vendor != 'mysql':
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute('SHOW SLAVE STATUS')
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        columns = [col[0] for col in cursor.description]
+    return dict(zip(columns, row)).get('Seconds_Behind_Master')
+
+
+def check_replica(alias):
+    """
+    Mesure le retard d'un réplica et le marque hors service si besoin
+    Retourne True si le réplica est utilisable
+    """
+    try:
+        lag = get_replica_lag(alias)
+    except Exception:  # Réplica injoignable
+        lag = None
+    if lag is None or lag > settings.REPLICA_MAX_LAG:
+        mark_unhealthy(alias)
+        return False
+    return True
+
+
+def _due_for_check(alias):
+    now = time.monotonic()
+    with _last_checked_lock:
+        if now - _last_checked.get(alias, float('-inf')) < settings.REPLICA_CHECK_INTERVAL:
+            return False
+        _last_checked[alias] = now
+        return True
+
+
+def choose_replica():
+    """
+    Choisit un réplica sain au hasard, ou None (→ base principale)
+    Une lecture cache pour l'état de santé ; le retard n'est mesuré
+    qu'une fois par REPLICA_CHECK_INTERVAL et par process
+    """
+    replicas = get_replicas()
+    if not replicas:
+        return None
+    unhealthy = cache.get_many([UNHEALTHY_KEY % alias for alias in replicas])
+    healthy = [
+        alias for alias in replicas
+        if UNHEALTHY_KEY % alias not in unhealthy
+        and (not _due_for_check(alias) or check_replica(alias))
+    ]
+    return random.choice(healthy) if healthy else None
+
+
+class ReplicaRouter:
+    """
+    Lectures : réplica choisi par la requête en cours, sinon base principale
+    Écritures et migrations : toujours la base principale
+    """
+    # Sessions : lues juste après le login, jamais sur un réplica
+    primary_only_apps = {'sessions'}
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in self.primary_only_apps:
+            return DEFAULT_DB_ALIAS
+        return _read_alias.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Mêmes données sur toutes les bases
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
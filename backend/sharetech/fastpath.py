@@ -0,0 +1,121 @@
+# backend/sharetech/fastpath.py
+"""
+Sérialisation rapide des listes en lecture seule
+
+Une liste de N objets passe normalement par N appels à Serializer.to_representation :
+instances de modèle complètes, puis pour chaque champ, résolution de la source
+attribut par attribut et to_representation. Sur les grandes listes de tâches et
+de notes, c'est ce travail par objet qui domine le temps CPU.
+
+FastListSerializer (Meta.list_serializer_class) lit directement des tuples
+(queryset.values_list) et les transforme avec un plan calculé une seule fois
+par réponse : pour chaque champ, son nom, sa colonne et sa conversion
+(to_representation du champ, seulement pour les types qui en ont besoin :
+dates, décimaux...). Les jointures des champs 'author.username' sont faites
+par values_list (plus de requête par objet).
+
+La sortie est identique à celle du serializer (tests de parité dans
+sharetech/tests/test_fastpath.py). Dès qu'un champ n'est pas une simple
+colonne (SerializerMethodField, source='*', serializer imbriqué de ?expand,
+relation multiple...), ou que les données ne sont pas un queryset non évalué,
+la sérialisation classique est utilisée.
+
+Un champ dont la valeur dépend du queryset (annotation optionnelle) fournit
+get_values_path(queryset) (voir notes/serializers.py).
+"""
+
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField
+
+from .fieldsets import relation_chain
+
+
+# Champs dont to_representation ne change pas la valeur lue en base
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+)
+
+
+def compile_columns(serializer, queryset):
+    """
+    Plan de lecture des champs lisibles de serializer :
+    ([(nom, conversion ou None)], [colonnes pour values_list])
+    None si un champ ne peut pas être lu depuis une colonne
+    """
+    model = queryset.model
+    annotations = queryset.query.annotations
+    columns, paths = [], []
+
+    for field in serializer._readable_fields:
+        if isinstance(field, ManyRelatedField):
+            if relation_chain(model, field.source) is None and not field.required:
+                # Attribut absent du modèle : DRF omet le champ (SkipField)
+                continue
+            return None
+        if isinstance(field, serializers.BaseSerializer) or field.source == '*':
+            return None
+        if isinstance(field, serializers.SerializerMethodField):
+            return None
+
+        if hasattr(field, 'get_values_path'):
+            path = field.get_values_path(queryset)
+        else:
+            path = '__'.join(field.source_attrs)
+        if path not in annotations and relation_chain(model, path) is None:
+            return None
+
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            # values_list renvoie déjà la clé primaire
+            if field.pk_field is not None:
+                return None
+            convert = None
+        elif isinstance(field, PASSTHROUGH_FIELDS):
+            convert = None
+        else:
+            convert = field.to_representation
+
+        columns.append((field.field_name, convert))
+        paths.append(path)
+
+    return columns, paths
+
+
+def rows_to_dicts(columns, rows):
+    """Tuples de values_list → dictionnaires du serializer (None reste None)"""
+    names = [name for name, convert in columns]
+    converters = [
+        (index, convert) for index, (name, convert) in enumerate(columns)
+        if convert is not None
+    ]
+    data = []
+    for row in rows:
+        if converters:
+            row = list(row)
+            for index, convert in converters:
+                if row[index] is not None:
+                    row[index] = convert(row[index])
+        data.append(dict(zip(names, row)))
+    return data
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer en lecture qui sérialise un queryset par values_list
+
+        class Meta:
+            list_serializer_class = FastListSerializer
+    """
+
+    def to_representation(self, data):
+        if isinstance(data, QuerySet) and data._result_cache is None:
+            plan = compile_columns(self.child, data)
+            if plan is not None:
+                columns, paths = plan
+                # values_list ignore select_related ; les préchargements ne s'y appliquent pas
+                rows = data.prefetch_related(None).values_list(*paths)
+                return rows_to_dicts(columns, rows)
+        return super().to_representation(data)
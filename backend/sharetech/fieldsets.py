@@ -0,0 +1,213 @@
+# backend/sharetech/fieldsets.py
+"""
+Champs à la demande : ?fields= et ?expand=
+
+    GET /api/notes/?fields=id,title,updated_at       seulement ces champs
+    GET /api/tasks/?expand=assigned_to               utilisateur complet au lieu de son id
+
+Côté serializer (SparseFieldsetSerializerMixin) : seuls les champs demandés
+sont construits et rendus ; Meta.expandable_fields liste les relations
+dépliables.
+Côté ViewSet (SparseFieldsetMixin) : pour les lectures (list, retrieve),
+le queryset ne charge que les colonnes nécessaires (.only()) et ne joint /
+précharge que les relations rendues. Sans ?fields ni ?expand, la réponse
+est inchangée.
+
+Les colonnes nécessaires sont déduites de la source de chaque champ
+('title', 'author.username', relation imbriquée...). Un champ calculé
+(SerializerMethodField, source='*') déclare les siennes dans
+Meta.field_requirements, sinon .only() n'est pas appliqué.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.module_loading import import_string
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def parse_list_param(request, name):
+    """?name=a,b → ['a', 'b'] (None si absent)"""
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Mixin de ModelSerializer
+
+    Meta.expandable_fields = {
+        'author': ('accounts.serializers.UserSerializer', ['author__profile']),
+    }
+    (serializer imbriqué, chemins à joindre en plus de la relation elle-même)
+
+    Meta.field_requirements = {
+        'created_by_full_name': ['created_by__first_name', 'created_by__last_name', ...],
+    }
+    """
+
+    def is_fieldset_root(self):
+        # Seul le serializer de la vue suit ?fields (pas les serializers imbriqués)
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.is_fieldset_root():
+            return fields
+
+        requested = self.context.get('fields')
+        expand = self.context.get('expand') or ()
+        if requested is not None:
+            keep = set(requested) | set(expand)
+            fields = {name: field for name, field in fields.items() if name in keep}
+
+        expandable = getattr(self.Meta, 'expandable_fields', {})
+        for name in expand:
+            serializer_class = import_string(expandable[name][0])
+            source = fields[name].source if name in fields and fields[name].source else name
+            fields[name] = serializer_class(source=None if source == name else source, read_only=True)
+        return fields
+
+
+def relation_chain(model, path):
+    """
+    Champs du modèle traversés par path ('author__username'),
+    None si path n'est pas un chemin de champs (propriété, annotation...)
+    """
+    chain = []
+    for part in path.split('__'):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        chain.append(field)
+        if field.is_relation:
+            model = field.related_model
+    return chain
+
+
+def is_many(field):
+    return field.many_to_many or field.one_to_many
+
+
+def queryset_requirements(serializer_class, fields, expand):
+    """
+    (colonnes pour .only() ou None, chemins select_related, chemins prefetch_related)
+    pour rendre `fields` (None = tous) avec les relations `expand` dépliées
+    """
+    meta = serializer_class.Meta
+    model = meta.model
+    declared = serializer_class().fields
+    expandable = getattr(meta, 'expandable_fields', {})
+    requirements = getattr(meta, 'field_requirements', {})
+
+    paths, expanded, select = [], set(), set()
+    restrict = True
+    for name, field in declared.items():
+        if fields is not None and name not in fields and name not in expand:
+            continue
+        if name in expand:
+            path = (field.source or name).replace('.', '__')
+            paths.append(path)
+            expanded.add(path)
+            select.update(expandable[name][1])
+        elif name in requirements:
+            paths.extend(requirements[name])
+        elif field.source == '*' or isinstance(field, serializers.SerializerMethodField):
+            restrict = False
+        else:
+            paths.append(field.source.replace('.', '__'))
+
+    only, prefetch = {model._meta.pk.name}, set()
+    for path in paths:
+        chain = relation_chain(model, path)
+        if chain is None:
+            # Attribut calculé du modèle : colonnes inconnues
+            restrict = False
+        elif is_many(chain[0]):
+            # Relation multiple : préchargée avec les relations du chemin
+            prefetch.add(path if chain[-1].is_relation else path.rsplit('__', 1)[0])
+        else:
+            only.add(path)
+            if len(chain) > 1:
+                select.add(path.rsplit('__', 1)[0])
+            if path in expanded:
+                select.add(path)
+
+    return (only if restrict else None), select, prefetch
+
+
+class SparseFieldsetMixin:
+    """
+    Mixin de ViewSet : ?fields= et ?expand= pour les actions de fieldset_actions
+
+    Le serializer de ces actions doit hériter de SparseFieldsetSerializerMixin.
+    Les champs sont validés (400 si inconnus), passés au serializer par le
+    contexte, et le queryset de filter_queryset est réduit en conséquence.
+    """
+    fieldset_actions = ('list', 'retrieve')
+
+    def get_fieldset(self):
+        """(champs demandés ou None, relations à déplier), validés une fois par requête"""
+        if not hasattr(self, '_fieldset'):
+            fields = parse_list_param(self.request, 'fields')
+            expand = parse_list_param(self.request, 'expand') or []
+
+            serializer_class = self.get_serializer_class()
+            available = serializer_class().fields
+            expandable = getattr(serializer_class.Meta, 'expandable_fields', {})
+            errors = {}
+            if fields is not None and set(fields) - set(available):
+                errors['fields'] = (
+                    f"Champs inconnus : {', '.join(sorted(set(fields) - set(available)))}. "
+                    f"Valeurs possibles : {', '.join(available)}"
+                )
+            if set(expand) - set(expandable):
+                errors['expand'] = (
+                    f"Relations inconnues : {', '.join(sorted(set(expand) - set(expandable)))}. "
+                    f"Valeurs possibles : {', '.join(expandable) or 'aucune'}"
+                )
+            if errors:
+                raise ValidationError(errors)
+            self._fieldset = (fields, expand)
+        return self._fieldset
+
+    def wants_field(self, *names):
+        """True si l'un des champs sera rendu (tous sans ?fields)"""
+        if self.action not in self.fieldset_actions:
+            return True
+        fields, expand = self.get_fieldset()
+        return fields is None or any(name in fields or name in expand for name in names)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in self.fieldset_actions:
+            context['fields'], context['expand'] = self.get_fieldset()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in self.fieldset_actions and self.request.method in ('GET', 'HEAD'):
+            queryset = self.apply_fieldset(queryset)
+        return queryset
+
+    def apply_fieldset(self, queryset):
+        fields, expand = self.get_fieldset()
+        if fields is None and not expand:
+            return queryset
+
+        only, select, prefetch = queryset_requirements(self.get_serializer_class(), fields, expand)
+        if fields is not None:
+            # Jointures et préchargements par défaut remplacés par ceux des champs demandés
+            queryset = queryset.select_related(None).prefetch_related(None)
+            if only is not None:
+                queryset = queryset.only(*only)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
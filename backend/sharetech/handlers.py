@@ -0,0 +1,107 @@
+# backend/sharetech/handlers.py
+"""
+Handler ASGI : threads synchrones réutilisés d'une requête à l'autre
+
+Django exécute le code synchrone d'une requête ASGI (middlewares, vues DRF)
+dans un ThreadSensitiveContext propre à la requête : asgiref crée un thread
+pour la requête et l'arrête à la fin. Les connexions DB sont rangées par
+thread : une connexion persistante (CONN_MAX_AGE) n'y serait jamais
+réutilisée et resterait ouverte jusqu'au ramasse-miettes.
+
+PooledASGIHandler prête à chaque requête un des ASGI_SYNC_THREADS threads
+du process et le reprend à la fin, sans l'arrêter : chaque thread garde sa
+connexion d'une requête à l'autre et close_old_connections (signaux
+request_started / request_finished) applique CONN_MAX_AGE comme sous WSGI.
+Tous les threads pris : attente de CONCURRENCY_QUEUE_TIMEOUT secondes, puis 503.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import SyncToAsync, ThreadSensitiveContext
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+
+from .middleware import service_unavailable
+
+
+class SyncThreadPool:
+    """
+    size exécuteurs à un thread, prêtés requête par requête
+    (créés à la demande, le dernier rendu est prêté en premier)
+    """
+    poll_interval = 0.01
+
+    def __init__(self, size):
+        self.size = size
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle = []
+        self.created = 0
+        self._lock = threading.Lock()
+
+    async def acquire(self, timeout):
+        """
+        Exécuteur libre, None après timeout secondes
+        Attente dans la boucle d'événements : une requête annulée ne prend rien
+        """
+        deadline = time.monotonic() + timeout
+        while not self.slots.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(self.poll_interval)
+        with self._lock:
+            if self.idle:
+                return self.idle.pop()
+            self.created += 1
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix='asgi-sync')
+
+    def release(self, executor):
+        with self._lock:
+            self.idle.append(executor)
+        self.slots.release()
+
+
+class PooledThreadSensitiveContext(ThreadSensitiveContext):
+    """ThreadSensitiveContext servi par un exécuteur existant, laissé en vie à la sortie"""
+
+    def __init__(self, executor):
+        super().__init__()
+        self.executor = executor
+
+    async def __aenter__(self):
+        await super().__aenter__()
+        if self.token:
+            SyncToAsync.context_to_thread_executor[self] = self.executor
+        return self
+
+    async def __aexit__(self, exc, value, tb):
+        # Retiré avant ThreadSensitiveContext.__aexit__, qui arrêterait le thread
+        SyncToAsync.context_to_thread_executor.pop(self, None)
+        return await super().__aexit__(exc, value, tb)
+
+
+class PooledASGIHandler(ASGIHandler):
+    """ASGIHandler dont les requêtes empruntent un thread de sync_threads"""
+
+    def __init__(self):
+        super().__init__()
+        self.sync_threads = SyncThreadPool(settings.ASGI_SYNC_THREADS)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            raise ValueError(
+                'Django can only handle ASGI/HTTP connections, not %s.' % scope['type']
+            )
+
+        executor = await self.sync_threads.acquire(settings.CONCURRENCY_QUEUE_TIMEOUT)
+        if executor is None:
+            await self.send_response(service_unavailable(), send)
+            return
+
+        try:
+            async with PooledThreadSensitiveContext(executor):
+                await self.handle(scope, receive, send)
+        finally:
+            self.sync_threads.release(executor)
@@ -0,0 +1,314 @@
+# backend/sharetech/middleware.py
+"""
+Middlewares ShareTech
+
+Tous compatibles sync ET async : sous ASGI, un seul middleware synchrone
+suffirait à faire tourner les vues async dans un thread (voir async_api.py).
+"""
+
+import asyncio
+import gzip
+import hashlib
+import re
+import threading
+import time
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from sharetech.db.limits import ConnectionLimitTimeout
+from sharetech.db.routers import choose_replica, get_replicas, use_read_alias
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def service_unavailable():
+    """Réponse 503 avec Retry-After (serveur saturé ou limite de connexions DB atteinte)"""
+    response = JsonResponse(
+        {'detail': 'Serveur surchargé, réessayez plus tard.'},
+        status=503
+    )
+    response['Retry-After'] = str(settings.CONCURRENCY_RETRY_AFTER)
+    return response
+
+
+class HybridMiddleware:
+    """
+    Base des middlewares utilisables en mode sync et async
+    (même principe que django.utils.deprecation.MiddlewareMixin)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
+
+
+class StaticFilesMiddleware(HybridMiddleware, WhiteNoiseMiddleware):
+    """
+    WhiteNoise (fichiers statiques) utilisable dans une chaîne async
+    WhiteNoiseMiddleware est synchrone uniquement
+    """
+
+    def __init__(self, get_response):
+        WhiteNoiseMiddleware.__init__(self, get_response)
+        HybridMiddleware.__init__(self, get_response)
+
+    def handle(self, request):
+        return WhiteNoiseMiddleware.__call__(self, request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+class ConcurrencyLimitMiddleware(HybridMiddleware):
+    """
+    Limiteur de concurrence global (load shedding)
+
+    Au-delà de MAX_CONCURRENT_REQUESTS requêtes API simultanées dans le process,
+    on attend CONCURRENCY_QUEUE_TIMEOUT secondes puis on répond 503 avec Retry-After
+    plutôt que d'empiler les requêtes sur une base de données déjà saturée.
+    Un ConnectionLimitTimeout (limite de connexions DB atteinte) donne aussi un 503.
+
+    Sous ASGI, l'attente se fait dans la boucle d'événements (essais non
+    bloquants toutes les poll_interval secondes) : une requête annulée pendant
+    l'attente (client déconnecté) ne prend jamais de place.
+    """
+    poll_interval = 0.01
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        limit = getattr(settings, 'MAX_CONCURRENT_REQUESTS', 0)
+        # 0 = pas de limite
+        self.semaphore = threading.BoundedSemaphore(limit) if limit else None
+
+    def handle(self, request):
+        if self.semaphore is None or not request.path.startswith('/api/'):
+            return self.get_response(request)
+
+        if not self.semaphore.acquire(timeout=settings.CONCURRENCY_QUEUE_TIMEOUT):
+            return service_unavailable()
+
+        try:
+            return self.get_response(request)
+        finally:
+            self.semaphore.release()
+
+    async def __acall__(self, request):
+        if self.semaphore is None or not request.path.startswith('/api/'):
+            return await self.get_response(request)
+
+        if not await self.acquire_async():
+            return service_unavailable()
+
+        try:
+            return await self.get_response(request)
+        finally:
+            self.semaphore.release()
+
+    async def acquire_async(self):
+        """
+        Prend une place sans bloquer la boucle d'événements
+        Pas d'attente dans un thread : annulée, elle prendrait la place quand même
+        """
+        deadline = time.monotonic() + settings.CONCURRENCY_QUEUE_TIMEOUT
+        while not self.semaphore.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.poll_interval)
+        return True
+
+    def process_exception(self, request, exception):
+        if isinstance(exception, ConnectionLimitTimeout):
+            return service_unavailable()
+        return None
+
+
+class ReplicaRoutingMiddleware(HybridMiddleware):
+    """
+    Lectures des requêtes API sûres (GET / HEAD / OPTIONS) sur un réplica
+
+    Read-your-writes : après une écriture, la session est épinglée sur la base
+    principale pendant REPLICA_PIN_SECONDS, le temps que les réplicas rattrapent.
+    À placer après SessionMiddleware et AuthenticationMiddleware.
+    """
+    session_key = 'db_pinned_until'
+
+    def choose_alias(self, request):
+        """
+        Alias de lecture de la requête (None = base principale)
+        Écriture : épingle la session AVANT la réponse (SessionMiddleware sauvegarde ensuite)
+        """
+        if request.method not in SAFE_METHODS:
+            request.session[self.session_key] = time.time() + settings.REPLICA_PIN_SECONDS
+            return None
+        if request.session.get(self.session_key, 0) < time.time():
+            return choose_replica()
+        return None
+
+    def handle(self, request):
+        if not get_replicas() or not request.path.startswith('/api/'):
+            return self.get_response(request)
+
+        with use_read_alias(self.choose_alias(request)):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        if not get_replicas() or not request.path.startswith('/api/'):
+            return await self.get_response(request)
+
+        # La session est chargée depuis la base : hors de la boucle d'événements
+        alias = await sync_to_async(self.choose_alias)(request)
+        with use_read_alias(alias):
+            return await self.get_response(request)
+
+
+class CompressionMiddleware(HybridMiddleware):
+    """
+    Compression gzip des réponses (contenus de notes, arbres de commentaires...)
+
+    Seules les réponses dont le type est dans COMPRESSION_CONTENT_TYPES sont
+    compressées, si le client accepte gzip et si le corps fait au moins
+    COMPRESSION_MIN_SIZE octets (en dessous, l'en-tête gzip et le CPU coûtent
+    plus qu'ils ne rapportent). Niveau : COMPRESSION_LEVEL (1 rapide ... 9 compact).
+    Les réponses en streaming (exports, imports) sont compressées au fil de l'eau,
+    chaque morceau est envoyé dès qu'il est produit.
+
+    ETag fort d'une réponse compressée : "<etag>-gzip" (un ETag fort désigne des
+    octets précis). Le suffixe est retiré de If-None-Match / If-Match avant la
+    vue, qui compare ses propres ETags, et remis sur le 304 correspondant.
+    Pas de text/html par défaut (BREACH : pages avec jeton CSRF, voir settings).
+
+    COMPRESSION_CACHE : les corps compressés sont gardés dans le cache, indexés
+    par l'empreinte du corps brut ; une réponse identique (liste servie par le
+    cache de réponses, rechargement...) n'est compressée qu'une fois.
+    À placer en tête de MIDDLEWARE (après SecurityMiddleware) : les fichiers
+    statiques sont déjà servis précompressés par WhiteNoise.
+    """
+    accepts_gzip = re.compile(r'\bgzip\b')
+    cache_key = 'gzip_body_%d_%s'
+    etag_suffix = '-gzip'
+
+    def handle(self, request):
+        if_none_match = self.strip_etag_suffix(request)
+        return self.compress(request, self.get_response(request), if_none_match)
+
+    async def __acall__(self, request):
+        if_none_match = self.strip_etag_suffix(request)
+        response = await self.get_response(request)
+        return self.compress(request, response, if_none_match)
+
+    def strip_etag_suffix(self, request):
+        """
+        Ramène les ETags "<etag>-gzip" de If-None-Match / If-Match à l'ETag de la vue
+        Retourne If-None-Match tel que reçu
+        """
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+        for header in ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MATCH'):
+            value = request.META.get(header)
+            if value and self.etag_suffix in value:
+                request.META[header] = value.replace(f'{self.etag_suffix}"', '"')
+        return if_none_match
+
+    def gzip_etag(self, etag):
+        """ETag du corps compressé ; un ETag faible ne promet pas les octets : inchangé"""
+        if etag.startswith('W/') or not etag.endswith('"'):
+            return etag
+        return f'{etag[:-1]}{self.etag_suffix}"'
+
+    def compress(self, request, response, if_none_match=''):
+        if response.status_code == 304 and response.has_header('ETag'):
+            # 304 validant le corps compressé que le client a en cache
+            etag = self.gzip_etag(response['ETag'])
+            if etag in if_none_match:
+                response['ETag'] = etag
+            return response
+        if response.has_header('Content-Encoding'):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type not in settings.COMPRESSION_CONTENT_TYPES:
+            return response
+
+        # La réponse dépend de l'en-tête Accept-Encoding (caches intermédiaires)
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if not self.accepts_gzip.search(request.META.get('HTTP_ACCEPT_ENCODING', '')):
+            return response
+
+        if response.streaming:
+            response.streaming_content = self.compress_stream(response)
+            del response['Content-Length']
+        else:
+            if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            compressed = self.compress_body(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        if response.has_header('ETag'):
+            response['ETag'] = self.gzip_etag(response['ETag'])
+        response['Content-Encoding'] = 'gzip'
+        return response
+
+    def compress_body(self, content):
+        """gzip du corps, via le cache si COMPRESSION_CACHE"""
+        level = settings.COMPRESSION_LEVEL
+        if not settings.COMPRESSION_CACHE:
+            return gzip.compress(content, compresslevel=level, mtime=0)
+
+        key = self.cache_key % (level, hashlib.sha1(content).hexdigest())
+        compressed = cache.get(key)
+        if compressed is None:
+            # mtime=0 : même corps → mêmes octets compressés
+            compressed = gzip.compress(content, compresslevel=level, mtime=0)
+            cache.set(key, compressed, settings.RESPONSE_CACHE_TIMEOUT)
+        return compressed
+
+    def compress_stream(self, response):
+        """
+        Compression incrémentale, vidée à chaque morceau (Z_SYNC_FLUSH)
+        Un flux async (ASGI, voir sharetech/streaming.py) reste async : envelopper
+        un itérateur async dans un générateur sync forcerait Django à le consommer d'un bloc
+        """
+        # wbits 16 + MAX_WBITS : en-tête et pied gzip
+        compressor = zlib.compressobj(settings.COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        content = response.streaming_content
+
+        if response.is_async:
+            async def compressed_chunks():
+                async for chunk in content:
+                    yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                yield compressor.flush()
+        else:
+            def compressed_chunks():
+                for chunk in content:
+                    yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                yield compressor.flush()
+        return compressed_chunks()
@@ -0,0 +1,87 @@
+# backend/sharetech/renderers.py
+"""
+Renderer et parser JSON rapides (REST_FRAMEWORK, voir settings.py)
+
+Encodage et décodage par orjson (C) s'il est installé, sinon par le module json
+de la bibliothèque standard, comme les classes DRF. JSON_BACKEND choisit :
+- 'auto'   : orjson si disponible, sinon json (par défaut)
+- 'orjson' : orjson obligatoire (ImproperlyConfigured s'il manque)
+- 'stdlib' : toujours json (comportement DRF d'origine)
+
+La sortie est celle de rest_framework.renderers.JSONRenderer, octet pour
+octet : JSON compact, UTF-8, U+2028 / U+2029 échappés, et les types non JSON
+(Decimal, datetime, date, UUID, chaînes traduites...) convertis par l'encodeur
+DRF (datetime ISO 8601 avec 'Z', Decimal en nombre). Cas non gérés par
+orjson (?indent, UNICODE_JSON = False) : sérialisation DRF classique.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# datetime, date et time passent par l'encodeur DRF (format des réponses existantes)
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+_encoder = JSONEncoder()
+
+
+def use_orjson():
+    """True si JSON_BACKEND (et l'installation) permet d'utiliser orjson"""
+    backend = settings.JSON_BACKEND
+    if backend == 'orjson' and orjson is None:
+        raise ImproperlyConfigured("JSON_BACKEND = 'orjson' mais orjson n'est pas installé")
+    return orjson is not None and backend in ('auto', 'orjson')
+
+
+def dumps(data):
+    """data → JSON compact (bytes), identique à JSONRenderer"""
+    if not use_orjson():
+        return JSONRenderer().render(data)
+    ret = orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+    # Séparateurs de ligne JavaScript : échappés comme DRF (JSON inclus dans du JS)
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer encodé par orjson (voir dumps)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent or self.ensure_ascii or not self.compact or not use_orjson():
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser décodé par orjson (mêmes erreurs : 400 ParseError)"""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if not use_orjson():
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read()
+            if encoding.lower().replace('-', '') != 'utf8':
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except ValueError as exc:
+            # orjson.JSONDecodeError et UnicodeDecodeError héritent de ValueError
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -13,7 +13,8 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework.authentication import SessionAuthentication
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -55,14 +56,21 @@ INSTALLED_APPS = [
     'notes',
     'tasks',
     'comments', 
+    'analytics',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Compression gzip des réponses API (voir COMPRESSION_* plus bas)
+    'sharetech.middleware.CompressionMiddleware',
+    # Fichiers statiques servis compressés et avec cache long (WhiteNoise, compatible async)
+    'sharetech.middleware.StaticFilesMiddleware',
+    'sharetech.middleware.ConcurrencyLimitMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'sharetech.middleware.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -91,21 +99,169 @@ WSGI_APPLICATION = 'sharetech.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
+# Backends instrumentés (sharetech/db/limits.py) : limite de connexions + métriques
+# DB_ENGINE=sqlite : doublure locale pour le dev et les tests (pas de MariaDB)
+DB_ENGINE = config('DB_ENGINE', default='mysql')
+
+# Connexions persistantes : réutilisées DB_CONN_MAX_AGE secondes (0 = une par requête)
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+# Vérifie qu'une connexion persistante répond avant de la réutiliser
+DB_CONN_HEALTH_CHECKS = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+# Connexions ouvertes max par process (tous threads confondus, 0 = illimité)
+# Pas un pool : chaque thread garde la sienne, réutilisée grâce à DB_CONN_MAX_AGE
+DB_MAX_CONNECTIONS = config('DB_MAX_CONNECTIONS', default=20, cast=int)
+# Attente max (secondes) d'une place libre avant ConnectionLimitTimeout (→ 503)
+DB_CONNECTION_TIMEOUT = config('DB_CONNECTION_TIMEOUT', default=5.0, cast=float)
+
+if DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'sharetech.db.backends.sqlite3',
+            'NAME': config('DB_NAME', default=str(BASE_DIR / 'db.sqlite3')),
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'sharetech.db.backends.mysql',
+            'NAME': config('DB_NAME'),
+            'USER': config('DB_USER'),
+            'PASSWORD': config('DB_PASSWORD'),
+            'HOST': config('DB_HOST'),
+            'PORT': config('DB_PORT', default='3306'),
+            'OPTIONS': {
+                'charset': 'utf8mb4',
+                'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
+            },
+        }
+    }
+
+DATABASES['default'].update({
+    'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+    'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+    'MAX_CONNECTIONS': DB_MAX_CONNECTIONS,
+    'CONNECTION_TIMEOUT': DB_CONNECTION_TIMEOUT,
+})
+
+# Réplicas en lecture (sharetech/db/routers.py)
+# DB_REPLICAS : hôtes MariaDB séparés par des virgules (ou fichiers si DB_ENGINE=sqlite)
+DB_REPLICAS = config('DB_REPLICAS', default='', cast=Csv())
+
+DATABASE_REPLICAS = []
+for index, location in enumerate(DB_REPLICAS, start=1):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'NAME' if DB_ENGINE == 'sqlite' else 'HOST': location,
+        # En test, les réplicas pointent sur la base de test principale
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['sharetech.db.routers.ReplicaRouter']
+
+# Read-your-writes : durée d'épinglage sur la base principale après une écriture
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+# Retard de réplication toléré (secondes)
+REPLICA_MAX_LAG = config('REPLICA_MAX_LAG', default=5, cast=int)
+# Fréquence de mesure du retard, par process (secondes)
+REPLICA_CHECK_INTERVAL = config('REPLICA_CHECK_INTERVAL', default=10, cast=int)
+# Durée d'exclusion d'un réplica en retard (secondes)
+REPLICA_UNHEALTHY_SECONDS = config('REPLICA_UNHEALTHY_SECONDS', default=30, cast=int)
+
+# Statistiques de commentaires des notes (comment_count, last_comment_at, reply_depth) :
+# 'aggregate' = calculées par la requête de liste, 'counters' = colonnes dénormalisées de Note
+NOTE_COMMENT_STATS = config('NOTE_COMMENT_STATS', default='aggregate')
+
+# Vues async (sharetech/async_api.py) : threads exécutant les requêtes SQL en parallèle
+# Chacun garde sa connexion : à compter dans DB_MAX_CONNECTIONS
+ASYNC_QUERY_THREADS = config('ASYNC_QUERY_THREADS', default=8, cast=int)
+
+# Import de notes en masse (notes/importers.py) : notes validées et insérées par transaction
+NOTE_IMPORT_CHUNK_SIZE = config('NOTE_IMPORT_CHUNK_SIZE', default=500, cast=int)
+
+# Historique des notes (notes/revisions.py) : une révision sur N stocke le contenu complet,
+# les autres un delta ; reconstruire une version applique au plus N - 1 deltas
+NOTE_REVISION_SNAPSHOT_INTERVAL = config('NOTE_REVISION_SNAPSHOT_INTERVAL', default=20, cast=int)
+
+# Export de projet en streaming (projects/exports.py) : lignes lues par requête
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Statistiques quotidiennes (analytics/rollups.py) : âge minimal (secondes) d'une ligne
+# avant d'être comptée, le temps que les transactions en cours soient committées
+ANALYTICS_SETTLE_SECONDS = config('ANALYTICS_SETTLE_SECONDS', default=60, cast=int)
+
+# Encodage JSON des réponses et des requêtes (sharetech/renderers.py) :
+# 'auto' = orjson s'il est installé, 'orjson' = obligatoire, 'stdlib' = module json
+JSON_BACKEND = config('JSON_BACKEND', default='auto')
+
+# Compression des réponses (sharetech/middleware.py, CompressionMiddleware) :
+# taille minimale du corps (octets), niveau gzip (1-9) et types de contenu compressés
+# Jamais text/html : les pages (admin, connexion) portent le jeton CSRF, et compresser
+# un secret avec des données reflétées de la requête l'expose (attaque BREACH)
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+COMPRESSION_LEVEL = config('COMPRESSION_LEVEL', default=6, cast=int)
+COMPRESSION_CONTENT_TYPES = config(
+    'COMPRESSION_CONTENT_TYPES',
+    default='application/json,application/x-ndjson,text/csv,text/plain',
+    cast=Csv()
+)
+# Corps compressés gardés dans le cache (clé = empreinte du corps) : une réponse
+# identique n'est compressée qu'une fois
+COMPRESSION_CACHE = config('COMPRESSION_CACHE', default=False, cast=bool)
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Backend partagé entre les workers (redis) en production,
+# locmem ou fichier comme doublure pour le dev et les tests
+# (locmem = un cache par process : refusé avec plusieurs workers, voir plus bas)
+
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+}
+
+CACHE_DEFAULT_LOCATIONS = {
+    'locmem': 'sharetech',
+    'file': str(BASE_DIR / '.cache'),
+    'redis': 'redis://localhost:6379/1',
+    'memcached': '127.0.0.1:11211',
+}
+
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem')
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        'NAME': config('DB_NAME'),
-        'USER': config('DB_USER'),
-        'PASSWORD': config('DB_PASSWORD'),
-        'HOST': config('DB_HOST'),
-        'PORT': config('DB_PORT', default='3306'),
-        'OPTIONS': {
-            'charset': 'utf8mb4',
-            'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
-        },
+        # Alias connu ('redis', 'file'...) ou chemin complet d'un backend Django
+        'BACKEND': CACHE_BACKENDS.get(CACHE_BACKEND, CACHE_BACKEND),
+        'LOCATION': config('CACHE_LOCATION', default=CACHE_DEFAULT_LOCATIONS.get(CACHE_BACKEND, '')),
+        # Espace de noms : plusieurs environnements peuvent partager le même serveur
+        'KEY_PREFIX': config('CACHE_KEY_PREFIX', default='sharetech'),
+        # Incrémenter CACHE_VERSION invalide tout le cache (ex : format des entrées modifié)
+        'VERSION': config('CACHE_VERSION', default=1, cast=int),
+        'TIMEOUT': config('CACHE_TIMEOUT', default=300, cast=int),
     }
 }
 
+# Nombre de process servant l'application (publié par gunicorn.conf.py, 1 en dev)
+# Dès 2 process, le cache doit être partagé : versions du cache de réponses,
+# registre des tags, seaux du throttling et santé des réplicas. Un cache propre
+# à chaque process servirait des réponses périmées après une écriture faite par
+# un autre worker et multiplierait les limites de débit par le nombre de workers.
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=1, cast=int)
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+if WEB_CONCURRENCY > 1 and CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+    raise ImproperlyConfigured(
+        f"{WEB_CONCURRENCY} workers avec un cache propre à chaque process : définir "
+        "CACHE_BACKEND=redis (ou memcached) et CACHE_LOCATION, ou WEB_CONCURRENCY=1"
+    )
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -143,6 +299,26 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Dossier rempli par collectstatic (image Docker de production)
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Production : noms hashés + versions gzip/brotli pré-calculées par collectstatic
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
+
+# Fichiers uploadés (pièces jointes)
+MEDIA_URL = config('MEDIA_URL', default='/media/')
+MEDIA_ROOT = config('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -163,4 +339,43 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'sharetech.settings.CsrfExemptSessionAuthentication',
     ],
-}
\ No newline at end of file
+    # JSON encodé / décodé par orjson si disponible (voir JSON_BACKEND)
+    'DEFAULT_RENDERER_CLASSES': [
+        'sharetech.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'sharetech.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Throttling pondéré par coût (voir sharetech/throttling.py)
+    'DEFAULT_THROTTLE_CLASSES': [
+        'sharetech.throttling.UserCostThrottle',
+        'sharetech.throttling.EndpointCostThrottle',
+    ],
+    # Jetons par période : une recherche consomme plusieurs jetons
+    'DEFAULT_THROTTLE_RATES': {
+        'anon': config('THROTTLE_RATE_ANON', default='60/min'),
+        'user': config('THROTTLE_RATE_USER', default='1200/min'),
+        'projects': config('THROTTLE_RATE_PROJECTS', default='600/min'),
+        'notes': config('THROTTLE_RATE_NOTES', default='600/min'),
+        'comments': config('THROTTLE_RATE_COMMENTS', default='600/min'),
+    },
+}
+
+
+# Load shedding : requêtes API simultanées max par process (0 = illimité)
+# Par défaut la limite de connexions DB : au-delà, les requêtes attendraient une connexion
+MAX_CONCURRENT_REQUESTS = config('MAX_CONCURRENT_REQUESTS', default=DB_MAX_CONNECTIONS, cast=int)
+# ASGI (sharetech/handlers.py) : threads exécutant le code synchrone des requêtes,
+# réutilisés d'une requête à l'autre avec leur connexion DB (à compter dans DB_MAX_CONNECTIONS)
+ASGI_SYNC_THREADS = config('ASGI_SYNC_THREADS', default=MAX_CONCURRENT_REQUESTS or DB_MAX_CONNECTIONS, cast=int)
+# Attente max (secondes) d'une place libre avant de répondre 503
+CONCURRENCY_QUEUE_TIMEOUT = config('CONCURRENCY_QUEUE_TIMEOUT', default=2.0, cast=float)
+# Valeur de l'en-tête Retry-After (secondes) sur les 503
+CONCURRENCY_RETRY_AFTER = config('CONCURRENCY_RETRY_AFTER', default=5, cast=int)
+
+# Cache de réponses (sharetech/cache.py) : durée de vie max d'une entrée (secondes)
+# L'invalidation se fait par versions, cette durée ne sert qu'à libérer la mémoire
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=300, cast=int)
\ No newline at end of file
@@ -0,0 +1,43 @@
+# backend/sharetech/streaming.py
+"""
+Réponses en streaming servies sous WSGI comme sous ASGI (exports, imports)
+
+Sous ASGI, Django 5.0 ne sait servir un itérateur SYNCHRONE qu'en le
+consommant entièrement (sync_to_async(list)) avant d'envoyer le premier
+octet : mémoire proportionnelle à l'export, aucun avancement visible.
+streaming_response sert alors un itérateur async dont chaque morceau est
+produit par sync_to_async(next) : le code ORM synchrone (un lot par morceau)
+tourne dans le thread sync de la requête, les morceaux partent au fil de l'eau.
+
+Les générateurs doivent produire des morceaux de taille raisonnable (un lot,
+pas une ligne) : chaque morceau coûte un passage par le thread sync.
+"""
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+
+def is_asgi(request):
+    """Requête servie par le handler ASGI (request Django ou DRF)"""
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+
+async def iterate_async(iterator):
+    """Itérateur async sur un itérateur synchrone, chaque next() dans le thread sync"""
+    step = sync_to_async(next, thread_sensitive=True)
+    done = object()
+    try:
+        while (chunk := await step(iterator, done)) is not done:
+            yield chunk
+    finally:
+        # Client déconnecté : le générateur libère ses ressources (transaction, fichier)
+        if hasattr(iterator, 'close'):
+            await sync_to_async(iterator.close, thread_sensitive=True)()
+
+
+def streaming_response(request, chunks, content_type):
+    """StreamingHttpResponse de chunks (itérateur synchrone), async sous ASGI"""
+    if is_asgi(request):
+        chunks = iterate_async(iter(chunks))
+    return StreamingHttpResponse(chunks, content_type=content_type)
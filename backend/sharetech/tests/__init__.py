@@ -0,0 +1,2 @@
+# backend/sharetech/tests/__init__.py
+# Tests des briques transverses (throttling, middlewares, cache...)
@@ -0,0 +1,205 @@
+# backend/sharetech/tests/test_async_views.py
+"""
+Tests des vues async (/api/async/...)
+
+Les requêtes passent par le handler ASGI (AsyncClient) et sont comparées
+aux réponses des ViewSets DRF équivalents.
+transaction=True : run_queries lit avec d'autres connexions que celle du test.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+
+from comments.models import Comment
+from notes.models import Note
+from projects.models import ProjectMember
+from tasks.models import Task
+
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def member_project(sample_project, junior_user):
+    """
+    Projet dont junior_user est membre
+    """
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    return sample_project
+
+
+@pytest.fixture
+def clients(junior_user):
+    """
+    (client WSGI, client ASGI) connectés en tant que junior_user
+    """
+    sync_client, async_client = Client(), AsyncClient()
+    sync_client.force_login(junior_user)
+    async_client.force_login(junior_user)
+    return sync_client, async_client
+
+
+def async_get(client, path):
+    return async_to_sync(client.get)(path)
+
+
+def test_project_detail_matches_sync_view(clients, member_project):
+    """
+    Test : Le détail async d'un projet (avec membres) = réponse du ViewSet
+    """
+    # ARRANGE
+    sync_client, async_client = clients
+
+    # ACT
+    expected = sync_client.get(f'/api/projects/{member_project.id}/')
+    response = async_get(async_client, f'/api/async/projects/{member_project.id}/')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.json() == expected.json()
+    assert [m['username'] for m in response.json()['members']] == ['juniortest']
+
+
+def test_project_detail_hidden_project_is_404(clients, sample_project):
+    """
+    Test : Projet dont l'utilisateur n'est pas membre → 404
+    """
+    # ACT
+    response = async_get(clients[1], f'/api/async/projects/{sample_project.id}/')
+
+    # ASSERT
+    assert response.status_code == 404
+
+
+def test_notes_by_project_matches_sync_view(clients, member_project, junior_user):
+    """
+    Test : Les notes async d'un projet = GET /api/notes/by_project/
+    """
+    # ARRANGE
+    sync_client, async_client = clients
+    for title in ('A', 'B'):
+        Note.objects.create(title=title, content='x', project=member_project, author=junior_user)
+
+    # ACT
+    expected = sync_client.get(f'/api/notes/by_project/?project={member_project.id}')
+    response = async_get(async_client, f'/api/async/notes/?project={member_project.id}')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.json() == expected.json()
+    assert len(response.json()) == 2
+
+
+def test_notes_by_project_requires_project(clients):
+    """
+    Test : ?project manquant → 400
+    """
+    # ACT
+    response = async_get(clients[1], '/api/async/notes/')
+
+    # ASSERT
+    assert response.status_code == 400
+
+
+def test_comment_tree_matches_sync_view(clients, member_project, junior_user, senior_user):
+    """
+    Test : L'arbre async (une requête) = l'arbre récursif du ViewSet
+    """
+    # ARRANGE
+    sync_client, async_client = clients
+    note = Note.objects.create(title='N', content='x', project=member_project, author=junior_user)
+    root = Comment.objects.create(content='racine', note=note, author=senior_user)
+    reply = Comment.objects.create(content='réponse', note=note, author=junior_user, parent_comment=root)
+    Comment.objects.create(content='réponse 2', note=note, author=None, parent_comment=reply)
+    Comment.objects.create(content='autre racine', note=note, author=junior_user)
+
+    # ACT
+    expected = sync_client.get(f'/api/notes/{note.id}/comments/')
+    response = async_get(async_client, f'/api/async/notes/{note.id}/comments/')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.json() == expected.json()
+    assert response.json()[0]['replies'][0]['replies'][0]['content'] == 'réponse 2'
+
+
+def test_my_tasks_matches_sync_view(clients, sample_project, junior_user, lead_user):
+    """
+    Test : Les tâches async de l'utilisateur = GET /api/tasks/my_tasks/
+    """
+    # ARRANGE
+    sync_client, async_client = clients
+    Task.objects.create(
+        title='Mine', project=sample_project, created_by=lead_user,
+        assigned_to=junior_user, estimated_hours='2.50'
+    )
+    Task.objects.create(title='Other', project=sample_project, created_by=lead_user)
+
+    # ACT
+    expected = sync_client.get('/api/tasks/my_tasks/')
+    response = async_get(async_client, '/api/async/tasks/my_tasks/')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.json() == expected.json()
+    assert [t['title'] for t in response.json()] == ['Mine']
+
+
+def test_anonymous_and_write_requests_are_rejected(clients, member_project):
+    """
+    Test : Non connecté → 403 (comme DRF), POST → 405
+    """
+    # ACT
+    anonymous = async_get(AsyncClient(), '/api/async/tasks/my_tasks/')
+    post = async_to_sync(clients[1].post)('/api/async/tasks/my_tasks/')
+
+    # ASSERT
+    assert anonymous.status_code == 403
+    assert post.status_code == 405
+
+
+def test_async_views_are_throttled(clients, settings):
+    """
+    Test : Le throttling par coût s'applique aussi aux vues async
+    """
+    # ARRANGE
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], 'notes': '3/min'},
+    }
+
+    # ACT
+    first = async_get(clients[1], '/api/async/notes/?project=1')
+    second = async_get(clients[1], '/api/async/notes/?project=1')
+
+    # ASSERT
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert int(second['Retry-After']) > 0
+
+
+def test_query_threads_keep_persistent_connections(settings, monkeypatch):
+    """
+    Test : Les threads SQL réutilisent leur connexion d'une requête à l'autre (CONN_MAX_AGE)
+    """
+    # ARRANGE : nouveau pool d'un thread
+    from django.db import connection
+    from sharetech import async_api
+
+    settings.ASYNC_QUERY_THREADS = 1
+    monkeypatch.setattr(async_api, '_executor', None)
+
+    def raw_connection():
+        Note.objects.exists()
+        return connection.connection
+
+    # ACT
+    try:
+        first, second = async_to_sync(async_api.run_queries)(raw_connection, raw_connection)
+    finally:
+        async_api.get_executor().shutdown()
+
+    # ASSERT
+    assert first is not None
+    assert first is second
@@ -0,0 +1,70 @@
+# backend/sharetech/tests/test_cache_health.py
+"""
+Tests de la configuration du cache et de l'endpoint de santé
+"""
+
+import pytest
+from django.core.cache import cache
+
+from projects.models import ProjectMember
+
+
+@pytest.mark.django_db
+def test_cache_health_is_public_without_stats(api_client):
+    """
+    Test : La sonde de santé répond sans authentification, sans les stats
+    """
+    # ACT
+    response = api_client.get('/api/health/cache/')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.data['status'] == 'ok'
+    assert 'latency_ms' in response.data
+    assert 'stats' not in response.data
+
+
+@pytest.mark.django_db
+def test_cache_health_exposes_stats_to_admin(
+    authenticated_admin_client, sample_project, admin_user
+):
+    """
+    Test : Un admin voit la configuration et les hits / misses du cache de réponses
+    """
+    # ARRANGE
+    ProjectMember.objects.create(project=sample_project, user=admin_user)
+    before = authenticated_admin_client.get('/api/health/cache/').data['stats']['response_cache']
+    authenticated_admin_client.get(f'/api/projects/{sample_project.id}/')  # miss
+    authenticated_admin_client.get(f'/api/projects/{sample_project.id}/')  # hit
+
+    # ACT
+    stats = authenticated_admin_client.get('/api/health/cache/').data['stats']
+
+    # ASSERT
+    assert stats['key_prefix'] == 'sharetech'
+    assert stats['response_cache']['hits'] == before['hits'] + 1
+    assert stats['response_cache']['misses'] == before['misses'] + 1
+
+
+@pytest.mark.django_db
+def test_file_based_cache_stands_in(settings, tmp_path, api_client):
+    """
+    Test : Le backend fichier fonctionne comme doublure du cache partagé
+    """
+    # ARRANGE
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(tmp_path),
+            'KEY_PREFIX': 'sharetech-test',
+        }
+    }
+
+    # ACT
+    response = api_client.get('/api/health/cache/')
+    cache.set('probe', 42)
+
+    # ASSERT
+    assert response.data['status'] == 'ok'
+    assert cache.get('probe') == 42
+    assert any(tmp_path.iterdir())
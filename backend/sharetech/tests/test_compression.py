@@ -0,0 +1,187 @@
+# backend/sharetech/tests/test_compression.py
+"""
+Tests de la compression des réponses (CompressionMiddleware, sharetech/middleware.py)
+"""
+
+import gzip
+
+import pytest
+
+from comments.models import Comment
+from notes.models import Note
+from projects.models import ProjectMember
+from sharetech import middleware
+
+
+GZIP = {'HTTP_ACCEPT_ENCODING': 'gzip, deflate, br'}
+
+
+@pytest.fixture
+def member_project(sample_project, junior_user):
+    """
+    Projet dont junior_user est membre
+    """
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    return sample_project
+
+
+@pytest.fixture
+def many_notes(member_project, junior_user):
+    """100 notes au contenu volumineux"""
+    Note.objects.bulk_create([
+        Note(
+            title=f'Note {i}', content='Paragraphe de documentation. ' * 100,
+            excerpt='Paragraphe de documentation.', project=member_project, author=junior_user,
+        )
+        for i in range(100)
+    ])
+    return member_project
+
+
+@pytest.mark.django_db
+def test_large_note_list_is_compressed(authenticated_junior_client, many_notes):
+    """
+    Test : Grande liste de notes → gzip, corps beaucoup plus petit, même contenu
+    """
+    # ACT
+    plain = authenticated_junior_client.get(f'/api/notes/?project={many_notes.id}')
+    compressed = authenticated_junior_client.get(f'/api/notes/?project={many_notes.id}', **GZIP)
+
+    # ASSERT
+    assert compressed['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed['Vary']
+    assert gzip.decompress(compressed.content) == plain.content
+    assert len(compressed.content) * 5 < len(plain.content)
+    assert int(compressed['Content-Length']) == len(compressed.content)
+
+
+@pytest.mark.django_db
+def test_comment_tree_is_compressed(authenticated_junior_client, member_project, junior_user):
+    """
+    Test : Arbre de commentaires volumineux → gzip
+    """
+    # ARRANGE
+    note = Note.objects.create(title='N', content='x', project=member_project, author=junior_user)
+    for i in range(30):
+        root = Comment.objects.create(content='Commentaire détaillé ' * 10, note=note, author=junior_user)
+        Comment.objects.create(content='Réponse ' * 10, note=note, author=junior_user, parent_comment=root)
+
+    # ACT
+    response = authenticated_junior_client.get(f'/api/notes/{note.id}/comments/', **GZIP)
+
+    # ASSERT
+    assert response['Content-Encoding'] == 'gzip'
+    assert len(gzip.decompress(response.content)) > 3 * len(response.content)
+
+
+@pytest.mark.django_db
+def test_small_or_unaccepted_responses_are_not_compressed(
+    authenticated_junior_client, member_project, many_notes
+):
+    """
+    Test : Corps sous COMPRESSION_MIN_SIZE ou client sans gzip → réponse intacte
+    """
+    # ACT
+    small = authenticated_junior_client.get(f'/api/projects/{member_project.id}/', **GZIP)
+    identity = authenticated_junior_client.get(
+        f'/api/notes/?project={many_notes.id}', HTTP_ACCEPT_ENCODING='identity'
+    )
+
+    # ASSERT
+    assert not small.has_header('Content-Encoding')
+    assert not identity.has_header('Content-Encoding')
+    assert 'Accept-Encoding' in identity['Vary']
+
+
+@pytest.mark.django_db
+def test_content_type_allowlist(authenticated_junior_client, many_notes, settings):
+    """
+    Test : Type de contenu absent de COMPRESSION_CONTENT_TYPES → non compressé
+    """
+    # ARRANGE
+    settings.COMPRESSION_CONTENT_TYPES = ['text/csv']
+
+    # ACT
+    response = authenticated_junior_client.get(f'/api/notes/?project={many_notes.id}', **GZIP)
+
+    # ASSERT
+    assert not response.has_header('Content-Encoding')
+
+
+@pytest.mark.django_db
+def test_compressed_response_keeps_conditional_get(authenticated_junior_client, many_notes):
+    """
+    Test : ETag fort propre au corps compressé ("...-gzip"), If-None-Match avec cet ETag → 304
+    qui le renvoie ; le corps non compressé a un autre ETag
+    """
+    # ARRANGE
+    url = f'/api/notes/?project={many_notes.id}'
+    first = authenticated_junior_client.get(url, **GZIP)
+    identity = authenticated_junior_client.get(url)
+
+    # ACT
+    second = authenticated_junior_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'], **GZIP)
+
+    # ASSERT
+    assert first['ETag'].startswith('"') and first['ETag'].endswith('-gzip"')
+    assert identity['ETag'] != first['ETag']
+    assert second.status_code == 304
+    assert second['ETag'] == first['ETag']
+
+
+@pytest.mark.django_db
+def test_streaming_export_is_compressed(authenticated_junior_client, many_notes):
+    """
+    Test : Export NDJSON en streaming compressé au fil de l'eau, même contenu
+    """
+    # ARRANGE
+    url = f'/api/projects/{many_notes.id}/export/?resource=notes'
+    plain = b''.join(authenticated_junior_client.get(url).streaming_content)
+
+    # ACT
+    response = authenticated_junior_client.get(url, **GZIP)
+
+    # ASSERT
+    assert response['Content-Encoding'] == 'gzip'
+    assert not response.has_header('Content-Length')
+    assert gzip.decompress(b''.join(response.streaming_content)) == plain
+
+
+@pytest.mark.django_db
+def test_compression_cache_compresses_identical_bodies_once(
+    authenticated_junior_client, many_notes, settings, monkeypatch
+):
+    """
+    Test : COMPRESSION_CACHE → deux réponses identiques, une seule compression
+    """
+    # ARRANGE
+    settings.COMPRESSION_CACHE = True
+    calls = []
+    compress = middleware.gzip.compress
+    monkeypatch.setattr(
+        middleware.gzip, 'compress', lambda *args, **kwargs: calls.append(1) or compress(*args, **kwargs)
+    )
+    url = f'/api/notes/?project={many_notes.id}'
+
+    # ACT
+    first = authenticated_junior_client.get(url, **GZIP)
+    second = authenticated_junior_client.get(url, **GZIP)
+
+    # ASSERT
+    assert len(calls) == 1
+    assert second.content == first.content
+
+
+@pytest.mark.django_db
+def test_html_pages_are_not_compressed(client):
+    """
+    Test : Pages HTML (jeton CSRF) jamais compressées par défaut (BREACH)
+    """
+    # ACT
+    response = client.get('/admin/login/', **GZIP)
+
+    # ASSERT
+    assert response.status_code == 200
+    assert len(response.content) >= 1024
+    assert 'csrfmiddlewaretoken' in response.content.decode()
+    assert not response.has_header('Content-Encoding')
@@ -0,0 +1,217 @@
+# backend/sharetech/tests/test_concurrency.py
+"""
+Tests de la concurrence optimiste (sharetech/concurrency.py)
+"""
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
+
+from comments.models import Comment
+from notes.models import Note
+from projects.models import ProjectMember
+from sharetech.concurrency import VersionConflict
+from tasks.models import Task
+
+
+@pytest.fixture
+def member_note(sample_project, junior_user):
+    """
+    Note de junior_user dans un projet dont il est membre
+    """
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    return Note.objects.create(title='Test Note', content='Contenu', project=sample_project, author=junior_user)
+
+
+@pytest.mark.django_db
+def test_matching_if_match_updates_and_bumps_version(authenticated_junior_client, member_note):
+    """
+    Test : If-Match avec la version lue → 200, version incrémentée
+    """
+    # ARRANGE
+    url = f'/api/notes/{member_note.id}/'
+    version = authenticated_junior_client.get(url).data['version']
+
+    # ACT
+    response = authenticated_junior_client.patch(
+        url, {'title': 'Titre modifié'}, format='json', HTTP_IF_MATCH=f'"{version}"'
+    )
+
+    # ASSERT
+    assert response.status_code == 200
+    member_note.refresh_from_db()
+    assert member_note.title == 'Titre modifié'
+    assert member_note.version == version + 1
+
+
+@pytest.mark.django_db
+def test_etag_from_get_is_accepted_by_if_match(authenticated_junior_client, member_note):
+    """
+    Test : GET (compressé), PATCH puis PUT avec l'ETag reçu à chaque fois → 200 ; ETag périmé → 412
+    """
+    # ARRANGE
+    url = f'/api/notes/{member_note.id}/'
+    member_note.content = 'Paragraphe de documentation. ' * 100  # Assez long pour être compressé
+    member_note.save()
+    detail = authenticated_junior_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+
+    # ACT
+    patched = authenticated_junior_client.patch(
+        url, {'title': 'Titre modifié'}, format='json', HTTP_IF_MATCH=detail['ETag']
+    )
+    put = authenticated_junior_client.put(
+        url, {'title': 'Titre remplacé', 'content': 'Contenu'}, format='json', HTTP_IF_MATCH=patched['ETag']
+    )
+    stale = authenticated_junior_client.patch(
+        url, {'title': 'Trop tard'}, format='json', HTTP_IF_MATCH=detail['ETag']
+    )
+
+    # ASSERT
+    assert detail['Content-Encoding'] == 'gzip'
+    assert detail['ETag'].startswith('"2.') and detail['ETag'].endswith('-gzip"')
+    assert (patched.status_code, put.status_code, stale.status_code) == (200, 200, 412)
+    assert put['ETag'].startswith('"4.')
+    member_note.refresh_from_db()
+    assert (member_note.title, member_note.version) == ('Titre remplacé', 4)
+
+
+@pytest.mark.django_db
+def test_if_none_match_with_version_etag_is_304(authenticated_junior_client, member_note):
+    """
+    Test : Le détail répond 304 à If-None-Match avec l'ETag reçu
+    """
+    # ARRANGE
+    url = f'/api/notes/{member_note.id}/'
+    etag = authenticated_junior_client.get(url)['ETag']
+
+    # ACT
+    response = authenticated_junior_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # ASSERT
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_detail_etag_depends_on_fields_and_related_data(
+    authenticated_junior_client, member_note, django_capture_on_commit_callbacks
+):
+    """
+    Test : ?fields= ou projet renommé (project_name) → autre ETag, pas de 304 périmé ;
+    la version reste lisible par If-Match
+    """
+    # ARRANGE
+    url = f'/api/notes/{member_note.id}/'
+    etag = authenticated_junior_client.get(url)['ETag']
+
+    # ACT
+    sparse = authenticated_junior_client.get(f'{url}?fields=id,title', HTTP_IF_NONE_MATCH=etag)
+    with django_capture_on_commit_callbacks(execute=True):
+        member_note.project.name = 'Projet renommé'
+        member_note.project.save()
+    renamed = authenticated_junior_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    patched = authenticated_junior_client.patch(url, {'title': 'T'}, format='json', HTTP_IF_MATCH=etag)
+
+    # ASSERT
+    assert (sparse.status_code, renamed.status_code) == (200, 200)
+    assert sparse['ETag'] != etag and renamed['ETag'] != etag
+    assert renamed.data['project_name'] == 'Projet renommé'
+    assert etag.startswith('"1.') and renamed['ETag'].startswith('"1.')
+    assert patched.status_code == 200
+
+
+@pytest.mark.django_db
+def test_stale_if_match_is_412(authenticated_junior_client, member_note):
+    """
+    Test : If-Match avec une version périmée → 412, rien n'est écrit
+    """
+    # ARRANGE
+    member_note.title = 'Modifié par un autre'
+    member_note.save()
+
+    # ACT
+    response = authenticated_junior_client.patch(
+        f'/api/notes/{member_note.id}/', {'title': 'Mon titre'}, format='json', HTTP_IF_MATCH='"1"'
+    )
+
+    # ASSERT
+    assert response.status_code == 412
+    member_note.refresh_from_db()
+    assert member_note.title == 'Modifié par un autre'
+    assert member_note.version == 2
+
+
+@pytest.mark.django_db
+def test_if_unmodified_since(authenticated_junior_client, member_note):
+    """
+    Test : If-Unmodified-Since antérieur à updated_at → 412, postérieur → 200
+    """
+    # ARRANGE
+    url = f'/api/notes/{member_note.id}/'
+    before = http_date(member_note.updated_at.timestamp() - 60)
+    after = http_date(member_note.updated_at.timestamp() + 60)
+
+    # ACT
+    stale = authenticated_junior_client.patch(url, {'title': 'A'}, format='json', HTTP_IF_UNMODIFIED_SINCE=before)
+    fresh = authenticated_junior_client.patch(url, {'title': 'B'}, format='json', HTTP_IF_UNMODIFIED_SINCE=after)
+
+    # ASSERT
+    assert stale.status_code == 412
+    assert fresh.status_code == 200
+
+
+@pytest.mark.django_db
+def test_stale_instance_save_is_a_single_conditional_update(member_note):
+    """
+    Test : Instance périmée → VersionConflict, un seul UPDATE, aucun verrou
+    """
+    # ARRANGE
+    stale = Note.objects.get(pk=member_note.pk)
+    member_note.title = 'Première écriture'
+    member_note.save()
+
+    # ACT
+    stale.title = 'Deuxième écriture'
+    with CaptureQueriesContext(connection) as queries:
+        with pytest.raises(VersionConflict), transaction.atomic():
+            stale.save(update_fields=['title'])
+
+    # ASSERT
+    sql = [q['sql'] for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+    assert len(sql) == 1
+    assert sql[0].startswith('UPDATE') and '"version" = 1' in sql[0]
+    assert 'FOR UPDATE' not in sql[0]
+    assert stale.version == 1
+    member_note.refresh_from_db()
+    assert member_note.title == 'Première écriture'
+
+
+@pytest.mark.django_db
+def test_task_and_comment_updates_check_if_match(authenticated_junior_client, member_note, junior_user):
+    """
+    Test : Tâches et commentaires : même contrôle If-Match
+    """
+    # ARRANGE
+    task = Task.objects.create(title='T', project=member_note.project, created_by=junior_user, assigned_to=junior_user)
+    comment = Comment.objects.create(content='Commentaire', note=member_note, author=junior_user)
+    comment_etag = authenticated_junior_client.get(f'/api/comments/{comment.id}/')['ETag']
+
+    # ACT
+    task_ok = authenticated_junior_client.patch(
+        f'/api/tasks/{task.id}/', {'title': 'T2'}, format='json', HTTP_IF_MATCH='"1"'
+    )
+    task_stale = authenticated_junior_client.patch(
+        f'/api/tasks/{task.id}/', {'title': 'T3'}, format='json', HTTP_IF_MATCH='"1"'
+    )
+    comment_ok = authenticated_junior_client.patch(
+        f'/api/comments/{comment.id}/', {'content': 'Modifié'}, format='json', HTTP_IF_MATCH=comment_etag
+    )
+    comment_stale = authenticated_junior_client.patch(
+        f'/api/comments/{comment.id}/', {'content': 'Encore'}, format='json', HTTP_IF_MATCH=comment_etag
+    )
+
+    # ASSERT
+    assert task_ok.status_code == 200
+    assert task_ok.data['version'] == 2
+    assert task_stale.status_code == 412
+    assert (comment_ok.status_code, comment_stale.status_code) == (200, 412)
@@ -0,0 +1,171 @@
+# backend/sharetech/tests/test_conditional.py
+"""
+Tests des GET conditionnels (ETag / Last-Modified)
+"""
+
+import pytest
+from django.contrib.auth.models import User
+
+from notes.models import Note
+from projects.models import ProjectMember
+
+
+@pytest.fixture
+def member_project(sample_project, junior_user):
+    """
+    Projet dont junior_user est membre
+    """
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    return sample_project
+
+
+# ===== LISTES =====
+
+@pytest.mark.django_db
+def test_list_returns_etag_and_last_modified(authenticated_junior_client, member_project, junior_user):
+    """
+    Test : Une liste non vide renvoie ETag et Last-Modified
+    """
+    # ARRANGE
+    Note.objects.create(title='N', content='C', project=member_project, author=junior_user)
+
+    # ACT
+    response = authenticated_junior_client.get('/api/notes/')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response['ETag']
+    assert response['Last-Modified']
+
+
+@pytest.mark.django_db
+def test_unchanged_list_returns_304_with_single_query(
+    authenticated_junior_client, member_project, junior_user, django_assert_num_queries
+):
+    """
+    Test : If-None-Match identique → 304 avec une seule requête d'agrégat
+    (les serializers ne sont pas exécutés)
+    """
+    # ARRANGE
+    from tasks.models import Task
+    Task.objects.create(title='T', project=member_project, created_by=junior_user)
+    etag = authenticated_junior_client.get('/api/tasks/')['ETag']
+
+    # ACT
+    with django_assert_num_queries(1):
+        response = authenticated_junior_client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+
+    # ASSERT
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+
+@pytest.mark.django_db
+def test_list_etag_changes_when_row_is_added(
+    authenticated_junior_client, member_project, junior_user, django_capture_on_commit_callbacks
+):
+    """
+    Test : Ajouter une note change le COUNT → nouvel ETag → 200
+    """
+    # ARRANGE
+    Note.objects.create(title='N1', content='C', project=member_project, author=junior_user)
+    etag = authenticated_junior_client.get('/api/notes/')['ETag']
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        Note.objects.create(title='N2', content='C', project=member_project, author=junior_user)
+
+    # ACT
+    response = authenticated_junior_client.get('/api/notes/', HTTP_IF_NONE_MATCH=etag)
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_list_etag_differs_between_users(api_client, member_project, junior_user, senior_user):
+    """
+    Test : Deux utilisateurs n'obtiennent jamais le même ETag
+    """
+    # ARRANGE
+    ProjectMember.objects.create(project=member_project, user=senior_user)
+    Note.objects.create(title='N', content='C', project=member_project, author=junior_user)
+
+    # ACT
+    api_client.force_authenticate(user=junior_user)
+    junior_etag = api_client.get('/api/notes/')['ETag']
+    api_client.force_authenticate(user=senior_user)
+    senior_etag = api_client.get('/api/notes/')['ETag']
+
+    # ASSERT
+    assert junior_etag != senior_etag
+
+
+# ===== DÉTAILS =====
+
+@pytest.mark.django_db
+def test_detail_returns_304_on_if_modified_since(authenticated_junior_client, member_project):
+    """
+    Test : If-Modified-Since égal au Last-Modified → 304
+    """
+    # ARRANGE
+    first = authenticated_junior_client.get(f'/api/projects/{member_project.id}/')
+
+    # ACT
+    response = authenticated_junior_client.get(
+        f'/api/projects/{member_project.id}/',
+        HTTP_IF_MODIFIED_SINCE=first['Last-Modified']
+    )
+
+    # ASSERT
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_project_detail_etag_changes_when_member_added(
+    authenticated_junior_client, member_project, django_capture_on_commit_callbacks
+):
+    """
+    Test : Le détail d'un projet inclut ses membres,
+    ajouter un membre doit invalider l'ETag
+    """
+    # ARRANGE
+    etag = authenticated_junior_client.get(f'/api/projects/{member_project.id}/')['ETag']
+    other = User.objects.create_user(username='other', password='testpass123')
+
+    # ACT
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        ProjectMember.objects.create(project=member_project, user=other)
+    response = authenticated_junior_client.get(
+        f'/api/projects/{member_project.id}/', HTTP_IF_NONE_MATCH=etag
+    )
+
+    # ASSERT
+    assert response.status_code == 200
+    assert len(response.data['members']) == 2
+
+
+@pytest.mark.django_db
+def test_detail_not_found_is_not_304(authenticated_junior_client):
+    """
+    Test : Un détail inexistant renvoie 404, jamais 304
+    """
+    # ACT
+    response = authenticated_junior_client.get('/api/tasks/9999/', HTTP_IF_NONE_MATCH='*')
+
+    # ASSERT
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_malformed_detail_id_is_404(authenticated_junior_client):
+    """
+    Test : Identifiant non numérique → 404 (pas d'erreur 500 au filtrage)
+    """
+    # ACT
+    responses = [
+        authenticated_junior_client.get(f'/api/{resource}/abc/')
+        for resource in ('notes', 'tasks', 'projects')
+    ]
+
+    # ASSERT
+    assert [response.status_code for response in responses] == [404, 404, 404]
@@ -0,0 +1,189 @@
+# backend/sharetech/tests/test_db_limits.py
+"""
+Tests de la limite de connexions et de ses métriques
+SQLite (fichier temporaire) sert de doublure à MariaDB
+"""
+
+import gc
+import threading
+from types import SimpleNamespace
+
+import pytest
+from django.core.signals import request_finished
+from django.db.utils import ConnectionHandler
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from sharetech.db import limits as limits_module
+from sharetech.db.limits import ConnectionLimitTimeout
+from sharetech.middleware import ConcurrencyLimitMiddleware
+
+
+@pytest.fixture
+def limited_handler(tmp_path):
+    """
+    Fabrique de connexions SQLite instrumentées sur l'alias 'limitstest'
+    (limite de 1 connexion, attente max 10 ms)
+    """
+    config = {
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+        'limitstest': {
+            'ENGINE': 'sharetech.db.backends.sqlite3',
+            'NAME': str(tmp_path / 'limits.sqlite3'),
+            'MAX_CONNECTIONS': 1,
+            'CONNECTION_TIMEOUT': 0.01,
+        }
+    }
+    handlers = []
+
+    def make():
+        handler = ConnectionHandler(config)
+        handlers.append(handler)
+        return handler['limitstest']
+
+    yield make
+    for handler in handlers:
+        handler.close_all()
+    limits_module._limiters.pop('limitstest', None)
+
+
+@pytest.mark.django_db
+def test_connect_and_disconnect_are_counted(limited_handler):
+    """
+    Test : Ouvrir puis fermer une connexion met à jour les métriques
+    """
+    # ARRANGE
+    conn = limited_handler()
+
+    # ACT
+    conn.ensure_connection()
+    during = conn.limiter.stats()
+    conn.close()
+    after = conn.limiter.stats()
+
+    # ASSERT
+    assert during['connects'] == 1
+    assert during['in_use'] == 1
+    assert after['disconnects'] == 1
+    assert after['in_use'] == 0
+
+
+@pytest.mark.django_db
+def test_connection_count_is_bounded_across_connections(limited_handler):
+    """
+    Test : Limite de 1 → une 2ème connexion simultanée lève ConnectionLimitTimeout
+    puis réussit quand la 1ère est rendue
+    """
+    # ARRANGE
+    first = limited_handler()
+    second = limited_handler()
+    first.ensure_connection()
+
+    # ACT & ASSERT
+    with pytest.raises(ConnectionLimitTimeout):
+        second.ensure_connection()
+    assert second.limiter.stats()['timeouts'] == 1
+
+    first.close()
+    second.ensure_connection()
+    assert second.limiter.stats()['in_use'] == 1
+
+
+@pytest.mark.django_db
+def test_reached_limit_does_not_force_garbage_collection(limited_handler, monkeypatch):
+    """
+    Test : Limite atteinte → attente puis ConnectionLimitTimeout, sans gc.collect() sur le chemin de la requête
+    """
+    # ARRANGE
+    first = limited_handler()
+    second = limited_handler()
+    first.ensure_connection()
+    monkeypatch.setattr(gc, 'collect', lambda *args: pytest.fail("gc.collect() forcé"))
+
+    # ACT & ASSERT
+    with pytest.raises(ConnectionLimitTimeout):
+        second.ensure_connection()
+
+
+@pytest.mark.django_db
+def test_reached_limit_gets_slot_back_at_request_end(limited_handler, monkeypatch):
+    """
+    Test : Limite atteinte → la connexion inutilisée est fermée par request_finished, place rendue
+    """
+    # ARRANGE
+    conn = limited_handler()
+    conn.ensure_connection()
+    monkeypatch.setattr(
+        limits_module, 'connections', SimpleNamespace(all=lambda initialized_only=False: [conn])
+    )
+
+    # ACT
+    request_finished.send(sender=None)
+
+    # ASSERT
+    assert conn.connection is None
+    assert conn.limiter.stats()['in_use'] == 0
+    assert conn.limiter.stats()['abandoned'] == 0
+
+
+@pytest.mark.django_db
+def test_abandoned_connection_gives_its_slot_back(limited_handler):
+    """
+    Test : Filet de sécurité : une connexion ouverte dans un thread terminé
+    sans close() rend sa place quand le wrapper est libéré
+    """
+    # ARRANGE
+    conn = limited_handler()
+    limiter = conn.limiter
+    handler = ConnectionHandler({'default': conn.settings_dict, 'limitstest': conn.settings_dict})
+
+    def request_thread():
+        # Connexion propre au thread (comme dans runserver), jamais fermée
+        handler['limitstest'].ensure_connection()
+
+    # ACT
+    thread = threading.Thread(target=request_thread)
+    thread.start()
+    thread.join()
+    during = limiter.stats()['in_use']
+    gc.collect()
+
+    # ASSERT
+    assert during == 1
+    assert limiter.stats()['in_use'] == 0
+    assert limiter.stats()['abandoned'] == 1
+
+
+def test_connection_limit_timeout_becomes_503(settings):
+    """
+    Test : Un ConnectionLimitTimeout pendant la requête donne 503 + Retry-After
+    """
+    # ARRANGE
+    settings.CONCURRENCY_RETRY_AFTER = 3
+    middleware = ConcurrencyLimitMiddleware(lambda request: HttpResponse('ok'))
+
+    # ACT
+    response = middleware.process_exception(
+        RequestFactory().get('/api/notes/'), ConnectionLimitTimeout('saturé')
+    )
+
+    # ASSERT
+    assert response.status_code == 503
+    assert response['Retry-After'] == '3'
+
+
+@pytest.mark.django_db
+def test_db_health_exposes_connection_metrics_to_admin(api_client, admin_user):
+    """
+    Test : /api/health/db/ est public, les métriques de connexion réservées aux admins
+    """
+    # ACT
+    public = api_client.get('/api/health/db/')
+    api_client.force_authenticate(user=admin_user)
+    admin = api_client.get('/api/health/db/')
+
+    # ASSERT
+    assert public.status_code == 200
+    assert public.data['databases']['default']['status'] == 'ok'
+    assert 'connection_limits' not in public.data
+    assert 'connects' in admin.data['connection_limits']['default']
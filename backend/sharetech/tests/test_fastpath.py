@@ -0,0 +1,127 @@
+# backend/sharetech/tests/test_fastpath.py
+"""
+Tests de la sérialisation des listes par values_list (sharetech/fastpath.py)
+
+Parité : un queryset (values_list) et la liste de ses instances (sérialisation
+classique) doivent donner exactement le même JSON.
+"""
+
+import datetime
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from comments.models import Comment
+from notes.models import Note
+from notes.serializers import NoteListSerializer
+from notes.views import annotate_comment_stats
+from projects.models import ProjectMember
+from tasks.models import Task
+from tasks.serializers import TaskSerializer
+
+
+def render_both(serializer_class, queryset):
+    """(JSON par values_list, JSON par instances)"""
+    fast = JSONRenderer().render(serializer_class(queryset, many=True).data)
+    slow = JSONRenderer().render(serializer_class(list(queryset), many=True).data)
+    return fast, slow
+
+
+@pytest.fixture
+def tasks(sample_project, lead_user, junior_user):
+    """Tâches avec décimaux, dates, assignation et valeurs nulles"""
+    Task.objects.create(
+        title='Complète', description='Détails "échappés"\n', project=sample_project,
+        created_by=lead_user, assigned_to=junior_user, priority='haute',
+        estimated_hours='2.50', actual_hours='3', due_date=datetime.date(2026, 1, 31),
+    )
+    Task.objects.create(title='Minimale', project=sample_project, created_by=lead_user)
+    Task.objects.create(
+        title='Terminée', project=sample_project, created_by=lead_user, status='terminee',
+        completed_date=datetime.date(2026, 2, 1),
+    )
+
+
+@pytest.mark.django_db
+def test_task_list_matches_classic_serialization(tasks, django_assert_num_queries):
+    """
+    Test : Même JSON octet pour octet, en une seule requête
+    """
+    # ARRANGE
+    queryset = Task.objects.order_by('id')
+
+    # ACT
+    with django_assert_num_queries(1):
+        data = TaskSerializer(queryset, many=True).data
+    fast, slow = render_both(TaskSerializer, queryset)
+
+    # ASSERT
+    assert fast == slow
+    assert data[0]['estimated_hours'] == '2.50'
+    assert data[1]['assigned_to_username'] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('mode', ['aggregate', 'counters'])
+def test_note_list_matches_classic_serialization(sample_project, junior_user, settings, mode):
+    """
+    Test : Même JSON pour les notes, statistiques annotées ou dénormalisées
+    """
+    # ARRANGE
+    settings.NOTE_COMMENT_STATS = mode
+    note = Note.objects.create(title='A', content='x' * 300, project=sample_project, author=junior_user)
+    Note.objects.create(title='B', content='y', status='publie', project=sample_project, author=junior_user)
+    root = Comment.objects.create(content='c', note=note, author=junior_user)
+    Comment.objects.create(content='r', note=note, author=junior_user, parent_comment=root)
+    queryset = annotate_comment_stats(Note.objects.defer('content'))
+
+    # ACT
+    fast, slow = render_both(NoteListSerializer, queryset)
+
+    # ASSERT
+    assert fast == slow
+    assert b'"comment_count":2' in fast
+
+
+@pytest.mark.django_db
+def test_task_list_endpoint_query_count_does_not_grow(
+    authenticated_lead_client, sample_project, lead_user, django_assert_max_num_queries
+):
+    """
+    Test : GET /api/tasks/ ne fait plus une requête par tâche (projet, créateur)
+    """
+    # ARRANGE
+    url = f'/api/tasks/?project={sample_project.id}'
+    Task.objects.create(title='T0', project=sample_project, created_by=lead_user)
+
+    # ACT & ASSERT
+    with django_assert_max_num_queries(3) as small:
+        authenticated_lead_client.get(url)
+    for i in range(1, 10):
+        Task.objects.create(title=f'T{i}', project=sample_project, created_by=lead_user)
+    with django_assert_max_num_queries(3) as large:
+        response = authenticated_lead_client.get(url)
+    assert len(small.captured_queries) == len(large.captured_queries)
+    assert len(response.data) == 10
+
+
+@pytest.mark.django_db
+def test_expand_falls_back_to_classic_serialization(
+    authenticated_junior_client, sample_project, junior_user, lead_user
+):
+    """
+    Test : ?expand= (serializer imbriqué) utilise la sérialisation classique
+    """
+    # ARRANGE
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    Task.objects.create(title='T', project=sample_project, created_by=lead_user, assigned_to=junior_user)
+
+    # ACT
+    response = authenticated_junior_client.get(
+        f'/api/tasks/?project={sample_project.id}&expand=assigned_to'
+    )
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.data[0]['assigned_to']['username'] == 'juniortest'
+    assert response.data[0]['project_name'] == sample_project.name
@@ -0,0 +1,113 @@
+# backend/sharetech/tests/test_fieldsets.py
+"""
+Tests de ?fields= et ?expand= (sharetech/fieldsets.py)
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from notes.models import Note
+from projects.models import ProjectMember
+from tasks.models import Task
+
+
+@pytest.fixture
+def member_project(sample_project, junior_user, senior_user):
+    """
+    Projet dont junior_user et senior_user sont membres
+    """
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    ProjectMember.objects.create(project=sample_project, user=senior_user)
+    return sample_project
+
+
+@pytest.mark.django_db
+def test_fields_limits_response_and_skips_content_column(
+    authenticated_junior_client, member_project, junior_user
+):
+    """
+    Test : ?fields=id,title → seulement ces champs, content ni lu ni joint
+    """
+    # ARRANGE
+    Note.objects.create(title='N', content='très long contenu', project=member_project, author=junior_user)
+
+    # ACT
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_junior_client.get('/api/notes/?fields=id,title')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert list(response.data[0]) == ['id', 'title']
+    select = next(q['sql'] for q in queries.captured_queries if 'FROM "note"' in q['sql'] and 'MAX' not in q['sql'])
+    assert '"note"."content"' not in select
+    assert 'JOIN "auth_user"' not in select
+    assert 'COUNT("comment"' not in select  # Statistiques de commentaires non demandées
+
+
+@pytest.mark.django_db
+def test_expand_nests_related_object(authenticated_junior_client, member_project, senior_user, lead_user):
+    """
+    Test : ?expand=assigned_to → utilisateur complet, en une jointure
+    """
+    # ARRANGE
+    for i in range(3):
+        Task.objects.create(title=f'T{i}', project=member_project, created_by=lead_user, assigned_to=senior_user)
+
+    # ACT
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_junior_client.get(
+            f'/api/tasks/?project={member_project.id}&fields=id,title&expand=assigned_to'
+        )
+
+    # ASSERT
+    assert response.status_code == 200
+    assert set(response.data[0]) == {'id', 'title', 'assigned_to'}
+    assert response.data[0]['assigned_to']['username'] == 'seniortest'
+    assert response.data[0]['assigned_to']['profile']['role'] == 'senior'
+    assert len(queries.captured_queries) == 2  # Validateurs ETag + liste (jointures user / profil)
+
+
+@pytest.mark.django_db
+def test_project_detail_fields_with_members(authenticated_junior_client, member_project):
+    """
+    Test : Détail ?fields=name,members → membres préchargés, sans N+1
+    """
+    # ACT
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_junior_client.get(f'/api/projects/{member_project.id}/?fields=name,members')
+
+    # ASSERT
+    assert set(response.data) == {'name', 'members'}
+    assert {m['username'] for m in response.data['members']} == {'juniortest', 'seniortest'}
+    assert len(queries.captured_queries) == 5  # Validateurs, projet, membres, utilisateurs, profils
+
+
+@pytest.mark.django_db
+def test_default_response_is_unchanged(authenticated_junior_client, member_project, junior_user):
+    """
+    Test : Sans paramètre, tous les champs (dont content et statistiques)
+    """
+    # ARRANGE
+    note = Note.objects.create(title='N', content='C', project=member_project, author=junior_user)
+
+    # ACT
+    response = authenticated_junior_client.get(f'/api/notes/{note.id}/')
+
+    # ASSERT
+    assert {'content', 'author_username', 'comment_count'} <= set(response.data)
+
+
+@pytest.mark.django_db
+def test_unknown_fields_or_expand_are_rejected(authenticated_junior_client, member_project):
+    """
+    Test : Champ ou relation inconnus → 400
+    """
+    # ACT
+    unknown_field = authenticated_junior_client.get('/api/notes/?fields=id,secret')
+    unknown_expand = authenticated_junior_client.get('/api/notes/?expand=comments')
+
+    # ASSERT
+    assert unknown_field.status_code == 400
+    assert 'secret' in str(unknown_field.data['fields'])
+    assert unknown_expand.status_code == 400
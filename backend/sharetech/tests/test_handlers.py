@@ -0,0 +1,118 @@
+# backend/sharetech/tests/test_handlers.py
+"""
+Tests du handler ASGI à threads réutilisés (sharetech/handlers.py)
+
+Les requêtes sont envoyées directement au handler (scope ASGI minimal), dans
+une boucle asyncio.run comme sous uvicorn : avec async_to_sync, asgiref
+renverrait le code synchrone dans le thread du test.
+transaction=True : les threads du handler ont leurs propres connexions.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from django.db import connections
+
+from sharetech.handlers import PooledASGIHandler
+
+
+async def get(handler, path):
+    """GET path sur handler, retourne le statut HTTP"""
+    messages = []
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await asyncio.Future()  # Pas de déconnexion du client
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+        'method': 'GET', 'scheme': 'http', 'path': path, 'query_string': b'',
+        'headers': [], 'server': ('testserver', 80), 'client': ('127.0.0.1', 1234),
+    }
+    await handler(scope, receive, send)
+    return messages[0]['status']
+
+
+def thread_connection(executor):
+    """Connexion DB ouverte dans le thread de executor"""
+    return executor.submit(lambda: connections['default'].connection).result()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_requests_reuse_thread_and_db_connection(settings):
+    """
+    Test : Deux requêtes successives → même thread, même connexion DB (CONN_MAX_AGE)
+    """
+    # ARRANGE
+    settings.ASGI_SYNC_THREADS = 2
+    handler = PooledASGIHandler()
+    pool = handler.sync_threads
+
+    async def scenario():
+        first = await get(handler, '/api/health/db/')
+        connection = thread_connection(pool.idle[0])
+        second = await get(handler, '/api/health/db/')
+        return first, second, connection, thread_connection(pool.idle[0])
+
+    # ACT
+    try:
+        first, second, connection_before, connection_after = asyncio.run(scenario())
+    finally:
+        for executor in pool.idle:
+            executor.submit(connections.close_all).result()
+            executor.shutdown()
+
+    # ASSERT
+    assert (first, second) == (200, 200)
+    assert pool.created == 1
+    assert connection_before is not None
+    assert connection_after is connection_before
+
+
+@pytest.mark.django_db
+def test_all_threads_busy_is_503(settings):
+    """
+    Test : Tous les threads pris → 503 + Retry-After après CONCURRENCY_QUEUE_TIMEOUT
+    """
+    # ARRANGE
+    settings.ASGI_SYNC_THREADS = 1
+    settings.CONCURRENCY_QUEUE_TIMEOUT = 0.01
+    handler = PooledASGIHandler()
+    handler.sync_threads.slots.acquire()  # Simule une requête en cours
+
+    # ACT
+    status = asyncio.run(get(handler, '/api/health/db/'))
+
+    # ASSERT
+    assert status == 503
+    assert handler.sync_threads.created == 0
+
+
+def test_several_workers_require_a_shared_cache():
+    """
+    Test : WEB_CONCURRENCY > 1 avec le cache locmem → les settings refusent de démarrer
+    """
+    # ARRANGE
+    env = {**os.environ, 'WEB_CONCURRENCY': '3', 'CACHE_BACKEND': 'locmem',
+           'SECRET_KEY': 'x', 'DJANGO_SETTINGS_MODULE': 'sharetech.settings'}
+
+    # ACT
+    result = subprocess.run(
+        [sys.executable, '-c', 'import django; django.setup()'],
+        cwd=Path(__file__).resolve().parents[2], env=env, capture_output=True, text=True,
+    )
+
+    # ASSERT
+    assert result.returncode != 0
+    assert 'ImproperlyConfigured' in result.stderr
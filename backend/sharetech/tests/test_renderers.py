@@ -0,0 +1,112 @@
+# backend/sharetech/tests/test_renderers.py
+"""
+Tests du renderer et du parser JSON (sharetech/renderers.py)
+
+La sortie orjson doit être celle de JSONRenderer (DRF), octet pour octet.
+"""
+
+import datetime
+import decimal
+import uuid
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from sharetech.renderers import FastJSONRenderer, dumps
+from tasks.models import Task
+
+pytest.importorskip('orjson')
+
+
+SAMPLE = {
+    'hours': decimal.Decimal('2.50'),
+    'at': datetime.datetime(2026, 3, 1, 12, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+    'naive': datetime.datetime(2026, 3, 1, 12, 30),
+    'day': datetime.date(2026, 3, 1),
+    'time': datetime.time(8, 15, 30, 500000),
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'label': gettext_lazy('Titre'),
+    'text': 'Accents éà, guillemets "x", séparateur \u2028 fin',
+    1: [1.5, None, True, ('a', 'b')],
+}
+
+
+def test_dumps_matches_drf_renderer():
+    """
+    Test : Decimal, datetime, date, time, UUID, chaînes traduites, clés entières,
+    U+2028 → même JSON que JSONRenderer
+    """
+    # ACT
+    fast = dumps(SAMPLE)
+    classic = JSONRenderer().render(SAMPLE)
+
+    # ASSERT
+    assert fast == classic
+    assert b'"2026-03-01T12:30:05.123456Z"' in fast
+    assert b'\\u2028' in fast
+
+
+def test_stdlib_backend_uses_drf_encoder(settings):
+    """
+    Test : JSON_BACKEND = 'stdlib' → encodage par JSONRenderer (même résultat)
+    """
+    # ARRANGE
+    settings.JSON_BACKEND = 'stdlib'
+
+    # ACT & ASSERT
+    assert FastJSONRenderer().render(SAMPLE) == JSONRenderer().render(SAMPLE)
+
+
+def test_indent_falls_back_to_drf_renderer():
+    """
+    Test : Accept: application/json; indent=2 → JSON indenté comme DRF
+    """
+    # ACT
+    rendered = FastJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+
+    # ASSERT
+    assert rendered == b'{\n  "a": 1\n}'
+
+
+@pytest.mark.django_db
+def test_api_response_is_unchanged(authenticated_lead_client, sample_project, lead_user, settings):
+    """
+    Test : GET /api/tasks/ → mêmes octets avec orjson et avec le module json
+    """
+    # ARRANGE
+    Task.objects.create(
+        title='Tâche é', project=sample_project, created_by=lead_user,
+        estimated_hours='1.25', due_date=datetime.date(2026, 5, 1)
+    )
+    url = f'/api/tasks/?project={sample_project.id}'
+
+    # ACT
+    fast = authenticated_lead_client.get(url).content
+    settings.JSON_BACKEND = 'stdlib'
+    classic = authenticated_lead_client.get(url).content
+
+    # ASSERT
+    assert fast == classic
+
+
+@pytest.mark.django_db
+def test_parser_reads_json_and_rejects_invalid_body(authenticated_lead_client, sample_project):
+    """
+    Test : Corps JSON décodé par orjson, JSON invalide → 400
+    """
+    # ACT
+    created = authenticated_lead_client.post(
+        '/api/tasks/', '{"title": "Créée", "project": %d, "estimated_hours": 1.5}' % sample_project.id,
+        content_type='application/json'
+    )
+    invalid = authenticated_lead_client.post(
+        '/api/tasks/', '{"title": ', content_type='application/json'
+    )
+
+    # ASSERT
+    assert created.status_code == 201
+    assert created.data['title'] == 'Créée'
+    assert created.data['estimated_hours'] == '1.50'
+    assert invalid.status_code == 400
+    assert 'JSON parse error' in invalid.data['detail']
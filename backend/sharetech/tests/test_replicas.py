@@ -0,0 +1,136 @@
+# backend/sharetech/tests/test_replicas.py
+"""
+Tests du routage des lectures vers les réplicas
+
+Doublures : la base de test principale (SQLite) et un réplica
+SQLite dans un fichier temporaire, qui contient des données différentes
+pour savoir quelle base a répondu.
+"""
+
+import pytest
+from django.db import connections
+
+from sharetech.db import routers
+from sharetech.db.routers import mark_unhealthy, use_read_alias
+from tags.models import Tag
+
+
+@pytest.fixture
+def sqlite_replica(tmp_path, settings):
+    """
+    Enregistre l'alias 'replica_test' (fichier SQLite) avec une table tag
+    contenant un tag propre au réplica
+    """
+    alias = 'replica_test'
+    connections.settings[alias] = connections.configure_settings({
+        'default': connections.settings['default'],
+        alias: {'ENGINE': 'sharetech.db.backends.sqlite3', 'NAME': str(tmp_path / 'replica.sqlite3')},
+    })[alias]
+    with connections[alias].schema_editor() as editor:
+        editor.create_model(Tag)
+    Tag.objects.using(alias).create(name='from-replica')
+
+    settings.DATABASE_REPLICAS = [alias]
+    settings.REPLICA_CHECK_INTERVAL = 3600
+    routers._last_checked.clear()
+    yield alias
+
+    connections[alias].close()
+    del connections[alias]
+    del connections.settings[alias]
+
+
+def tag_names():
+    return list(Tag.objects.values_list('name', flat=True))
+
+
+@pytest.mark.django_db
+def test_reads_follow_the_request_alias(sqlite_replica, python_tag):
+    """
+    Test : Les lectures vont sur l'alias de la requête, les écritures sur default
+    """
+    # ACT & ASSERT
+    assert tag_names() == ['python']
+    with use_read_alias(sqlite_replica):
+        assert tag_names() == ['from-replica']
+        Tag.objects.create(name='written')  # Écriture → default
+    assert sorted(tag_names()) == ['python', 'written']
+
+
+@pytest.mark.django_db
+def test_safe_api_requests_read_from_replica(sqlite_replica, authenticated_junior_client, python_tag):
+    """
+    Test : Un GET sur l'API lit sur le réplica
+    """
+    # ACT
+    response = authenticated_junior_client.get('/api/tags/')
+
+    # ASSERT
+    assert [t['name'] for t in response.data] == ['from-replica']
+
+
+@pytest.mark.django_db
+def test_session_is_pinned_to_primary_after_write(sqlite_replica, authenticated_junior_client, python_tag):
+    """
+    Test : Après un POST, la même session lit sur la base principale
+    (read-your-writes)
+    """
+    # ARRANGE
+    authenticated_junior_client.post('/api/tags/', {'name': 'x'})  # 405, mais méthode d'écriture
+
+    # ACT
+    response = authenticated_junior_client.get('/api/tags/')
+
+    # ASSERT
+    assert [t['name'] for t in response.data] == ['python']
+
+
+@pytest.mark.django_db
+def test_pin_expires(sqlite_replica, settings, authenticated_junior_client, python_tag):
+    """
+    Test : REPLICA_PIN_SECONDS = 0 → pas d'épinglage durable
+    """
+    # ARRANGE
+    settings.REPLICA_PIN_SECONDS = 0
+    authenticated_junior_client.post('/api/tags/', {'name': 'x'})
+
+    # ACT
+    response = authenticated_junior_client.get('/api/tags/')
+
+    # ASSERT
+    assert [t['name'] for t in response.data] == ['from-replica']
+
+
+@pytest.mark.django_db
+def test_unhealthy_replica_is_skipped(sqlite_replica, authenticated_junior_client, python_tag):
+    """
+    Test : Un réplica marqué hors service n'est plus utilisé
+    """
+    # ARRANGE
+    mark_unhealthy(sqlite_replica)
+
+    # ACT
+    response = authenticated_junior_client.get('/api/tags/')
+
+    # ASSERT
+    assert [t['name'] for t in response.data] == ['python']
+
+
+@pytest.mark.django_db
+def test_lagging_replica_is_marked_unhealthy(sqlite_replica, settings, monkeypatch):
+    """
+    Test : Un retard supérieur à REPLICA_MAX_LAG exclut le réplica
+    """
+    # ARRANGE
+    settings.REPLICA_MAX_LAG = 5
+    settings.REPLICA_CHECK_INTERVAL = 0
+    monkeypatch.setattr(routers, 'get_replica_lag', lambda alias: 42)
+
+    # ACT
+    first = routers.choose_replica()
+    monkeypatch.setattr(routers, 'get_replica_lag', lambda alias: 0)
+    second = routers.choose_replica()  # Toujours exclu : l'état est en cache
+
+    # ASSERT
+    assert first is None
+    assert second is None
@@ -0,0 +1,152 @@
+# backend/sharetech/tests/test_response_cache.py
+"""
+Tests du cache de réponses et de son invalidation par versions
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from notes.models import Note
+from projects.models import ProjectMember
+from sharetech.cache import get_cache_versions
+
+
+@pytest.fixture
+def member_project(sample_project, junior_user):
+    """
+    Projet dont junior_user est membre
+    """
+    ProjectMember.objects.create(project=sample_project, user=junior_user)
+    return sample_project
+
+
+@pytest.mark.django_db
+def test_project_detail_cache_hit_skips_orm(
+    authenticated_junior_client, member_project, django_assert_num_queries
+):
+    """
+    Test : Le 2ème GET du détail d'un projet ne fait aucune requête SQL
+    """
+    # ARRANGE
+    first = authenticated_junior_client.get(f'/api/projects/{member_project.id}/')
+
+    # ACT
+    with django_assert_num_queries(0):
+        second = authenticated_junior_client.get(f'/api/projects/{member_project.id}/')
+
+    # ASSERT
+    assert second.status_code == 200
+    assert second.data == first.data
+    assert second['ETag'] == first['ETag']
+
+
+@pytest.mark.django_db
+def test_cache_hit_answers_304_without_orm(
+    authenticated_junior_client, member_project, django_assert_num_queries
+):
+    """
+    Test : Un hit avec If-None-Match renvoie 304 sans requête SQL
+    """
+    # ARRANGE
+    etag = authenticated_junior_client.get(f'/api/projects/{member_project.id}/')['ETag']
+
+    # ACT
+    with django_assert_num_queries(0):
+        response = authenticated_junior_client.get(
+            f'/api/projects/{member_project.id}/', HTTP_IF_NONE_MATCH=etag
+        )
+
+    # ASSERT
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_member_change_invalidates_project_detail(
+    authenticated_junior_client, member_project, django_capture_on_commit_callbacks
+):
+    """
+    Test : Ajouter un membre invalide le détail en cache (signal ProjectMember)
+    """
+    # ARRANGE
+    authenticated_junior_client.get(f'/api/projects/{member_project.id}/')
+    other = User.objects.create_user(username='other', password='testpass123')
+
+    # ACT
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        ProjectMember.objects.create(project=member_project, user=other)
+    response = authenticated_junior_client.get(f'/api/projects/{member_project.id}/')
+
+    # ASSERT
+    assert len(response.data['members']) == 2
+
+
+@pytest.mark.django_db
+def test_note_list_is_filtered_by_project_and_invalidated(
+    authenticated_junior_client, member_project, junior_user, lead_user,
+    django_capture_on_commit_callbacks
+):
+    """
+    Test : GET /api/notes/?project= filtre par projet,
+    et une nouvelle note invalide la liste en cache
+    """
+    # ARRANGE
+    from projects.models import Project
+    other_project = Project.objects.create(name='Autre', description='x', created_by=lead_user)
+    ProjectMember.objects.create(project=other_project, user=junior_user)
+    Note.objects.create(title='A', content='C', project=member_project, author=junior_user)
+    Note.objects.create(title='Ailleurs', content='C', project=other_project, author=junior_user)
+    url = f'/api/notes/?project={member_project.id}'
+    assert [n['title'] for n in authenticated_junior_client.get(url).data] == ['A']
+
+    # ACT
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        Note.objects.create(title='B', content='C', project=member_project, author=junior_user)
+    response = authenticated_junior_client.get(url)
+
+    # ASSERT
+    assert sorted(n['title'] for n in response.data) == ['A', 'B']
+
+
+@pytest.mark.django_db
+def test_cached_entries_are_scoped_per_user(api_client, member_project, junior_user, senior_user):
+    """
+    Test : La réponse mise en cache pour un membre n'est jamais servie à un non-membre
+    """
+    # ARRANGE
+    api_client.force_authenticate(user=junior_user)
+    api_client.get(f'/api/projects/{member_project.id}/')
+
+    # ACT
+    api_client.force_authenticate(user=senior_user)
+    response = api_client.get(f'/api/projects/{member_project.id}/')
+
+    # ASSERT
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_cache_version_is_bumped_at_commit(
+    authenticated_junior_client, member_project, junior_user, django_capture_on_commit_callbacks
+):
+    """
+    Test : Écriture dans une transaction → version inchangée jusqu'au commit,
+    une lecture concurrente ne range rien sous la nouvelle version
+    """
+    # ARRANGE
+    url = f'/api/notes/?project={member_project.id}'
+    authenticated_junior_client.get(url)
+    before = get_cache_versions(['notes.note'])
+
+    # ACT
+    with django_capture_on_commit_callbacks() as callbacks:
+        with transaction.atomic():
+            Note.objects.create(title='B', content='C', project=member_project, author=junior_user)
+            during = get_cache_versions(['notes.note'])
+    for callback in callbacks:
+        callback()  # Commit
+
+    # ASSERT
+    assert during == before
+    assert get_cache_versions(['notes.note']) != before
+    assert [n['title'] for n in authenticated_junior_client.get(url).data] == ['B']
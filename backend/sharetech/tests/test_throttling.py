@@ -0,0 +1,204 @@
+# backend/sharetech/tests/test_throttling.py
+"""
+Tests du throttling pondéré et du limiteur de concurrence
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from sharetech.middleware import ConcurrencyLimitMiddleware
+from sharetech.throttling import EndpointCostThrottle
+
+
+@pytest.fixture
+def tight_rates(settings):
+    """
+    Débits très bas pour déclencher le throttling rapidement
+    (réassigner REST_FRAMEWORK recharge api_settings)
+    """
+    rest = dict(settings.REST_FRAMEWORK)
+    rest['DEFAULT_THROTTLE_RATES'] = {
+        'anon': '60/min',
+        'user': '1000/min',
+        'projects': '1000/min',
+        'notes': '10/min',
+        'comments': '1000/min',
+    }
+    settings.REST_FRAMEWORK = rest
+
+
+# ===== TESTS DU THROTTLING =====
+
+@pytest.mark.django_db
+def test_search_costs_more_tokens_than_detail(tight_rates, authenticated_junior_client, sample_project, junior_user):
+    """
+    Test : Une recherche coûte 5 jetons, un GET par id n'en coûte qu'un
+
+    Avec 10 jetons/min : 2 recherches passent, la 3ème est refusée (429)
+    """
+    # ARRANGE
+    from notes.models import Note
+    note = Note.objects.create(
+        title='Note', content='Contenu', project=sample_project, author=junior_user
+    )
+
+    # ACT
+    first = authenticated_junior_client.get('/api/notes/search/?q=Contenu')
+    second = authenticated_junior_client.get('/api/notes/search/?q=Contenu')
+    third = authenticated_junior_client.get('/api/notes/search/?q=Contenu')
+
+    # ASSERT
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert third.status_code == 429
+    assert 'Retry-After' in third
+
+
+@pytest.mark.django_db
+def test_detail_requests_use_single_token(tight_rates, authenticated_junior_client, sample_project, junior_user):
+    """
+    Test : 10 GET par id consomment exactement le budget de 10 jetons
+    """
+    # ARRANGE
+    from notes.models import Note
+    note = Note.objects.create(
+        title='Note', content='Contenu', project=sample_project, author=junior_user
+    )
+
+    # ACT
+    codes = [authenticated_junior_client.get(f'/api/notes/{note.id}/').status_code for _ in range(11)]
+
+    # ASSERT
+    assert codes[:10] == [200] * 10
+    assert codes[10] == 429
+
+
+class SlowReadCache:
+    """Cache dont la lecture est lente : élargit la fenêtre de concurrence"""
+    def __getattr__(self, name):
+        return getattr(cache, name)
+
+    def get(self, *args, **kwargs):
+        value = cache.get(*args, **kwargs)
+        time.sleep(0.01)
+        return value
+
+
+def test_concurrent_requests_cannot_overspend_bucket(tight_rates):
+    """
+    Test : 20 requêtes simultanées sur un seau de 10 jetons → exactement 10 acceptées
+    """
+    # ARRANGE
+    class Throttle(EndpointCostThrottle):
+        cache = SlowReadCache()
+        lock_wait = 5
+
+    request = SimpleNamespace(user=SimpleNamespace(is_authenticated=True, pk=42))
+    view = SimpleNamespace(throttle_scope='notes', action='retrieve')
+    results = []
+    start = threading.Barrier(20)
+
+    def client():
+        start.wait()
+        results.append(Throttle().allow_request(request, view))
+
+    # ACT
+    threads = [threading.Thread(target=client) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # ASSERT
+    assert results.count(True) == 10
+
+
+@pytest.mark.django_db
+def test_throttle_is_per_endpoint(tight_rates, authenticated_junior_client):
+    """
+    Test : Épuiser le budget 'notes' ne bloque pas les autres endpoints
+    """
+    # ACT
+    for _ in range(2):
+        authenticated_junior_client.get('/api/notes/search/?q=xx')
+    blocked = authenticated_junior_client.get('/api/notes/search/?q=xx')
+    projects = authenticated_junior_client.get('/api/projects/')
+
+    # ASSERT
+    assert blocked.status_code == 429
+    assert projects.status_code == 200
+
+
+# ===== TESTS DU LIMITEUR DE CONCURRENCE =====
+
+def test_concurrency_limiter_returns_503_when_saturated(settings):
+    """
+    Test : Quand toutes les places sont prises, la requête reçoit 503 + Retry-After
+    """
+    # ARRANGE
+    settings.MAX_CONCURRENT_REQUESTS = 1
+    settings.CONCURRENCY_QUEUE_TIMEOUT = 0.01
+    settings.CONCURRENCY_RETRY_AFTER = 7
+    middleware = ConcurrencyLimitMiddleware(lambda request: HttpResponse('ok'))
+    middleware.semaphore.acquire()  # Simule une requête en cours
+
+    # ACT
+    response = middleware(RequestFactory().get('/api/projects/'))
+
+    # ASSERT
+    assert response.status_code == 503
+    assert response['Retry-After'] == '7'
+
+
+def test_concurrency_limiter_releases_slot_after_response(settings):
+    """
+    Test : La place est libérée après chaque réponse
+    """
+    # ARRANGE
+    settings.MAX_CONCURRENT_REQUESTS = 1
+    settings.CONCURRENCY_QUEUE_TIMEOUT = 0.01
+    middleware = ConcurrencyLimitMiddleware(lambda request: HttpResponse('ok'))
+
+    # ACT
+    codes = [middleware(RequestFactory().get('/api/projects/')).status_code for _ in range(3)]
+
+    # ASSERT
+    assert codes == [200, 200, 200]
+
+
+def test_cancelled_waiting_request_does_not_keep_a_slot(settings):
+    """
+    Test : Requête async annulée pendant l'attente (client déconnecté) → aucune place perdue
+    """
+    # ARRANGE
+    settings.MAX_CONCURRENT_REQUESTS = 1
+    settings.CONCURRENCY_QUEUE_TIMEOUT = 5
+
+    async def view(request):
+        return HttpResponse('ok')
+
+    middleware = ConcurrencyLimitMiddleware(view)
+    middleware.semaphore.acquire()  # Simule une requête en cours
+
+    async def scenario():
+        waiting = asyncio.ensure_future(middleware(RequestFactory().get('/api/projects/')))
+        await asyncio.sleep(0.05)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        middleware.semaphore.release()  # Fin de la requête en cours
+        await asyncio.sleep(0.05)
+
+    # ACT
+    asyncio.run(scenario())
+
+    # ASSERT : la place est libre, une seule
+    assert middleware.semaphore.acquire(blocking=False)
+    assert not middleware.semaphore.acquire(blocking=False)
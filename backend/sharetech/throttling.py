@@ -0,0 +1,132 @@
+# backend/sharetech/throttling.py
+"""
+Throttling de l'API ShareTech
+
+Seau à jetons (token bucket) stocké dans le cache Django :
+- chaque requête consomme un nombre de jetons qui dépend de l'action
+  (une recherche coûte plus cher qu'un GET par id)
+- le seau se remplit en continu selon le débit configuré
+  dans REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']
+
+Lire le seau, le remplir et dépenser est fait sous un verrou par seau
+(cache.add, atomique avec redis / memcached / locmem) : sans lui, des
+requêtes simultanées liraient le même nombre de jetons et le dépenseraient
+chacune, dépassant la limite précisément pendant une rafale.
+"""
+
+import time
+
+from django.core.cache import cache as default_cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+class CostWeightedThrottle(BaseThrottle):
+    """
+    Throttle pondéré par le coût de l'action
+
+    Les vues peuvent déclarer :
+    - throttle_costs = {'search': 5, 'list': 2}  (coût par action, 1 par défaut)
+    """
+    cache = default_cache
+    cache_format = 'throttle_%(scope)s_%(ident)s'
+    # Verrou du seau : expire seul (process tué en pleine mise à jour), attente bornée
+    lock_timeout = 1
+    lock_wait = 0.05
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_scope(self, request, view):
+        """Retourne le scope de throttling (clé dans DEFAULT_THROTTLE_RATES)"""
+        raise NotImplementedError('.get_scope() must be overridden')
+
+    def get_cost(self, request, view):
+        """Nombre de jetons consommés par cette requête"""
+        costs = getattr(view, 'throttle_costs', {})
+        return costs.get(getattr(view, 'action', None), 1)
+
+    def parse_rate(self, rate):
+        """
+        '300/min' → (300, 60)
+        Retourne (None, None) si aucun débit n'est configuré
+        """
+        if rate is None:
+            return (None, None)
+        num, period = rate.split('/')
+        return (int(num), DURATIONS[period[0]])
+
+    def get_cache_key(self, request, view, scope):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': scope, 'ident': ident}
+
+    def allow_request(self, request, view):
+        scope = self.get_scope(request, view)
+        if scope is None:
+            return True
+
+        capacity, duration = self.parse_rate(api_settings.DEFAULT_THROTTLE_RATES.get(scope))
+        if capacity is None:
+            return True
+
+        key = self.get_cache_key(request, view, scope)
+        cost = self.get_cost(request, view)
+
+        lock_key = self.lock(key)
+        if lock_key is None:
+            # Seau verrouillé trop longtemps par d'autres requêtes du même client : rafale
+            self.wait_seconds = self.lock_wait
+            return False
+        try:
+            now = time.time()
+            # Remplissage du seau depuis le dernier passage
+            tokens, stamp = self.cache.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - stamp) * capacity / duration)
+
+            if tokens < cost:
+                self.wait_seconds = (cost - tokens) * duration / capacity
+                return False
+
+            self.cache.set(key, (tokens - cost, now), duration)
+            return True
+        finally:
+            self.cache.delete(lock_key)
+
+    def lock(self, key):
+        """Prend le verrou du seau (cache.add), None après lock_wait secondes"""
+        lock_key = f'{key}_lock'
+        deadline = time.monotonic() + self.lock_wait
+        while not self.cache.add(lock_key, 1, self.lock_timeout):
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.001)
+        return lock_key
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class UserCostThrottle(CostWeightedThrottle):
+    """
+    Budget global par utilisateur (scope 'user', ou 'anon' si non connecté)
+    """
+    def get_scope(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return 'user'
+        return 'anon'
+
+
+class EndpointCostThrottle(CostWeightedThrottle):
+    """
+    Budget par utilisateur ET par endpoint
+
+    La vue déclare throttle_scope = 'notes' (sinon pas de limite spécifique)
+    """
+    def get_scope(self, request, view):
+        return getattr(view, 'throttle_scope', None)
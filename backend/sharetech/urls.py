@@ -20,6 +20,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from . import views
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -31,6 +33,9 @@ urlpatterns = [
     path('api/', include('notes.urls')),
     path('api/', include('tasks.urls')),
     path('api/', include('comments.urls')),
+    # Santé des briques partagées
+    path('api/health/cache/', views.cache_health_view, name='cache-health'),
+    path('api/health/db/', views.db_health_view, name='db-health'),
 
 ]
 
@@ -0,0 +1,74 @@
+# backend/sharetech/views.py
+"""
+Endpoints techniques (santé et statistiques des briques partagées)
+"""
+
+from django.db import connections
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from .cache import cache_health, cache_stats
+from .db.limits import connection_stats, database_health
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+@throttle_classes([])
+def cache_health_view(request):
+    """
+    Santé du cache partagé
+    GET /api/health/cache/
+
+    - Tout le monde (sonde du load balancer) : statut et latence
+    - Admin : statistiques détaillées (hits / misses, serveur)
+    """
+    ok, latency, error = cache_health()
+    data = {
+        'status': 'ok' if ok else 'error',
+        'latency_ms': latency,
+    }
+    if error:
+        data['error'] = error
+
+    user = request.user
+    if user.is_authenticated and (user.is_superuser or user.profile.role == 'admin'):
+        data['stats'] = cache_stats()
+
+    return Response(
+        data,
+        status=status.HTTP_200_OK if ok else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+@throttle_classes([])
+def db_health_view(request):
+    """
+    Santé des bases de données
+    GET /api/health/db/
+
+    - Tout le monde : statut et latence d'un SELECT 1 par alias
+    - Admin : métriques de connexion (connexions, déconnexions, attentes, timeouts)
+    """
+    databases = {}
+    all_ok = True
+    for alias in connections:
+        ok, latency, error = database_health(alias)
+        all_ok = all_ok and ok
+        databases[alias] = {'status': 'ok' if ok else 'error', 'latency_ms': latency}
+        if error:
+            databases[alias]['error'] = error
+
+    data = {'status': 'ok' if all_ok else 'error', 'databases': databases}
+
+    user = request.user
+    if user.is_authenticated and (user.is_superuser or user.profile.role == 'admin'):
+        data['connection_limits'] = connection_stats()
+
+    return Response(
+        data,
+        status=status.HTTP_200_OK if all_ok else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
@@ -1,6 +1,10 @@
 # backend/tasks/models.py
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from sharetech.cache import bump_cache_version
 
 
 class Tag(models.Model):
@@ -32,4 +36,10 @@ class Tag(models.Model):
     def __str__(self):
         return self.name
 
-    
\ No newline at end of file
+
+# Signal : invalidation du cache de réponses (voir sharetech/cache.py)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_cache(sender, **kwargs):
+    """Incrémente la version de cache des tags"""
+    bump_cache_version(sender)
@@ -0,0 +1,80 @@
+# backend/tags/registry.py
+"""
+Registre des tags en mémoire (par process)
+
+La table tag est petite et en lecture seule via l'API :
+on la garde en mémoire et on ne la recharge que si sa version
+dans le cache partagé a changé (signal post_save / post_delete sur Tag,
+voir sharetech/cache.py). Validation des tags, liste et recherche par nom
+se font alors sans requête SQL.
+"""
+
+import threading
+
+from sharetech.cache import get_cache_versions
+
+
+class TagRegistry:
+    """
+    Vue en mémoire de la table tag, synchronisée par numéro de version
+    """
+    version_label = 'tags.tag'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._by_id = {}
+        self._by_name = {}
+        self._data = []
+
+    def _ensure_fresh(self):
+        """Recharge la table si la version partagée a changé (1 lecture cache)"""
+        version = get_cache_versions((self.version_label,))[0]
+        if version == self._version:
+            return
+        with self._lock:
+            if version != self._version:
+                self._load(version)
+
+    def _load(self, version):
+        from .models import Tag
+        from .serializers import TagSerializer
+
+        tags = list(Tag.objects.all())
+        data = TagSerializer(tags, many=True).data
+
+        # Remplacement atomique des références : pas de lecture incohérente
+        self._by_id = {tag.pk: (tag, row) for tag, row in zip(tags, data)}
+        self._by_name = {tag.name: tag for tag in tags}
+        self._data = [dict(row) for row in data]
+        self._version = version
+
+    def reset(self):
+        """Oublie la table chargée : rechargée à la prochaine lecture"""
+        with self._lock:
+            self._version = None
+
+    def get(self, pk):
+        """Retourne le Tag d'id pk, ou None"""
+        self._ensure_fresh()
+        entry = self._by_id.get(pk)
+        return entry[0] if entry else None
+
+    def get_by_name(self, name):
+        """Retourne le Tag nommé name, ou None"""
+        self._ensure_fresh()
+        return self._by_name.get(name)
+
+    def get_data(self, pk):
+        """Représentation sérialisée (TagSerializer) d'un tag, ou None"""
+        self._ensure_fresh()
+        entry = self._by_id.get(pk)
+        return dict(entry[1]) if entry else None
+
+    def all_data(self):
+        """Représentation sérialisée de tous les tags (ordre alphabétique)"""
+        self._ensure_fresh()
+        return [dict(row) for row in self._data]
+
+
+tag_registry = TagRegistry()
@@ -11,4 +11,29 @@ class TagSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tag
         fields = ['id', 'name', 'created_at']
-        read_only_fields = ['id', 'name', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'name', 'created_at']
+
+class TagPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField validé par le registre en mémoire (tags/registry.py)
+    Remplace le SELECT par id fait pour chaque tag soumis
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', Tag.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        from .registry import tag_registry
+
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        tag = tag_registry.get(pk)
+        if tag is None:
+            self.fail('does_not_exist', pk_value=data)
+        return tag
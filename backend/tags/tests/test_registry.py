@@ -0,0 +1,96 @@
+# backend/tags/tests/test_registry.py
+"""
+Tests du registre des tags en mémoire (tags/registry.py)
+Validation, liste et recherche par nom sans requête SQL
+"""
+
+import pytest
+
+from notes.serializers import NoteUpdateSerializer
+from tags.models import Tag
+from tags.registry import tag_registry
+
+
+@pytest.mark.django_db
+def test_registry_lookups_run_without_queries(python_tag, django_tag, django_assert_num_queries):
+    """
+    Test : Une fois chargé, le registre répond sans requête SQL
+    """
+    # ARRANGE
+    tag_registry.get(python_tag.id)  # Chargement initial
+
+    # ACT & ASSERT
+    with django_assert_num_queries(0):
+        assert tag_registry.get(python_tag.id).name == 'python'
+        assert tag_registry.get_by_name('django').id == django_tag.id
+        assert tag_registry.get_by_name('inconnu') is None
+        assert [t['name'] for t in tag_registry.all_data()] == ['django', 'python']
+
+
+@pytest.mark.django_db
+def test_registry_reloads_when_tag_is_created(python_tag, django_capture_on_commit_callbacks):
+    """
+    Test : Créer un tag change sa version de cache → le registre se recharge
+    """
+    # ARRANGE
+    assert tag_registry.get_by_name('react') is None
+
+    # ACT
+    with django_capture_on_commit_callbacks(execute=True):  # Commit de l'écriture
+        react = Tag.objects.create(name='react')
+
+    # ASSERT
+    assert tag_registry.get_by_name('react').id == react.id
+
+
+@pytest.mark.django_db
+def test_tag_field_validates_ids_without_queries(python_tag, django_tag, django_assert_num_queries):
+    """
+    Test : Valider des tags dans un serializer ne fait plus un SELECT par id
+    """
+    # ARRANGE
+    tag_registry.get(python_tag.id)
+    serializer = NoteUpdateSerializer(data={
+        'title': 'Titre', 'content': 'Contenu', 'tags': [python_tag.id, django_tag.id]
+    })
+
+    # ACT
+    with django_assert_num_queries(0):
+        is_valid = serializer.is_valid()
+
+    # ASSERT
+    assert is_valid
+    assert [tag.id for tag in serializer.validated_data['tags']] == [python_tag.id, django_tag.id]
+
+
+@pytest.mark.django_db
+def test_tag_field_rejects_unknown_id(python_tag):
+    """
+    Test : Un id de tag inconnu est refusé comme avant
+    """
+    # ARRANGE
+    serializer = NoteUpdateSerializer(data={'title': 'T', 'content': 'C', 'tags': [9999]})
+
+    # ACT & ASSERT
+    assert not serializer.is_valid()
+    assert 'tags' in serializer.errors
+
+
+@pytest.mark.django_db
+def test_tag_endpoints_are_served_from_registry(authenticated_junior_client, python_tag, django_assert_num_queries):
+    """
+    Test : GET /api/tags/ et /api/tags/{id}/ sans requête SQL après chargement
+    """
+    # ARRANGE
+    authenticated_junior_client.get('/api/tags/')
+
+    # ACT
+    with django_assert_num_queries(0):
+        listing = authenticated_junior_client.get('/api/tags/')
+        detail = authenticated_junior_client.get(f'/api/tags/{python_tag.id}/')
+        missing = authenticated_junior_client.get('/api/tags/9999/')
+
+    # ASSERT
+    assert [t['name'] for t in listing.data] == ['python']
+    assert detail.data['id'] == python_tag.id
+    assert missing.status_code == 404
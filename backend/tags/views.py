@@ -1,8 +1,11 @@
 # from django.shortcuts import render
 
+from django.http import Http404
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from .models import Tag
+from .registry import tag_registry
 from .serializers import TagSerializer
 
 
@@ -15,7 +18,20 @@ class TagViewSet(viewsets.ReadOnlyModelViewSet):
     - GET /api/tags/{id}/ : Détail d'un tag
     
     Pas de création/modification/suppression via API
+    Les réponses viennent du registre en mémoire (tags/registry.py) : aucune requête SQL
     """
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    permission_classes = [IsAuthenticated]
+    
+    def list(self, request, *args, **kwargs):
+        return Response(tag_registry.all_data())
+    
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            data = tag_registry.get_data(int(kwargs['pk']))
+        except ValueError:
+            data = None
+        if data is None:
+            raise Http404
+        return Response(data)
@@ -0,0 +1,27 @@
+# backend/tasks/async_views.py
+"""
+Vues async des tâches (voir sharetech/async_api.py)
+"""
+
+from sharetech.async_api import async_api_view, run_query
+
+from .models import Task
+from .serializers import TaskSerializer
+
+
+@async_api_view()
+async def my_tasks(request, user):
+    """
+    Tâches assignées à l'utilisateur connecté
+    GET /api/async/tasks/my_tasks/
+
+    Même réponse que GET /api/tasks/my_tasks/
+    """
+    tasks = await run_query(
+        lambda: list(
+            Task.objects.filter(assigned_to=user).select_related(
+                'project', 'created_by', 'assigned_to'
+            )
+        )
+    )
+    return TaskSerializer(tasks, many=True).data
@@ -0,0 +1,152 @@
+# backend/tasks/bulk.py
+"""
+Opérations groupées sur les tâches (POST /api/tasks/bulk/)
+
+- les tâches du lot sont chargées et verrouillées en UNE requête,
+  les utilisateurs à assigner en une autre
+- permissions et cohérence vérifiées en mémoire, opération par opération
+  (mêmes règles que les actions assign / unassign / change_status)
+- les tâches modifiées sont écrites par un seul bulk_update, dans la
+  même transaction
+
+bulk_update n'envoie pas de signaux : les compteurs des projets, les
+agrégats quotidiens et la version de cache sont mis à jour ici.
+"""
+
+from collections import Counter, defaultdict
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from projects.counters import update_counters
+from sharetech.cache import bump_cache_version
+
+from .models import Task, counted_state
+from .rollups import apply_rollups, rollup_contribution, track_rollups
+from .serializers import BulkTaskOperationSerializer
+
+
+BULK_FIELDS = ['assigned_to', 'status', 'priority', 'completed_date', 'updated_at', 'version']
+
+
+def is_lead(user):
+    return user.is_superuser or user.profile.role in ['lead', 'admin']
+
+
+def check_operation(operation, task, user, lead, user_ids):
+    """Raison du refus de l'opération, None si elle est applicable"""
+    action = operation['action']
+    
+    # Junior / Senior : seulement leurs tâches et les tâches non assignées
+    if task is None or not (lead or task.assigned_to_id in (None, user.id)):
+        return "Tâche introuvable."
+    if action in ('assign', 'unassign') and not lead:
+        return "Seuls les Lead+ peuvent assigner ou désassigner des tâches."
+    if action in ('change_status', 'set_priority') and not lead and task.assigned_to_id != user.id:
+        return "Seul l'assigné ou Lead+ peut modifier cette tâche."
+    if action == 'assign' and operation['user_id'] not in user_ids:
+        return "Utilisateur introuvable."
+    if action == 'unassign' and task.assigned_to_id is None:
+        return "Cette tâche n'est pas assignée."
+    
+    # Machine à états (Task.STATUS_TRANSITIONS), comme tasks/transitions.py
+    target = {'assign': 'assignee', 'unassign': 'ouverte', 'change_status': operation.get('status')}.get(action)
+    unchanged = action == 'change_status' and target == task.status  # Sans effet, accepté
+    if target and not unchanged and not task.can_transition(target, operation.get('user_id')):
+        return f"Transition impossible : {task.status} → {target}."
+    return None
+
+
+def apply_operation(operation, task, today):
+    """Modifie la tâche en mémoire"""
+    action = operation['action']
+    was_done = task.status == 'terminee'
+    if action == 'assign':
+        task.assigned_to_id = operation['user_id']
+        task.status = 'assignee'
+    elif action == 'unassign':
+        task.assigned_to_id = None
+        task.status = 'ouverte'
+    elif action == 'change_status':
+        if operation['status'] == 'terminee' and task.status != 'terminee':
+            task.completed_date = today
+        task.status = operation['status']
+    elif action == 'set_priority':
+        task.priority = operation['priority']
+    
+    if was_done and task.status != 'terminee':
+        task.completed_date = None  # Réouverture
+
+
+def apply_bulk_operations(operations, user):
+    """
+    Valide et applique une liste d'opérations (dicts bruts)
+    Retourne un résultat par opération, dans l'ordre :
+        {"id": 4, "ok": true} / {"id": 5, "ok": false, "error": ...}
+    """
+    results = [None] * len(operations)
+    valid = []
+    for index, raw in enumerate(operations):
+        serializer = BulkTaskOperationSerializer(data=raw)
+        if serializer.is_valid():
+            valid.append((index, serializer.validated_data))
+        else:
+            results[index] = {'id': raw.get('id'), 'ok': False, 'error': serializer.errors}
+    
+    # Une même tâche deux fois : l'ordre d'application serait ambigu
+    occurrences = Counter(operation['id'] for _, operation in valid)
+    lead = is_lead(user)
+    now = timezone.now()
+    
+    with transaction.atomic():
+        tasks = Task.objects.select_for_update().in_bulk(list(occurrences))
+        user_ids = set(User.objects.filter(
+            id__in={operation['user_id'] for _, operation in valid if operation['action'] == 'assign'}
+        ).values_list('id', flat=True))
+        
+        changed = {}
+        for index, operation in valid:
+            task = tasks.get(operation['id'])
+            if occurrences[operation['id']] > 1:
+                error = "Tâche présente plusieurs fois dans le lot."
+            else:
+                error = check_operation(operation, task, user, lead, user_ids)
+            
+            if error:
+                results[index] = {'id': operation['id'], 'ok': False, 'error': error}
+                continue
+            apply_operation(operation, task, timezone.localdate(now))
+            task.updated_at = now  # bulk_update n'applique pas auto_now
+            task.version = F('version') + 1  # Lignes verrouillées : pas de condition à vérifier
+            changed[task.pk] = task
+            results[index] = {'id': task.pk, 'ok': True}
+        
+        if changed:
+            Task.objects.bulk_update(changed.values(), BULK_FIELDS)
+            apply_side_effects(changed.values())
+    
+    return results
+
+
+def apply_side_effects(tasks):
+    """Ce que feraient les signaux post_save des tâches modifiées"""
+    deltas = defaultdict(Counter)
+    rollup_deltas, stale_days = defaultdict(Counter), set()
+    for task in tasks:
+        # Le projet d'une tâche ne change pas ici, seul le compteur peut changer
+        previous, current = task._counted_state, counted_state(task)
+        counts = deltas[task.project_id]  # Au minimum : dernière activité du projet
+        if previous != current:
+            counts[previous[1]] -= 1
+            counts[current[1]] += 1
+        
+        contribution = rollup_contribution(task)
+        track_rollups(task._rollup_contribution, contribution, rollup_deltas, stale_days)
+        task._counted_state, task._rollup_contribution = current, contribution
+    
+    for project_id, counts in deltas.items():
+        update_counters(project_id, **counts)
+    apply_rollups(rollup_deltas, stale_days)
+    bump_cache_version(Task)
@@ -0,0 +1,25 @@
+# backend/tasks/management/commands/rebuild_task_rollups.py
+"""
+Reconstruit les agrégats quotidiens des tâches (burndown)
+
+    python manage.py rebuild_task_rollups
+    python manage.py rebuild_task_rollups --project 3 --project 7
+"""
+
+from django.core.management.base import BaseCommand
+
+from tasks.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recalcule la table task_daily_rollup depuis les tâches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project', type=int, action='append', dest='projects',
+            help="Id du projet à reconstruire (répétable, tous par défaut)"
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_rollups(options['projects'])
+        self.stdout.write(self.style.SUCCESS(f"{count} ligne(s) d'agrégats recalculée(s)"))
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:06
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    """Agrégats quotidiens des tâches existantes (même calcul que rebuild_rollups)"""
+    Task = apps.get_model('tasks', 'Task')
+    TaskDailyRollup = apps.get_model('tasks', 'TaskDailyRollup')
+
+    rollups = defaultdict(dict)
+    created = Task.objects.annotate(day=TruncDate('created_at')).values('project_id', 'day').annotate(
+        created_count=Count('pk'), created_estimated_hours=Sum('estimated_hours'),
+    ).order_by()
+    done = Task.objects.filter(status='terminee').annotate(
+        day=Coalesce('completed_date', TruncDate('updated_at'))
+    ).values('project_id', 'day').annotate(
+        done_count=Count('pk'), done_estimated_hours=Sum('estimated_hours'),
+        done_actual_hours=Sum('actual_hours'),
+    ).order_by()
+    for row in (*created, *done):
+        key = (row.pop('project_id'), row.pop('day'))
+        rollups[key].update({field: value for field, value in row.items() if value is not None})
+
+    TaskDailyRollup.objects.bulk_create(
+        [TaskDailyRollup(project_id=project_id, day=day, **values) for (project_id, day), values in rollups.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_counters'),
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Jour')),
+                ('created_count', models.PositiveIntegerField(default=0)),
+                ('created_estimated_hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('done_count', models.PositiveIntegerField(default=0)),
+                ('done_estimated_hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('done_actual_hours', models.DecimalField(decimal_places=2, default=0, max_digits=9)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_rollups', to='projects.project')),
+            ],
+            options={
+                'db_table': 'task_daily_rollup',
+                'ordering': ['day'],
+                'unique_together': {('project', 'day')},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_daily_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskdailyrollup',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -1,13 +1,20 @@
 # backend/tasks/models.py
 
 
+from collections import Counter, defaultdict
+
 from django.db import models
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from projects.counters import task_counter_field, update_counters
 from projects.models import Project
 from tags.models import Tag
+from sharetech.cache import bump_cache_version
+from sharetech.concurrency import VersionedModelMixin
 
 
-class Task(models.Model):
+class Task(VersionedModelMixin, models.Model):
     """Tâche de projet"""
     
     STATUS_CHOICES = [
@@ -16,6 +23,14 @@ class Task(models.Model):
         ('terminee', 'Terminée'),
     ]
     
+    # Machine à états : statut → statuts atteignables (voir tasks/transitions.py)
+    # Une tâche est assignée avant d'être terminée ; 'assignee' exige un assigné
+    STATUS_TRANSITIONS = {
+        'ouverte': ('assignee',),  # Assignation
+        'assignee': ('ouverte', 'assignee', 'terminee'),  # Désassignation, réassignation, complétion
+        'terminee': ('assignee',),  # Réouverture : l'assigné reprend la tâche
+    }
+    
     PRIORITY_CHOICES = [
         ('basse', 'Basse'),
         ('normale', 'Normale'),
@@ -82,6 +97,9 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='Créé le')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Modifié le')
     
+    # Concurrence optimiste : incrémentée à chaque save() (voir sharetech/concurrency.py)
+    version = models.PositiveIntegerField(default=1, editable=False, verbose_name='Version')
+    
     class Meta:
         db_table = 'task'
         verbose_name = 'Tâche'
@@ -90,6 +108,54 @@ class Task(models.Model):
     
     def __str__(self):
         return self.title
+    
+    def can_transition(self, target, assigned_to_id=None):
+        """
+        target atteignable depuis le statut actuel
+        (assigned_to_id : nouvel assigné de la transition, sinon l'actuel)
+        """
+        if target == 'assignee' and (assigned_to_id or self.assigned_to_id) is None:
+            return False
+        return target in self.STATUS_TRANSITIONS.get(self.status, ())
+    
+    @classmethod
+    def transition_sources(cls, target):
+        """Statuts depuis lesquels target est atteignable"""
+        return [source for source, targets in cls.STATUS_TRANSITIONS.items() if target in targets]
+
+
+class TaskDailyRollup(models.Model):
+    """
+    Agrégats quotidiens des tâches d'un projet (burndown)
+    Tenus à jour par écarts à chaque écriture (voir tasks/rollups.py)
+    """
+    
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name='task_rollups'
+    )
+    day = models.DateField(verbose_name='Jour')
+    
+    # Tâches créées ce jour-là
+    created_count = models.PositiveIntegerField(default=0)
+    created_estimated_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    
+    # Tâches terminées ce jour-là
+    done_count = models.PositiveIntegerField(default=0)
+    done_estimated_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    done_actual_hours = models.DecimalField(max_digits=9, decimal_places=2, default=0)
+    
+    # Dernière mise à jour : filigrane des statistiques d'activité (voir analytics/rollups.py)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    
+    class Meta:
+        db_table = 'task_daily_rollup'
+        unique_together = ['project', 'day']
+        ordering = ['day']
+    
+    def __str__(self):
+        return f"{self.project_id} - {self.day}"
 
 
 class TaskTag(models.Model):
@@ -114,4 +180,80 @@ class TaskTag(models.Model):
         unique_together = ['task', 'tag']
     
     def __str__(self):
-        return f"{self.task.title} - {self.tag.name}"
\ No newline at end of file
+        return f"{self.task.title} - {self.tag.name}"
+
+
+# Signaux : compteurs de tâches ouvertes / terminées et dernière activité du projet
+# (voir projects/counters.py). L'état compté est mémorisé au chargement
+# pour savoir quel compteur décrémenter quand le statut ou le projet change.
+def counted_state(task):
+    """(projet, compteur) où la tâche est comptée, None si champs différés"""
+    if 'status' not in task.__dict__ or 'project_id' not in task.__dict__:
+        return None
+    return (task.project_id, task_counter_field(task.status))
+
+
+@receiver(post_init, sender=Task)
+def remember_counted_state(sender, instance, **kwargs):
+    from .rollups import rollup_contribution
+    
+    instance._counted_state = counted_state(instance) if instance.pk else None
+    instance._rollup_contribution = rollup_contribution(instance) if instance.pk else {}
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance, created, **kwargs):
+    previous = None if created else instance._counted_state
+    current = counted_state(instance)
+    
+    if previous is None and not created:
+        # Tâche chargée avec des champs différés : seulement l'activité
+        update_counters(instance.project_id)
+    elif previous is None:
+        update_counters(current[0], **{current[1]: 1})
+    elif previous == current:
+        update_counters(current[0])
+    elif previous[0] == current[0]:
+        update_counters(current[0], **{previous[1]: -1, current[1]: 1})
+    else:
+        # Tâche déplacée dans un autre projet
+        update_counters(previous[0], **{previous[1]: -1})
+        update_counters(current[0], **{current[1]: 1})
+    
+    instance._counted_state = current
+
+
+@receiver(post_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    state = instance._counted_state or counted_state(instance)
+    if state is not None:
+        update_counters(state[0], **{state[1]: -1})
+
+
+# Signaux : agrégats quotidiens (burndown), écart de contribution de la tâche
+@receiver(post_save, sender=Task)
+def update_task_rollups(sender, instance, **kwargs):
+    from .rollups import apply_rollups, rollup_contribution, track_rollups
+    
+    current = rollup_contribution(instance)
+    deltas, stale = defaultdict(Counter), set()
+    track_rollups(instance._rollup_contribution, current, deltas, stale)
+    apply_rollups(deltas, stale)
+    instance._rollup_contribution = current
+
+
+@receiver(post_delete, sender=Task)
+def remove_task_rollups(sender, instance, **kwargs):
+    from .rollups import apply_rollups, track_rollups
+    
+    deltas, stale = defaultdict(Counter), set()
+    track_rollups(instance._rollup_contribution, {}, deltas, stale)
+    apply_rollups(deltas, stale)
+
+
+# Signal : invalidation du cache de réponses (voir sharetech/cache.py)
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_cache(sender, **kwargs):
+    """Incrémente la version de cache des tâches"""
+    bump_cache_version(sender)
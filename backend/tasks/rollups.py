@@ -0,0 +1,235 @@
+# backend/tasks/rollups.py
+"""
+Agrégats quotidiens des tâches (TaskDailyRollup) pour le burndown
+
+Une ligne par (projet, jour) : tâches créées et tâches terminées ce jour-là,
+avec leurs heures. Le reste à faire à une date est la somme cumulée
+(créées - terminées) : la série d'un projet de plusieurs années se lit
+en deux requêtes sur la table d'agrégats, sans parcourir les tâches.
+
+Mise à jour incrémentale : chaque tâche connaît sa contribution aux
+agrégats (rollup_contribution, relevée au chargement). Après une écriture
+(signaux, bulk_update), seul l'écart entre l'ancienne et la nouvelle
+contribution est appliqué, en UPDATE SET n = n + delta sur les lignes
+touchées : aucun parcours des tâches du projet, aucune requête si rien
+ne change. Contribution inconnue (champs différés) : recalcul des jours
+touchés par GROUP BY (refresh_rollups). Les écritures qui contournent
+tout (queryset.update) se réparent avec la commande rebuild_task_rollups.
+"""
+
+import datetime
+from collections import Counter, defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from projects.counters import DONE_TASK_STATUSES
+from sharetech.counters import shift
+
+from .models import Task, TaskDailyRollup
+
+
+ZERO = Decimal('0.00')
+ROLLUP_FIELDS = (
+    'created_count', 'created_estimated_hours',
+    'done_count', 'done_estimated_hours', 'done_actual_hours',
+)
+# Champs de la tâche dont dépend sa contribution aux agrégats
+CONTRIBUTION_FIELDS = (
+    'project_id', 'created_at', 'status', 'completed_date', 'updated_at',
+    'estimated_hours', 'actual_hours',
+)
+
+
+def hours(field):
+    """SUM(field) sans NULL"""
+    return Coalesce(Sum(field), Value(ZERO), output_field=DecimalField(max_digits=9, decimal_places=2))
+
+
+def done_day(task):
+    """Jour de complétion d'une tâche terminée (date de complétion, sinon dernière modification)"""
+    if task.completed_date:
+        return task.completed_date
+    return timezone.localdate(task.updated_at)
+
+
+def task_hours(task, field):
+    """Heures de la tâche en Decimal (l'attribut peut être une chaîne non convertie : '2.50')"""
+    return Task._meta.get_field(field).to_python(getattr(task, field)) or ZERO
+
+
+def rollup_contribution(task):
+    """
+    Ce que la tâche ajoute aux agrégats : {(projet, jour): Counter(champ=valeur)}
+    None si des champs nécessaires sont différés (contribution inconnue)
+    """
+    if any(field not in task.__dict__ for field in CONTRIBUTION_FIELDS):
+        return None
+    if task.created_at is None:
+        return {}
+    
+    estimated = task_hours(task, 'estimated_hours')
+    contribution = defaultdict(Counter)
+    contribution[(task.project_id, timezone.localdate(task.created_at))].update(
+        created_count=1, created_estimated_hours=estimated,
+    )
+    if task.status in DONE_TASK_STATUSES:
+        contribution[(task.project_id, done_day(task))].update(
+            done_count=1, done_estimated_hours=estimated,
+            done_actual_hours=task_hours(task, 'actual_hours'),
+        )
+    return contribution
+
+
+def track_rollups(previous, current, deltas, stale):
+    """
+    Ajoute le passage de la contribution previous à current :
+    écart dans deltas {(projet, jour): Counter}, ou jours touchés dans
+    stale (à recalculer) si l'une des deux contributions est inconnue
+    """
+    if previous is None or current is None:
+        stale.update(previous or ())
+        stale.update(current or ())
+        return
+    for key, values in previous.items():
+        deltas[key].subtract(values)
+    for key, values in current.items():
+        deltas[key].update(values)
+
+
+def apply_rollups(deltas, stale=()):
+    """
+    Applique les écarts aux lignes d'agrégats (un UPDATE par ligne touchée,
+    ligne créée au besoin), puis recalcule les jours de stale
+    """
+    for (project_id, day), values in deltas.items():
+        values = {field: delta for field, delta in values.items() if delta}
+        if not values:
+            continue
+        adds = any(delta > 0 for delta in values.values())
+        # Compteurs non signés : shift ; heures (Decimal) : F() + delta
+        values = {
+            field: shift(field, delta) if isinstance(delta, int) else F(field) + delta
+            for field, delta in values.items()
+        }
+        # updated_at : filigrane des lecteurs incrémentaux, update() n'applique pas auto_now
+        values['updated_at'] = timezone.now()
+        rows = TaskDailyRollup.objects.filter(project_id=project_id, day=day)
+        with transaction.atomic():
+            # Ligne absente : créée seulement pour ajouter (un retrait viendrait
+            # d'une suppression en cascade du projet)
+            if not rows.update(**values) and adds:
+                TaskDailyRollup.objects.get_or_create(project_id=project_id, day=day)
+                rows.update(**values)
+    if stale:
+        refresh_rollups(stale)
+
+
+def compute_rollups(tasks, days=None):
+    """
+    Agrégats {(projet, jour): {champ: valeur}} des tâches du queryset
+    (limités aux jours de `days` si fourni) : deux requêtes GROUP BY
+    """
+    created = tasks.annotate(day=TruncDate('created_at')).values('project_id', 'day').annotate(
+        created_count=Count('pk'),
+        created_estimated_hours=hours('estimated_hours'),
+    ).order_by()
+    done = tasks.filter(status__in=DONE_TASK_STATUSES).annotate(
+        day=Coalesce('completed_date', TruncDate('updated_at'))
+    ).values('project_id', 'day').annotate(
+        done_count=Count('pk'),
+        done_estimated_hours=hours('estimated_hours'),
+        done_actual_hours=hours('actual_hours'),
+    ).order_by()
+    if days is not None:
+        created = created.filter(day__in=days)
+        done = done.filter(day__in=days)
+    
+    rollups = defaultdict(dict)
+    for row in (*created, *done):
+        key = (row.pop('project_id'), row.pop('day'))
+        rollups[key].update(row)
+    return rollups
+
+
+def refresh_rollups(keys):
+    """Recalcule les lignes d'agrégats des (projet, jour) donnés"""
+    days_by_project = defaultdict(set)
+    for project_id, day in keys:
+        days_by_project[project_id].add(day)
+    
+    for project_id, days in days_by_project.items():
+        rollups = compute_rollups(Task.objects.filter(project_id=project_id), days)
+        with transaction.atomic():
+            for day in days:
+                values = rollups.get((project_id, day))
+                if values:
+                    defaults = {field: values.get(field, 0) for field in ROLLUP_FIELDS}
+                    TaskDailyRollup.objects.update_or_create(
+                        project_id=project_id, day=day, defaults=defaults
+                    )
+                else:
+                    # Ligne remise à zéro plutôt que supprimée : le changement
+                    # reste visible pour les lecteurs incrémentaux (updated_at)
+                    TaskDailyRollup.objects.filter(project_id=project_id, day=day).update(
+                        updated_at=timezone.now(), **dict.fromkeys(ROLLUP_FIELDS, 0)
+                    )
+
+
+def rebuild_rollups(project_ids=None):
+    """Reconstruit toute la table d'agrégats (ou celle des projets donnés)"""
+    tasks = Task.objects.all()
+    existing = TaskDailyRollup.objects.all()
+    if project_ids:
+        tasks = tasks.filter(project_id__in=project_ids)
+        existing = existing.filter(project_id__in=project_ids)
+    
+    rollups = compute_rollups(tasks)
+    with transaction.atomic():
+        existing.delete()
+        TaskDailyRollup.objects.bulk_create(
+            [
+                TaskDailyRollup(project_id=project_id, day=day, **values)
+                for (project_id, day), values in rollups.items()
+            ],
+            batch_size=1000,
+        )
+    return len(rollups)
+
+
+def burndown(project_id, start, end):
+    """
+    Série quotidienne du reste à faire entre start et end (inclus)
+    Deux requêtes : cumul avant start, puis lignes de la période
+    """
+    before = TaskDailyRollup.objects.filter(project_id=project_id, day__lt=start).aggregate(
+        **{field: Sum(field) for field in ROLLUP_FIELDS}
+    )
+    remaining = (before['created_count'] or 0) - (before['done_count'] or 0)
+    remaining_hours = (before['created_estimated_hours'] or ZERO) - (before['done_estimated_hours'] or ZERO)
+    
+    rows = {
+        row.day: row
+        for row in TaskDailyRollup.objects.filter(project_id=project_id, day__range=(start, end))
+    }
+    series = []
+    day = start
+    while day <= end:
+        row = rows.get(day)
+        created = row.created_count if row else 0
+        done = row.done_count if row else 0
+        if row:
+            remaining += created - done
+            remaining_hours += row.created_estimated_hours - row.done_estimated_hours
+        series.append({
+            'date': day,
+            'created': created,
+            'done': done,
+            'remaining': remaining,
+            'remaining_estimated_hours': remaining_hours,
+        })
+        day += datetime.timedelta(days=1)
+    return series
@@ -3,12 +3,13 @@ from django.utils import timezone
 from .models import Task, TaskTag
 from accounts.serializers import UserSerializer
 from projects.serializers import ProjectListSerializer
-from tags.serializers import TagSerializer
-from tags.models import Tag
+from tags.serializers import TagSerializer, TagPrimaryKeyRelatedField
 from django.contrib.auth.models import User
+from sharetech.fastpath import FastListSerializer
+from sharetech.fieldsets import SparseFieldsetSerializerMixin
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer unique pour toutes les opérations sur les tâches
     """
@@ -18,9 +19,8 @@ class TaskSerializer(serializers.ModelSerializer):
     project_name = serializers.CharField(source='project.name', read_only=True)
     
     # Tags (lecture et écriture)
-    tags = serializers.PrimaryKeyRelatedField(
+    tags = TagPrimaryKeyRelatedField(
         many=True,
-        queryset=Tag.objects.all(),
         required=False
     )
     
@@ -33,9 +33,17 @@ class TaskSerializer(serializers.ModelSerializer):
             'assigned_to', 'assigned_to_username',
             'created_by', 'author_username',
             'tags',
-            'created_at', 'updated_at'
+            'version', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_by', 'completed_date', 'created_at', 'updated_at']
+        # ?expand= (voir sharetech/fieldsets.py)
+        expandable_fields = {
+            'project': ('projects.serializers.ProjectListSerializer', ['project__created_by']),
+            'assigned_to': ('accounts.serializers.UserSerializer', ['assigned_to__profile']),
+            'created_by': ('accounts.serializers.UserSerializer', ['created_by__profile']),
+        }
+        # Listes (many=True) sérialisées par values_list (voir sharetech/fastpath.py)
+        list_serializer_class = FastListSerializer
     
     def create(self, validated_data):
         """Création d'une tâche avec ses tags"""
@@ -82,4 +90,44 @@ class AssignTaskSerializer(serializers.Serializer):
         """Vérifier que l'utilisateur existe"""
         if not User.objects.filter(id=value).exists():
             raise serializers.ValidationError("Utilisateur introuvable.")
-        return value
\ No newline at end of file
+        return value
+
+class BulkTaskOperationSerializer(serializers.Serializer):
+    """
+    Une opération de POST /api/tasks/bulk/
+
+        {"id": 4, "action": "assign", "user_id": 2}
+        {"id": 5, "action": "unassign"}
+        {"id": 6, "action": "change_status", "status": "terminee"}
+        {"id": 7, "action": "set_priority", "priority": "haute"}
+    """
+    ACTIONS = ['assign', 'unassign', 'change_status', 'set_priority']
+    
+    # Paramètre obligatoire de chaque action
+    REQUIRED = {'assign': 'user_id', 'change_status': 'status', 'set_priority': 'priority'}
+    
+    id = serializers.IntegerField()
+    action = serializers.ChoiceField(choices=ACTIONS)
+    user_id = serializers.IntegerField(required=False)
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    priority = serializers.ChoiceField(choices=Task.PRIORITY_CHOICES, required=False)
+    
+    def validate(self, attrs):
+        field = self.REQUIRED.get(attrs['action'])
+        if field and field not in attrs:
+            raise serializers.ValidationError({field: f"Requis pour l'action {attrs['action']}."})
+        return attrs
+
+
+class BulkTaskSerializer(serializers.Serializer):
+    """
+    Corps de POST /api/tasks/bulk/ : {"operations": [...]}
+    Les opérations sont validées une par une (voir BulkTaskOperationSerializer)
+    """
+    MAX_OPERATIONS = 500
+    
+    operations = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_OPERATIONS
+    )
@@ -0,0 +1,177 @@
+# backend/tasks/tests/test_bulk.py
+"""
+Tests de POST /api/tasks/bulk/ (tasks/bulk.py)
+"""
+
+import pytest
+from django.utils import timezone
+
+from projects.models import Project
+from tasks.models import Task, TaskDailyRollup
+
+
+URL = '/api/tasks/bulk/'
+
+
+@pytest.fixture
+def tasks(sample_project, lead_user):
+    """Trois tâches ouvertes du projet"""
+    return [
+        Task.objects.create(title=f'T{i}', project=sample_project, created_by=lead_user)
+        for i in range(3)
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_applies_operations(authenticated_lead_client, tasks, senior_user):
+    """
+    Test : Assignation, priorité et clôture appliquées en un lot
+    """
+    # ARRANGE
+    Task.objects.filter(pk=tasks[2].pk).update(status='assignee', assigned_to=senior_user)
+    operations = [
+        {'id': tasks[0].id, 'action': 'assign', 'user_id': senior_user.id},
+        {'id': tasks[1].id, 'action': 'set_priority', 'priority': 'urgente'},
+        {'id': tasks[2].id, 'action': 'change_status', 'status': 'terminee'},
+    ]
+
+    # ACT
+    response = authenticated_lead_client.post(URL, {'operations': operations}, format='json')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.data['updated'] == 3
+    assert [result['ok'] for result in response.data['results']] == [True] * 3
+    first, second, third = (Task.objects.get(pk=task.pk) for task in tasks)
+    assert (first.assigned_to, first.status) == (senior_user, 'assignee')
+    assert second.priority == 'urgente'
+    assert (third.status, third.completed_date) == ('terminee', timezone.localdate())
+
+
+@pytest.mark.django_db
+def test_bulk_query_count_does_not_grow_with_batch(
+    authenticated_lead_client, sample_project, lead_user, django_assert_max_num_queries
+):
+    """
+    Test : Même nombre de requêtes SQL pour 2 ou 20 tâches
+    (un chargement, un bulk_update, compteurs et agrégats par projet / jour)
+    """
+    # ARRANGE
+    tasks = [Task.objects.create(title=f'T{i}', project=sample_project, created_by=lead_user) for i in range(20)]
+
+    def set_priority(batch, priority):
+        operations = [{'id': task.id, 'action': 'set_priority', 'priority': priority} for task in batch]
+        return authenticated_lead_client.post(URL, {'operations': operations}, format='json')
+
+    # ACT & ASSERT
+    with django_assert_max_num_queries(15) as small:
+        set_priority(tasks[:2], 'haute')
+    with django_assert_max_num_queries(15) as large:
+        response = set_priority(tasks, 'basse')
+    assert len(small.captured_queries) == len(large.captured_queries)
+    assert response.data['updated'] == 20
+
+
+@pytest.mark.django_db
+def test_bulk_reports_refused_operations(authenticated_junior_client, tasks, junior_user, senior_user):
+    """
+    Test : Un Junior ne peut pas assigner ; les autres opérations passent
+    """
+    # ARRANGE
+    Task.objects.filter(pk=tasks[1].pk).update(status='assignee', assigned_to=junior_user)
+    Task.objects.filter(pk=tasks[2].pk).update(status='assignee', assigned_to=senior_user)
+    operations = [
+        {'id': tasks[0].id, 'action': 'assign', 'user_id': junior_user.id},
+        {'id': tasks[1].id, 'action': 'change_status', 'status': 'terminee'},
+        {'id': tasks[2].id, 'action': 'set_priority', 'priority': 'haute'},
+        {'id': 999999, 'action': 'unassign'},
+        {'id': tasks[0].id, 'action': 'fly'},
+    ]
+
+    # ACT
+    response = authenticated_junior_client.post(URL, {'operations': operations}, format='json')
+
+    # ASSERT
+    results = response.data['results']
+    assert response.data['updated'] == 1
+    assert [result['ok'] for result in results] == [False, True, False, False, False]
+    assert 'Lead+' in results[0]['error']
+    assert results[2]['error'] == 'Tâche introuvable.'  # Tâche d'un autre
+    assert 'action' in results[4]['error']
+    assert Task.objects.get(pk=tasks[0].pk).assigned_to is None
+
+
+@pytest.mark.django_db
+def test_bulk_rejects_duplicate_ids(authenticated_lead_client, tasks):
+    """
+    Test : Une tâche présente deux fois dans le lot → les deux refusées
+    """
+    # ACT
+    response = authenticated_lead_client.post(URL, {'operations': [
+        {'id': tasks[0].id, 'action': 'set_priority', 'priority': 'haute'},
+        {'id': tasks[0].id, 'action': 'set_priority', 'priority': 'basse'},
+    ]}, format='json')
+
+    # ASSERT
+    assert response.data['updated'] == 0
+    assert Task.objects.get(pk=tasks[0].pk).priority == 'normale'
+
+
+@pytest.mark.django_db
+def test_bulk_updates_counters_and_rollups(authenticated_lead_client, tasks, sample_project, lead_user):
+    """
+    Test : bulk_update sans signaux → compteurs et agrégats mis à jour quand même
+    """
+    # ARRANGE
+    Task.objects.filter(pk__in=[task.pk for task in tasks[:2]]).update(status='assignee', assigned_to=lead_user)
+
+    # ACT
+    authenticated_lead_client.post(URL, {'operations': [
+        {'id': task.id, 'action': 'change_status', 'status': 'terminee'} for task in tasks[:2]
+    ]}, format='json')
+
+    # ASSERT
+    project = Project.objects.get(pk=sample_project.pk)
+    assert (project.open_task_count, project.done_task_count) == (1, 2)
+    rollup = TaskDailyRollup.objects.get(project=sample_project, day=timezone.localdate())
+    assert (rollup.created_count, rollup.done_count) == (3, 2)
+
+
+@pytest.mark.django_db
+def test_bulk_reopening_clears_completed_date(authenticated_lead_client, tasks, senior_user):
+    """
+    Test : terminee → assignee dans un lot efface la date de complétion ;
+    ouverte → terminee est refusée (tâche jamais assignée)
+    """
+    # ARRANGE
+    Task.objects.filter(pk=tasks[0].pk).update(
+        status='terminee', assigned_to=senior_user, completed_date=timezone.localdate()
+    )
+
+    # ACT
+    response = authenticated_lead_client.post(URL, {'operations': [
+        {'id': tasks[0].id, 'action': 'change_status', 'status': 'assignee'},
+        {'id': tasks[1].id, 'action': 'change_status', 'status': 'terminee'},
+    ]}, format='json')
+
+    # ASSERT
+    assert [result['ok'] for result in response.data['results']] == [True, False]
+    reopened = Task.objects.get(pk=tasks[0].pk)
+    assert (reopened.status, reopened.completed_date) == ('assignee', None)
+    assert Task.objects.get(pk=tasks[1].pk).status == 'ouverte'
+
+
+@pytest.mark.django_db
+def test_bulk_rejects_empty_or_oversized_batch(authenticated_lead_client):
+    """
+    Test : Lot vide ou trop grand → 400
+    """
+    # ACT
+    empty = authenticated_lead_client.post(URL, {'operations': []}, format='json')
+    oversized = authenticated_lead_client.post(
+        URL, {'operations': [{'id': i, 'action': 'unassign'} for i in range(501)]}, format='json'
+    )
+
+    # ASSERT
+    assert empty.status_code == 400
+    assert oversized.status_code == 400
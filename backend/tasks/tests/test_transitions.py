@@ -0,0 +1,176 @@
+# backend/tasks/tests/test_transitions.py
+"""
+Tests des transitions de statut (tasks/transitions.py)
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from projects.models import Project
+from sharetech.concurrency import VersionConflict
+from tasks import transitions
+from tasks.models import Task
+from tasks.transitions import InvalidTransition, transition
+
+
+@pytest.mark.django_db
+def test_change_status_is_one_guarded_update_of_changed_columns(authenticated_lead_client, assigned_task):
+    """
+    Test : Passage à "terminee" → un UPDATE conditionnel des seules colonnes modifiées, sans relecture
+    """
+    # ACT
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_lead_client.post(
+            f'/api/tasks/{assigned_task.id}/change_status/', {'status': 'terminee'}, format='json'
+        )
+
+    # ASSERT
+    assert response.status_code == 200
+    task = response.data['task']
+    assert (task['status'], task['version']) == ('terminee', 2)
+    assert task['completed_date'] == timezone.localdate().isoformat()
+
+    sql = [q['sql'] for q in queries.captured_queries]
+    updates = [i for i, query in enumerate(sql) if query.startswith('UPDATE "task"')]
+    assert len(updates) == 1
+    update = sql[updates[0]]
+    assert '"status" IN' in update and '"version" = 1' in update
+    assert '"title"' not in update.split(' WHERE ')[0]
+    # Pas de relecture de la tâche après l'UPDATE
+    assert not any(f'"task"."id" = {assigned_task.id}' in query for query in sql[updates[0] + 1:])
+
+    project = Project.objects.get(pk=assigned_task.project_id)
+    assert (project.open_task_count, project.done_task_count) == (0, 1)
+
+
+@pytest.mark.django_db
+def test_assign_and_unassign(authenticated_lead_client, sample_task, senior_user):
+    """
+    Test : assign puis unassign → statut et assignation mis à jour
+    """
+    # ACT
+    assigned = authenticated_lead_client.post(
+        f'/api/tasks/{sample_task.id}/assign/', {'user_id': senior_user.id}, format='json'
+    )
+    unassigned = authenticated_lead_client.post(f'/api/tasks/{sample_task.id}/unassign/')
+
+    # ASSERT
+    assert (assigned.data['task']['status'], assigned.data['task']['assigned_to']) == ('assignee', senior_user.id)
+    assert (unassigned.data['task']['status'], unassigned.data['task']['assigned_to']) == ('ouverte', None)
+    sample_task.refresh_from_db()
+    assert (sample_task.status, sample_task.assigned_to, sample_task.version) == ('ouverte', None, 3)
+
+
+@pytest.mark.django_db
+def test_undeclared_transition_is_refused(authenticated_lead_client, sample_task, senior_user):
+    """
+    Test : Transition absente de STATUS_TRANSITIONS → 400, rien n'est écrit
+    """
+    # ARRANGE : tâche "ouverte" mais assignée (ouverte → ouverte non déclarée)
+    Task.objects.filter(pk=sample_task.pk).update(assigned_to=senior_user)
+
+    # ACT
+    response = authenticated_lead_client.post(f'/api/tasks/{sample_task.id}/unassign/')
+
+    # ASSERT
+    assert response.status_code == 400
+    assert Task.objects.get(pk=sample_task.pk).assigned_to == senior_user
+
+
+@pytest.mark.django_db
+def test_same_status_is_a_no_op(authenticated_lead_client, assigned_task):
+    """
+    Test : Double clic sur "terminee" → 200, rien n'est réécrit (version inchangée)
+    """
+    # ARRANGE
+    url = f'/api/tasks/{assigned_task.id}/change_status/'
+    authenticated_lead_client.post(url, {'status': 'terminee'}, format='json')
+
+    # ACT
+    response = authenticated_lead_client.post(url, {'status': 'terminee'}, format='json')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert response.data['task']['version'] == 2
+
+
+@pytest.mark.django_db
+def test_concurrent_transition_on_stale_row_conflicts(assigned_task, junior_user, senior_user):
+    """
+    Test : Deux transitions depuis la même lecture → la seconde lève VersionConflict
+    """
+    # ARRANGE
+    first = Task.objects.get(pk=assigned_task.pk)
+    second = Task.objects.get(pk=assigned_task.pk)
+    transition(first, 'terminee')
+
+    # ACT & ASSERT
+    with pytest.raises(VersionConflict):
+        transition(second, 'assignee', assigned_to=junior_user)
+    assigned_task.refresh_from_db()
+    assert (assigned_task.status, assigned_task.assigned_to) == ('terminee', senior_user)
+
+
+@pytest.mark.django_db
+def test_transition_checks_state_machine(sample_task, assigned_task):
+    """
+    Test : Seules les transitions déclarées passent : une tâche est assignée
+    avant d'être terminée, et 'assignee' exige un assigné
+    """
+    # ARRANGE
+    transition(assigned_task, 'terminee')
+
+    # ACT & ASSERT
+    with pytest.raises(InvalidTransition):
+        transition(assigned_task, 'terminee')
+    with pytest.raises(InvalidTransition):
+        transition(assigned_task, 'ouverte')
+    with pytest.raises(InvalidTransition):
+        transition(sample_task, 'terminee')
+    with pytest.raises(InvalidTransition):
+        transition(sample_task, 'assignee')  # change_status sans assigné
+    assert Task.transition_sources('terminee') == ['assignee']
+    assert Task.objects.get(pk=sample_task.pk).status == 'ouverte'
+
+
+@pytest.mark.django_db
+def test_reopening_clears_completed_date(authenticated_lead_client, assigned_task):
+    """
+    Test : terminee → assignee (réouverture) efface la date de complétion
+    """
+    # ARRANGE
+    url = f'/api/tasks/{assigned_task.id}/change_status/'
+    authenticated_lead_client.post(url, {'status': 'terminee'}, format='json')
+
+    # ACT
+    response = authenticated_lead_client.post(url, {'status': 'assignee'}, format='json')
+
+    # ASSERT
+    assert response.status_code == 200
+    assert (response.data['task']['status'], response.data['task']['completed_date']) == ('assignee', None)
+    stored = Task.objects.get(pk=assigned_task.pk)
+    assert (stored.status, stored.completed_date) == ('assignee', None)
+    project = Project.objects.get(pk=assigned_task.project_id)
+    assert (project.open_task_count, project.done_task_count) == (1, 0)
+
+
+@pytest.mark.django_db
+def test_failed_side_effect_rolls_back_the_transition(assigned_task, monkeypatch):
+    """
+    Test : Échec de la mise à jour des compteurs → statut inchangé en base
+    """
+    # ARRANGE
+    def broken_side_effects(tasks):
+        raise RuntimeError("compteurs indisponibles")
+
+    monkeypatch.setattr(transitions, 'apply_side_effects', broken_side_effects)
+
+    # ACT
+    with pytest.raises(RuntimeError):
+        transition(assigned_task, 'terminee')
+
+    # ASSERT
+    stored = Task.objects.get(pk=assigned_task.pk)
+    assert (stored.status, stored.completed_date, stored.version) == ('assignee', None, 1)
@@ -0,0 +1,68 @@
+# backend/tasks/transitions.py
+"""
+Transitions de statut des tâches (actions assign, unassign, change_status)
+
+Les statuts atteignables sont déclarés dans Task.STATUS_TRANSITIONS.
+Une transition est un seul UPDATE conditionnel, limité aux colonnes modifiées :
+
+    UPDATE task SET status = 'terminee', completed_date = ..., updated_at = ..., version = 4
+    WHERE id = 12 AND version = 3 AND status IN ('ouverte', 'assignee')
+
+- la condition sur le statut garantit que la transition part d'un statut autorisé
+- la condition sur la version garantit que la ligne est celle lue (permissions
+  vérifiées dessus, voir sharetech/concurrency.py) : 0 ligne → VersionConflict
+
+La ligne écrite est donc l'instance lue plus les valeurs de l'UPDATE :
+la réponse est construite sans relire la tâche.
+
+UPDATE n'envoie pas de signaux : compteurs, agrégats et version de cache sont
+mis à jour comme pour les opérations groupées (apply_side_effects), dans la
+même transaction que l'UPDATE.
+"""
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from sharetech.concurrency import VersionConflict
+
+from .bulk import apply_side_effects
+from .models import Task
+
+
+class InvalidTransition(Exception):
+    """Statut cible non atteignable depuis le statut actuel"""
+
+
+def transition(task, target, **changes):
+    """
+    Passe task au statut target (et applique changes, ex. assigned_to=user)
+    Modifie et retourne l'instance
+    """
+    assigned_to = changes.get('assigned_to')
+    if not task.can_transition(target, assigned_to.pk if assigned_to else None):
+        raise InvalidTransition(f"Transition impossible : {task.status} → {target}.")
+
+    changes['status'] = target
+    if target == 'terminee':
+        # 'terminee' n'est jamais un statut de départ vers 'terminee'
+        changes['completed_date'] = timezone.localdate()
+    elif task.status == 'terminee':
+        # Réouverture : la tâche n'est plus terminée
+        changes['completed_date'] = None
+    now = timezone.now()
+
+    with transaction.atomic():
+        updated = Task.objects.filter(
+            pk=task.pk, version=task.version, status__in=Task.transition_sources(target)
+        ).update(**changes, updated_at=now, version=F('version') + 1)
+        if not updated:
+            raise VersionConflict(f"tasks.Task {task.pk} : modifiée depuis sa lecture")
+
+        for field, value in changes.items():
+            setattr(task, field, value)
+        # Échec d'un effet de bord → UPDATE annulé : statut et compteurs restent cohérents
+        apply_side_effects([task])
+    task.updated_at = now
+    task.version += 1
+    return task
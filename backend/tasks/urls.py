@@ -1,5 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+
+from . import async_views
 from .views import TaskViewSet
 
 router = DefaultRouter()
@@ -7,4 +9,6 @@ router.register(r'tasks', TaskViewSet, basename='task')
 
 urlpatterns = [
     path('', include(router.urls)),
+    # Version async (ASGI) d'une lecture lourde
+    path('async/tasks/my_tasks/', async_views.my_tasks, name='my-tasks-async'),
 ]
\ No newline at end of file
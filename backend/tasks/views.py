@@ -5,15 +5,34 @@ from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
 from django.contrib.auth.models import User
 
+from .bulk import apply_bulk_operations
 from .models import Task, TaskTag
-from .serializers import TaskSerializer, AssignTaskSerializer
+from .serializers import TaskSerializer, AssignTaskSerializer, BulkTaskSerializer
+from .transitions import InvalidTransition, transition
+from sharetech.concurrency import OptimisticConcurrencyMixin
+from sharetech.conditional import ConditionalGetMixin
+from sharetech.fieldsets import SparseFieldsetMixin
 
 
-class TaskViewSet(viewsets.ModelViewSet):
-    """ViewSet pour gérer les tâches"""
+class TaskViewSet(OptimisticConcurrencyMixin, SparseFieldsetMixin, ConditionalGetMixin, viewsets.ModelViewSet):
+    """
+    ViewSet pour gérer les tâches
+    Liste et détail supportent If-None-Match / If-Modified-Since (304)
+    Lectures : ?fields= et ?expand=assigned_to (voir sharetech/fieldsets.py)
+    Modification : If-Match: "<version>" ou If-Unmodified-Since, sinon 412 (voir sharetech/concurrency.py)
+    assign / unassign / change_status : UPDATE conditionnel (voir tasks/transitions.py)
+    """
     permission_classes = [IsAuthenticated]
     serializer_class = TaskSerializer  # ✅ Un seul serializer pour tout le CRUD
     
+    # Throttling : un lot remplace de nombreux appels unitaires
+    throttle_costs = {'bulk': 5}
+    
+    fieldset_actions = ('list', 'retrieve', 'my_tasks', 'by_project')
+    
+    # ETag du détail : nom du projet (hors version de la tâche)
+    etag_dependencies = ('projects.project',)
+    
     def get_queryset(self):
         """
         Retourne les tâches accessibles selon le rôle :
@@ -86,9 +105,10 @@ class TaskViewSet(viewsets.ModelViewSet):
             user_id = serializer.validated_data['user_id']
             user = User.objects.get(id=user_id)
             
-            task.assigned_to = user
-            task.status = 'assignee'
-            task.save()
+            try:
+                transition(task, 'assignee', assigned_to=user)
+            except InvalidTransition as exc:
+                return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
             
             return Response({
                 'message': f'Tâche assignée à {user.username}',
@@ -114,9 +134,10 @@ class TaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        task.assigned_to = None
-        task.status = 'ouverte'
-        task.save()
+        try:
+            transition(task, 'ouverte', assigned_to=None)
+        except InvalidTransition as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'message': 'Assignation retirée',
@@ -144,19 +165,41 @@ class TaskViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        # Si on passe à "terminee", ajouter la date de complétion
-        if new_status == 'terminee' and task.status != 'terminee':
-            from django.utils import timezone
-            task.completed_date = timezone.now().date()
-        
-        task.status = new_status
-        task.save()
+        # Statut déjà atteint (double clic...) : rien à écrire
+        if new_status != task.status:
+            try:
+                transition(task, new_status)  # "terminee" : date de complétion ajoutée
+            except InvalidTransition as exc:
+                return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'message': f'Statut changé en "{new_status}"',
             'task': TaskSerializer(task).data
         }, status=status.HTTP_200_OK)
     
+    @action(detail=False, methods=['post'], serializer_class=BulkTaskSerializer)
+    def bulk(self, request):
+        """
+        Applique un lot d'opérations en une transaction (voir tasks/bulk.py)
+        
+        POST /api/tasks/bulk/
+        Body: {"operations": [
+            {"id": 4, "action": "assign", "user_id": 2},
+            {"id": 6, "action": "change_status", "status": "terminee"}
+        ]}
+        
+        Les opérations refusées (permission, tâche introuvable...) n'empêchent
+        pas les autres : le résultat indique le sort de chacune
+        """
+        serializer = BulkTaskSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        results = apply_bulk_operations(serializer.validated_data['operations'], request.user)
+        return Response({
+            'updated': sum(result['ok'] for result in results),
+            'results': results,
+        }, status=status.HTTP_200_OK)
+    
     @action(detail=False, methods=['get'])
     def my_tasks(self, request):
         """Récupérer uniquement les tâches assignées à l'utilisateur connecté"""
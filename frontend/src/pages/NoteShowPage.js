@@ -74,15 +74,14 @@ const NoteShowPage = () => {
       
       setProject(projectData);
       
-      // 2. Charger TOUTES les notes du projet
+      // 2. Charger TOUTES les notes du projet (extraits, sans le contenu)
       const allNotes = await noteService.getByProject(projectData.id);
       
-      // 3. Trouver LA note qu'on veut
-      const currentNote = allNotes.find(n => n.id === parseInt(id));
-      
-      if (!currentNote) {
+      // 3. Charger LA note qu'on veut, avec son contenu complet
+      if (!allNotes.some(n => n.id === parseInt(id))) {
         throw new Error("Note non trouvée");
       }
+      const currentNote = await noteService.getById(id);
       
       setNote(currentNote);
       
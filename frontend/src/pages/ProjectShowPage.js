@@ -1,13 +1,15 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import { useParams, Link } from "react-router-dom";
 import Navbar from "../components/layout/Navbar";
 import projectService from "../services/projectService";
 import noteService from "../services/noteService";
 import taskService from "../services/taskService";
-import commentService from "../services/commentService";
 import CommentSection from "../components/comments/CommentSection";
 import "../styles/pages/project-show.css";
 
+// Taille max d'une page de notes de l'overview (max_page_size côté API)
+const NOTES_PAGE_SIZE = 100;
+
 const ProjectShowPage = () => {
   const { id } = useParams();
   const [project, setProject] = useState(null);
@@ -15,6 +17,10 @@ const ProjectShowPage = () => {
   const [tasks, setTasks] = useState([]);
   const [members, setMembers] = useState([]);
   const [expandedNoteId, setExpandedNoteId] = useState(null);
+  // La liste ne renvoie qu'un extrait : contenu complet chargé à l'ouverture
+  const [expandedContent, setExpandedContent] = useState(null);
+  // Note ouverte au moment où la réponse arrive (l'état du closure peut être périmé)
+  const expandedNoteRef = useRef(null);
   const [editingNoteId, setEditingNoteId] = useState(null);
   const [showCreateForm, setShowCreateForm] = useState(false);
   const [loading, setLoading] = useState(true);
@@ -70,44 +76,34 @@ const ProjectShowPage = () => {
     try {
       setError(null);
 
-      const projectData = await projectService.getById(id);
-      setProject(projectData);
-
-      try {
-        const notesData = await noteService.getByProject(id);
-
-        const notesWithComments = await Promise.all(
-          notesData.map(async (note) => {
-            try {
-              const comments = await commentService.getCommentsByNote(note.id);
-              return { ...note, commentsCount: comments.length };
-            } catch {
-              return { ...note, commentsCount: 0 };
-            }
-          })
-        );
-
-        setNotes(notesWithComments);
-      } catch (e) {
-        console.warn("Impossible de charger les notes");
-        setNotes([]);
+      // Une requête au lieu de projet + notes + tâches + membres + commentaires par note
+      const overview = await projectService.getOverview(id, {
+        fields: "project,members,notes,task_list",
+        page_size: NOTES_PAGE_SIZE,
+      });
+
+      // Plus d'une page de notes : pages suivantes (section notes seule)
+      const allNotes = [...overview.notes.results];
+      let notesPage = overview.notes;
+      for (let page = 2; notesPage.next; page += 1) {
+        const next = await projectService.getOverview(id, {
+          fields: "notes",
+          page,
+          page_size: NOTES_PAGE_SIZE,
+        });
+        notesPage = next.notes;
+        allNotes.push(...notesPage.results);
       }
 
-      try {
-        const tasksData = await taskService.getByProject(id);
-        setTasks(tasksData);
-      } catch (e) {
-        console.warn("Impossible de charger les tâches");
-        setTasks([]);
-      }
-
-      try {
-        const membersData = await projectService.getMembers(id);
-        setMembers(membersData);
-      } catch (e) {
-        console.warn("Impossible de charger les membres");
-        setMembers([]);
-      }
+      setProject(overview.project);
+      setMembers(overview.members);
+      setTasks(overview.task_list);
+      setNotes(
+        allNotes.map((note) => ({
+          ...note,
+          commentsCount: note.comment_count,
+        }))
+      );
     } catch (error) {
       console.error("Erreur:", error);
       setError("Projet introuvable");
@@ -116,9 +112,23 @@ const ProjectShowPage = () => {
     }
   };
 
-  const toggleNote = (noteId) => {
-    setExpandedNoteId(expandedNoteId === noteId ? null : noteId);
+  const toggleNote = async (noteId) => {
+    const opening = expandedNoteId !== noteId;
+    expandedNoteRef.current = opening ? noteId : null;
+    setExpandedNoteId(opening ? noteId : null);
+    setExpandedContent(null);
     setEditingNoteId(null); // Ferme le mode édition si ouvert
+    if (opening) {
+      try {
+        const fullNote = await noteService.getById(noteId);
+        // Réponse tardive d'une note refermée ou remplacée : ignorée
+        if (expandedNoteRef.current === fullNote.id) {
+          setExpandedContent(fullNote.content);
+        }
+      } catch (error) {
+        console.error("Erreur chargement note:", error);
+      }
+    }
   };
 
   // Vérifier si l'utilisateur peut modifier/supprimer une note
@@ -158,9 +168,15 @@ const ProjectShowPage = () => {
   };
 
   // MODIFICATION
-  const startEditNote = (note) => {
-    setEditingNoteId(note.id);
-    setEditFormData({ title: note.title, content: note.content });
+  const startEditNote = async (note) => {
+    try {
+      const fullNote = await noteService.getById(note.id);
+      setEditingNoteId(note.id);
+      setEditFormData({ title: fullNote.title, content: fullNote.content });
+    } catch (error) {
+      console.error("Erreur chargement note:", error);
+      alert("Erreur lors du chargement de la note");
+    }
   };
 
   const handleUpdateNote = async (noteId) => {
@@ -420,7 +436,9 @@ const handleCreateTask = async (e) => {
                                 </div>
                               )}
                             </div>
-                            <div className="note-content">{note.content}</div>
+                            <div className="note-content">
+                              {expandedContent ?? note.excerpt}
+                            </div>
                             <CommentSection noteId={note.id} />
                           </div>
                         )}
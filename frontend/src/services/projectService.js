@@ -14,6 +14,13 @@ const projectService = {
   getMembers: async (id) => {
     const response = await api.get(`/api/projects/${id}/members/`);
     return response.data;
+  },
+
+  // Projet, membres, notes (avec leur nombre de commentaires) et tâches en une requête
+  // params : fields (sections), page / page_size (notes)
+  getOverview: async (id, params = {}) => {
+    const response = await api.get(`/api/projects/${id}/overview/`, { params });
+    return response.data;
   }
 };
 